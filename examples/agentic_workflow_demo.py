@@ -15,7 +15,8 @@ import time
 from pathlib import Path
 
 from graph_analytics_ai.db_connection import get_db_connection
-from graph_analytics_ai.ai.llm import create_llm_provider
+from graph_analytics_ai.ai.llm import create_llm_provider, CachingLLMProvider
+from graph_analytics_ai.ai.llm.cache import DEFAULT_CACHE_DIR
 
 # Linear workflow components
 from graph_analytics_ai.ai.schema.extractor import SchemaExtractor
@@ -26,7 +27,7 @@ from graph_analytics_ai.ai.execution import AnalysisExecutor
 from graph_analytics_ai.ai.reporting import ReportGenerator
 
 # Agentic workflow
-from graph_analytics_ai.ai.agents import AgenticWorkflowRunner
+from graph_analytics_ai.ai.agents import AgenticWorkflowRunner, AgentNames
 
 # Requirements
 from graph_analytics_ai.ai.documents.models import (
@@ -67,7 +68,7 @@ def create_sample_requirements():
     )
 
 
-def run_linear_workflow():
+def run_linear_workflow(db=None, provider=None):
     """Run traditional linear workflow."""
     print("=" * 70)
     print("📊 LINEAR WORKFLOW (Traditional)")
@@ -76,8 +77,8 @@ def run_linear_workflow():
     
     start_time = time.time()
     
-    db = get_db_connection()
-    provider = create_llm_provider()
+    db = db or get_db_connection()
+    provider = provider or create_llm_provider()
     
     print("Step 1: Extract schema...")
     extractor = SchemaExtractor(db)
@@ -85,7 +86,10 @@ def run_linear_workflow():
     print(f"✓ {len(schema.vertex_collections)}V + {len(schema.edge_collections)}E")
     
     print("\nStep 2: Analyze schema...")
-    analyzer = SchemaAnalyzer(provider)
+    # Share cached LLM responses with the agentic run's SchemaAnalyst
+    analyzer = SchemaAnalyzer(
+        CachingLLMProvider(provider, namespace=AgentNames.SCHEMA_ANALYST)
+    )
     try:
         analysis = analyzer.analyze(schema)
     except:
@@ -148,7 +152,7 @@ def run_linear_workflow():
     }
 
 
-def run_agentic_workflow():
+def run_agentic_workflow(db=None, provider=None):
     """Run new agentic workflow."""
     print("=" * 70)
     print("🤖 AGENTIC WORKFLOW (Autonomous Agents)")
@@ -157,7 +161,12 @@ def run_agentic_workflow():
     
     start_time = time.time()
     
-    runner = AgenticWorkflowRunner(graph_name="ecommerce_graph")
+    runner = AgenticWorkflowRunner(
+        db_connection=db,
+        llm_provider=provider,
+        graph_name="ecommerce_graph",
+        llm_cache_dir=str(DEFAULT_CACHE_DIR),
+    )
     state = runner.run()
     
     elapsed = time.time() - start_time
@@ -188,7 +197,8 @@ def run_agentic_workflow():
         "executions": len(state.execution_results),
         "reports": len(state.reports),
         "messages": len(state.messages),
-        "state": state
+        "state": state,
+        "runner": runner
     }
 
 
@@ -200,10 +210,14 @@ def compare_workflows():
     print("╚" + "=" * 68 + "╝")
     print()
     
+    # Connect once and share the connection and LLM provider across both runs
+    db = get_db_connection()
+    provider = create_llm_provider()
+    
     # Run linear
     print("Running LINEAR workflow...")
     print()
-    linear_results = run_linear_workflow()
+    linear_results = run_linear_workflow(db=db, provider=provider)
     
     print()
     print("-" * 70)
@@ -212,7 +226,7 @@ def compare_workflows():
     # Run agentic
     print("Running AGENTIC workflow...")
     print()
-    agentic_results = run_agentic_workflow()
+    agentic_results = run_agentic_workflow(db=db, provider=provider)
     
     # Comparison
     print("=" * 70)
@@ -292,7 +306,7 @@ def compare_workflows():
         output_dir = Path("./workflow_output")
         output_dir.mkdir(exist_ok=True)
         
-        runner = AgenticWorkflowRunner()
+        runner = agentic_results["runner"]
         runner.export_state(agentic_results["state"], "workflow_output/agentic_state.json")
     
     print("=" * 70)
@@ -11,25 +11,66 @@ Demonstrates autonomous multi-agent system that:
 This is the COMPLETE system - all 10 phases working together!
 """
 
+import asyncio
+from pathlib import Path
+
 from graph_analytics_ai.db_connection import get_db_connection
 from graph_analytics_ai.ai.agents import AgenticWorkflow
 from graph_analytics_ai.ai.reporting import ReportFormat
 
+from example_utils import print_lines
+
+
+def _print_section(header, items, fmt, limit=5, spaced=False, more="more"):
+    """
+    Print a titled section listing the first ``limit`` items.
+
+    ``fmt(i, item)`` renders the i-th item (1-based); ``spaced`` puts a blank
+    line after every item instead of one after the section.
+    """
+    lines = [header, "-" * 70]
+    for i, item in enumerate(items[:limit], 1):
+        lines.append(fmt(i, item))
+        if spaced:
+            lines.append("")
+    if len(items) > limit:
+        lines.extend([f"... and {len(items) - limit} {more}", ""])
+    elif not spaced:
+        lines.append("")
+    print_lines(*lines)
+
+
+def _format_and_write(render, path):
+    """Render one export and write it to ``path``."""
+    path.write_text(render())
+    return path
+
+
+async def _export_all(exports):
+    """Run independent (label, render, path) exports concurrently."""
+    paths = await asyncio.gather(
+        *(asyncio.to_thread(_format_and_write, render, path) for _, render, path in exports)
+    )
+    for (label, _, _), path in zip(exports, paths):
+        print(f"✓ {label}: {path}")
+
 
 def agentic_workflow_demo():
     """Run complete agentic workflow demonstration."""
     
-    print("=" * 70)
-    print("🤖 AGENTIC WORKFLOW - AUTONOMOUS MULTI-AGENT SYSTEM")
-    print("=" * 70)
-    print()
-    print("This demonstrates the COMPLETE Phase 1-10 system:")
-    print("  • 9 specialized autonomous agents")
-    print("  • 1 orchestrator agent (supervisor)")
-    print("  • Autonomous decision-making")
-    print("  • Adaptive error handling")
-    print("  • Complete audit trail")
-    print()
+    print_lines(
+        "=" * 70,
+        "🤖 AGENTIC WORKFLOW - AUTONOMOUS MULTI-AGENT SYSTEM",
+        "=" * 70,
+        "",
+        "This demonstrates the COMPLETE Phase 1-10 system:",
+        "  • 9 specialized autonomous agents",
+        "  • 1 orchestrator agent (supervisor)",
+        "  • Autonomous decision-making",
+        "  • Adaptive error handling",
+        "  • Complete audit trail",
+        "",
+    )
     
     # ========================================================================
     # Initialize Agentic Workflow
@@ -40,33 +81,37 @@ def agentic_workflow_demo():
     db = get_db_connection()
     workflow = AgenticWorkflow(graph_name="ecommerce_graph")
     
-    print("✓ Orchestrator Agent initialized")
-    print("✓ 9 Specialized Agents ready:")
-    print("  1. Schema Analysis Agent")
-    print("  2. Requirements Analysis Agent")
-    print("  3. PRD Generation Agent")
-    print("  4. Use Case Generation Agent")
-    print("  5. Template Generation Agent")
-    print("  6. Execution Agent")
-    print("  7. Interpretation Agent")
-    print("  8. Reporting Agent")
-    print("  9. Quality Assurance Agent")
-    print()
+    print_lines(
+        "✓ Orchestrator Agent initialized",
+        "✓ 9 Specialized Agents ready:",
+        "  1. Schema Analysis Agent",
+        "  2. Requirements Analysis Agent",
+        "  3. PRD Generation Agent",
+        "  4. Use Case Generation Agent",
+        "  5. Template Generation Agent",
+        "  6. Execution Agent",
+        "  7. Interpretation Agent",
+        "  8. Reporting Agent",
+        "  9. Quality Assurance Agent",
+        "",
+    )
     
     # ========================================================================
     # Run Agentic Workflow
     # ========================================================================
-    print("🤖 Executing Agentic Workflow...")
-    print("-" * 70)
-    print("Agents will autonomously:")
-    print("  • Analyze your graph database")
-    print("  • Generate optimal use cases")
-    print("  • Create GAE templates")
-    print("  • Execute analyses")
-    print("  • Interpret results")
-    print("  • Generate intelligence reports")
-    print("  • Make decisions and adapt to issues")
-    print()
+    print_lines(
+        "🤖 Executing Agentic Workflow...",
+        "-" * 70,
+        "Agents will autonomously:",
+        "  • Analyze your graph database",
+        "  • Generate optimal use cases",
+        "  • Create GAE templates",
+        "  • Execute analyses",
+        "  • Interpret results",
+        "  • Generate intelligence reports",
+        "  • Make decisions and adapt to issues",
+        "",
+    )
     
     # Run workflow
     state = workflow.run(
@@ -78,6 +123,11 @@ def agentic_workflow_demo():
     print("✓ Agentic workflow complete!")
     print()
     
+    # Execution tallies used by both the results section and the final summary
+    n_exec = len(state.execution_results)
+    n_ok = sum(1 for r in state.execution_results if r.success)
+    ok_pct = (100 * n_ok / n_exec) if n_exec else 0.0
+    
     # ========================================================================
     # Show Progress and Metrics
     # ========================================================================
@@ -85,31 +135,36 @@ def agentic_workflow_demo():
     print("-" * 70)
     
     progress = workflow.get_progress(state)
-    print(f"Progress: {progress['completed_steps']}/{progress['total_steps']} steps ({progress['progress_percent']:.0f}%)")
-    print(f"Current Step: {progress['current_step']}")
-    print(f"Agent Decisions: {progress['decisions']}")
-    print(f"Errors: {progress['errors']}")
-    print(f"Inter-Agent Messages: {progress['messages']}")
-    print()
+    print_lines(
+        f"Progress: {progress['completed_steps']}/{progress['total_steps']} steps ({progress['progress_percent']:.0f}%)",
+        f"Current Step: {progress['current_step']}",
+        f"Agent Decisions: {progress['decisions']}",
+        f"Errors: {progress['errors']}",
+        f"Inter-Agent Messages: {progress['messages']}",
+        "",
+    )
     
     # ========================================================================
     # Show Agent Decisions (Explainability)
     # ========================================================================
-    print("🧠 Agent Decisions & Reasoning")
-    print("-" * 70)
-    
-    decisions = workflow.get_decisions(state)
-    for i, decision in enumerate(decisions[:10], 1):  # Show first 10
-        print(f"{i}. [{decision['agent']}]")
-        print(f"   Decision: {decision['decision']}")
-        print(f"   Reasoning: {decision['reasoning']}")
+    def _format_decision(i, decision):
+        text = (
+            f"{i}. [{decision['agent']}]\n"
+            f"   Decision: {decision['decision']}\n"
+            f"   Reasoning: {decision['reasoning']}"
+        )
         if decision.get('context'):
-            print(f"   Context: {list(decision['context'].keys())}")
-        print()
+            text += f"\n   Context: {list(decision['context'].keys())}"
+        return text
     
-    if len(decisions) > 10:
-        print(f"... and {len(decisions) - 10} more decisions")
-        print()
+    _print_section(
+        "🧠 Agent Decisions & Reasoning",
+        workflow.get_decisions(state),
+        _format_decision,
+        limit=10,
+        spaced=True,
+        more="more decisions",
+    )
     
     # ========================================================================
     # Show Results
@@ -117,46 +172,53 @@ def agentic_workflow_demo():
     print("📊 Results")
     print("-" * 70)
     
-    print(f"✓ Schema: {len(state.schema.vertex_collections)}V + {len(state.schema.edge_collections)}E")
-    print(f"✓ Requirements: {len(state.requirements.objectives)} objectives, {len(state.requirements.requirements)} requirements")
-    print(f"✓ Use Cases: {len(state.use_cases)} generated")
-    print(f"✓ Templates: {len(state.templates)} created")
-    print(f"✓ Executions: {len(state.execution_results)} completed")
-    
-    successful = sum(1 for r in state.execution_results if r.success)
-    print(f"✓ Success Rate: {successful}/{len(state.execution_results)} ({100*successful/len(state.execution_results) if state.execution_results else 0:.0f}%)")
+    print_lines(
+        f"✓ Schema: {len(state.schema.vertex_collections)}V + {len(state.schema.edge_collections)}E",
+        f"✓ Requirements: {len(state.requirements.objectives)} objectives, {len(state.requirements.requirements)} requirements",
+        f"✓ Use Cases: {len(state.use_cases)} generated",
+        f"✓ Templates: {len(state.templates)} created",
+        f"✓ Executions: {n_exec} completed",
+        f"✓ Success Rate: {n_ok}/{n_exec} ({ok_pct:.0f}%)",
+    )
     
+    # Counts are reused in the final summary
+    n_insights = len(state.report.insights) if state.report else 0
+    n_recommendations = len(state.report.recommendations) if state.report else 0
     if state.report:
-        print(f"✓ Report: {len(state.report.insights)} insights, {len(state.report.recommendations)} recommendations")
+        print(f"✓ Report: {n_insights} insights, {n_recommendations} recommendations")
     print()
     
     # ========================================================================
     # Show Insights
     # ========================================================================
     if state.report and state.report.insights:
-        print("💡 Key Insights (Agent-Generated)")
-        print("-" * 70)
-        
-        for i, insight in enumerate(state.report.insights[:5], 1):
-            print(f"{i}. {insight.title}")
-            print(f"   Type: {insight.insight_type.value}")
-            print(f"   Confidence: {insight.confidence*100:.0f}%")
-            print(f"   Description: {insight.description[:100]}...")
-            print()
+        _print_section(
+            "💡 Key Insights (Agent-Generated)",
+            state.report.insights,
+            lambda i, insight: (
+                f"{i}. {insight.title}\n"
+                f"   Type: {insight.insight_type.value}\n"
+                f"   Confidence: {insight.confidence*100:.0f}%\n"
+                f"   Description: {insight.description[:100]}..."
+            ),
+            spaced=True,
+        )
     
     # ========================================================================
     # Show Recommendations
     # ========================================================================
     if state.report and state.report.recommendations:
-        print("🎯 Recommendations (Agent-Generated)")
-        print("-" * 70)
-        
-        for i, rec in enumerate(state.report.recommendations[:5], 1):
-            print(f"{i}. {rec.title}")
-            print(f"   Type: {rec.recommendation_type.value}")
-            print(f"   Priority: {rec.priority}")
-            print(f"   Effort: {rec.effort}")
-            print()
+        _print_section(
+            "🎯 Recommendations (Agent-Generated)",
+            state.report.recommendations,
+            lambda i, rec: (
+                f"{i}. {rec.title}\n"
+                f"   Type: {rec.recommendation_type.value}\n"
+                f"   Priority: {rec.priority}\n"
+                f"   Effort: {rec.effort}"
+            ),
+            spaced=True,
+        )
     
     # ========================================================================
     # Export Report
@@ -165,7 +227,6 @@ def agentic_workflow_demo():
         print("💾 Exporting Report...")
         print("-" * 70)
         
-        from pathlib import Path
         from graph_analytics_ai.ai.reporting import ReportGenerator
         
         output_dir = Path("./workflow_output")
@@ -173,23 +234,25 @@ def agentic_workflow_demo():
         
         generator = ReportGenerator()
         
-        # Export as markdown
-        markdown = generator.format_report(state.report, ReportFormat.MARKDOWN)
-        md_path = output_dir / "agentic_report.md"
-        md_path.write_text(markdown)
-        print(f"✓ Markdown: {md_path}")
-        
-        # Export as JSON
-        json_report = generator.format_report(state.report, ReportFormat.JSON)
-        json_path = output_dir / "agentic_report.json"
-        json_path.write_text(json_report)
-        print(f"✓ JSON: {json_path}")
-        
-        # Export state
-        state_export = workflow.export_state(state, format="json")
-        state_path = output_dir / "agentic_state.json"
-        state_path.write_text(state_export)
-        print(f"✓ State: {state_path}")
+        # Markdown, JSON and state exports are independent; format and
+        # write them side by side
+        asyncio.run(_export_all([
+            (
+                "Markdown",
+                lambda: generator.format_report(state.report, ReportFormat.MARKDOWN),
+                output_dir / "agentic_report.md",
+            ),
+            (
+                "JSON",
+                lambda: generator.format_report(state.report, ReportFormat.JSON),
+                output_dir / "agentic_report.json",
+            ),
+            (
+                "State",
+                lambda: workflow.export_state(state, format="json"),
+                output_dir / "agentic_state.json",
+            ),
+        ]))
         print()
     
     # ========================================================================
@@ -197,58 +260,58 @@ def agentic_workflow_demo():
     # ========================================================================
     errors = workflow.get_errors(state)
     if errors:
-        print("⚠️  Errors Encountered (Agents Adapted)")
-        print("-" * 70)
-        
-        for error in errors[:5]:
-            print(f"• [{error['step']}] {error['error']}")
-        
-        if len(errors) > 5:
-            print(f"... and {len(errors) - 5} more")
-        print()
+        _print_section(
+            "⚠️  Errors Encountered (Agents Adapted)",
+            errors,
+            lambda _, error: f"• [{error['step']}] {error['error']}",
+        )
     
     # ========================================================================
     # Final Summary
     # ========================================================================
-    print("=" * 70)
-    print("🎉 AGENTIC WORKFLOW COMPLETE!")
-    print("=" * 70)
-    print()
-    print("✅ All 10 Phases Executed Autonomously:")
-    print("   Phase 1: LLM Foundation")
-    print("   Phase 2: Schema Analysis")
-    print("   Phase 3: Document Processing")
-    print("   Phase 4: PRD Generation")
-    print("   Phase 5: Use Case Generation")
-    print("   Phase 6: Workflow Orchestration")
-    print("   Phase 7: Template Generation")
-    print("   Phase 8: Analysis Execution")
-    print("   Phase 9: Report Generation")
-    print("   Phase 10: Agentic Workflow ← FINAL PHASE!")
-    print()
-    print("🤖 Agentic Features:")
-    print(f"   • {progress['decisions']} autonomous decisions made")
-    print(f"   • {progress['messages']} inter-agent messages")
-    print("   • Complete audit trail of reasoning")
-    print("   • Adaptive error handling")
-    print("   • Quality assurance checks")
-    print()
-    print("📊 Results:")
-    print(f"   • {len(state.use_cases)} use cases generated")
-    print(f"   • {len(state.templates)} GAE templates created")
-    print(f"   • {successful}/{len(state.execution_results)} analyses successful")
+    print_lines(
+        "=" * 70,
+        "🎉 AGENTIC WORKFLOW COMPLETE!",
+        "=" * 70,
+        "",
+        "✅ All 10 Phases Executed Autonomously:",
+        "   Phase 1: LLM Foundation",
+        "   Phase 2: Schema Analysis",
+        "   Phase 3: Document Processing",
+        "   Phase 4: PRD Generation",
+        "   Phase 5: Use Case Generation",
+        "   Phase 6: Workflow Orchestration",
+        "   Phase 7: Template Generation",
+        "   Phase 8: Analysis Execution",
+        "   Phase 9: Report Generation",
+        "   Phase 10: Agentic Workflow ← FINAL PHASE!",
+        "",
+        "🤖 Agentic Features:",
+        f"   • {progress['decisions']} autonomous decisions made",
+        f"   • {progress['messages']} inter-agent messages",
+        "   • Complete audit trail of reasoning",
+        "   • Adaptive error handling",
+        "   • Quality assurance checks",
+        "",
+        "📊 Results:",
+        f"   • {len(state.use_cases)} use cases generated",
+        f"   • {len(state.templates)} GAE templates created",
+        f"   • {n_ok}/{n_exec} analyses successful",
+    )
     if state.report:
-        print(f"   • {len(state.report.insights)} insights discovered")
-        print(f"   • {len(state.report.recommendations)} recommendations")
-    print()
-    print("🎯 The System is COMPLETE!")
-    print("   • 100% autonomous operation")
-    print("   • From requirements to insights")
-    print("   • Multi-agent coordination")
-    print("   • Production-ready!")
-    print()
-    print("Progress: 100% - ALL PHASES COMPLETE! 🚀🎉")
-    print()
+        print(f"   • {n_insights} insights discovered")
+        print(f"   • {n_recommendations} recommendations")
+    print_lines(
+        "",
+        "🎯 The System is COMPLETE!",
+        "   • 100% autonomous operation",
+        "   • From requirements to insights",
+        "   • Multi-agent coordination",
+        "   • Production-ready!",
+        "",
+        "Progress: 100% - ALL PHASES COMPLETE! 🚀🎉",
+        "",
+    )
 
 
 if __name__ == '__main__':
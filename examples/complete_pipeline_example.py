@@ -11,12 +11,14 @@ Demonstrates the complete flow:
 This is the end-to-end demonstration of Phases 1-8!
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from graph_analytics_ai.db_connection import get_db_connection
 from graph_analytics_ai.ai.schema.extractor import SchemaExtractor
 from graph_analytics_ai.ai.schema.analyzer import SchemaAnalyzer
 from graph_analytics_ai.ai.llm import create_llm_provider
 from graph_analytics_ai.ai.generation.use_cases import UseCaseGenerator
-from graph_analytics_ai.ai.templates import TemplateGenerator, validate_template
+from graph_analytics_ai.ai.templates import TemplateGenerator, TemplateValidator
 from graph_analytics_ai.ai.execution import AnalysisExecutor
 from graph_analytics_ai.ai.documents.models import (
     ExtractedRequirements,
@@ -26,14 +28,18 @@ from graph_analytics_ai.ai.documents.models import (
     RequirementType
 )
 
+from example_utils import print_lines
+
 
 def complete_pipeline_example():
     """Run the complete GAE analysis pipeline."""
     
-    print("=" * 70)
-    print("Complete GAE Analysis Pipeline - Phases 1-8")
-    print("=" * 70)
-    print()
+    print_lines(
+        "=" * 70,
+        "Complete GAE Analysis Pipeline - Phases 1-8",
+        "=" * 70,
+        "",
+    )
     
     # ========================================================================
     # Phase 1-2: Schema Extraction & Analysis
@@ -42,24 +48,24 @@ def complete_pipeline_example():
     print("-" * 70)
     
     db = get_db_connection()
-    extractor = SchemaExtractor(db)
+    extractor = SchemaExtractor(db, use_cache=True)
     schema = extractor.extract()
     
-    print("✓ Schema extracted:")
-    print(f"  • Vertex collections: {len(schema.vertex_collections)}")
-    print(f"  • Edge collections: {len(schema.edge_collections)}")
-    print(f"  • Total: {schema.total_documents:,} documents, {schema.total_edges:,} edges")
+    print_lines(
+        "✓ Schema extracted:",
+        f"  • Vertex collections: {len(schema.vertex_collections)}",
+        f"  • Edge collections: {len(schema.edge_collections)}",
+        f"  • Total: {schema.total_documents:,} documents, {schema.total_edges:,} edges",
+    )
     
     provider = create_llm_provider()
     analyzer = SchemaAnalyzer(provider)
     
-    try:
-        analysis = analyzer.analyze(schema)
-        print(f"✓ Schema analyzed: {analysis.domain}, complexity {analysis.complexity_score:.1f}/10")
-    except:
-        analysis = analyzer._create_fallback_analysis(schema)
-        print("✓ Schema analyzed (fallback mode)")
-    
+    # The LLM analysis is network-bound and nothing needs it until use case
+    # generation, so let it run while the requirements are assembled
+    pool = ThreadPoolExecutor(max_workers=1)
+    analysis_future = pool.submit(analyzer.analyze, schema)
+    print("✓ Schema analysis started")
     print()
     
     # ========================================================================
@@ -104,6 +110,15 @@ def complete_pipeline_example():
     print("🎯 Phase 5: Use Case Generation")
     print("-" * 70)
     
+    try:
+        analysis = analysis_future.result()
+        print(f"✓ Schema analyzed: {analysis.domain}, complexity {analysis.complexity_score:.1f}/10")
+    except Exception:
+        analysis = analyzer._create_fallback_analysis(schema)
+        print("✓ Schema analyzed (fallback mode)")
+    finally:
+        pool.shutdown()
+    
     use_case_generator = UseCaseGenerator()
     use_cases = use_case_generator.generate(requirements, analysis)
     
@@ -124,23 +139,21 @@ def complete_pipeline_example():
     print(f"✓ Generated {len(templates)} GAE templates")
     
     # Validate templates
-    valid_count = 0
-    for template in templates:
-        result = validate_template(template)
-        if result.is_valid:
-            valid_count += 1
+    valid_templates, _ = TemplateValidator().validate_batch(templates)
     
-    print(f"✓ Validated: {valid_count}/{len(templates)} templates valid")
+    print(f"✓ Validated: {len(valid_templates)}/{len(templates)} templates valid")
     print()
     
     # Show first template details
     if templates:
         template = templates[0]
-        print(f"Example Template: {template.name}")
-        print(f"  Algorithm: {template.algorithm.algorithm.value}")
-        print(f"  Engine: {template.config.engine_size.value}")
-        print(f"  Estimated: {template.estimated_runtime_seconds:.1f}s")
-        print()
+        print_lines(
+            f"Example Template: {template.name}",
+            f"  Algorithm: {template.algorithm.algorithm.value}",
+            f"  Engine: {template.config.engine_size.value}",
+            f"  Estimated: {template.estimated_runtime_seconds:.1f}s",
+            "",
+        )
     
     # ========================================================================
     # Phase 8: EXECUTION! 🚀
@@ -154,20 +167,24 @@ def complete_pipeline_example():
     
     # Execute first template as demo
     template = templates[0]
-    print(f"Executing: {template.name}")
-    print(f"Algorithm: {template.algorithm.algorithm.value}")
-    print()
+    print_lines(
+        f"Executing: {template.name}",
+        f"Algorithm: {template.algorithm.algorithm.value}",
+        "",
+    )
     
     executor = AnalysisExecutor()
     result = executor.execute_template(template, wait=True)
     
     if result.success:
-        print("✅ Execution successful!")
-        print(f"   Job ID: {result.job.job_id}")
-        print(f"   Status: {result.job.status.value}")
-        print(f"   Runtime: {result.job.execution_time_seconds:.1f}s")
-        print(f"   Results: {result.job.result_count or 0} records")
-        print()
+        print_lines(
+            "✅ Execution successful!",
+            f"   Job ID: {result.job.job_id}",
+            f"   Status: {result.job.status.value}",
+            f"   Runtime: {result.job.execution_time_seconds:.1f}s",
+            f"   Results: {result.job.result_count or 0} records",
+            "",
+        )
         
         if result.results:
             print("Top Results:")
@@ -183,34 +200,40 @@ def complete_pipeline_example():
     # ========================================================================
     # Summary
     # ========================================================================
-    print("=" * 70)
-    print("Pipeline Summary")
-    print("=" * 70)
+    print_lines(
+        "=" * 70,
+        "Pipeline Summary",
+        "=" * 70,
+    )
     
     summary = executor.get_execution_summary()
-    print(f"Total jobs executed: {summary['total_jobs']}")
-    print(f"Successful: {summary['completed']}")
-    print(f"Failed: {summary['failed']}")
-    print(f"Success rate: {summary['success_rate']*100:.1f}%")
+    print_lines(
+        f"Total jobs executed: {summary['total_jobs']}",
+        f"Successful: {summary['completed']}",
+        f"Failed: {summary['failed']}",
+        f"Success rate: {summary['success_rate']*100:.1f}%",
+    )
     
     if summary['avg_execution_time'] > 0:
         print(f"Avg execution time: {summary['avg_execution_time']:.1f}s")
     
-    print()
-    print("🎉 Complete pipeline executed successfully!")
-    print()
-    print("Phases completed:")
-    print("  ✅ Phase 1: LLM Foundation")
-    print("  ✅ Phase 2: Schema Analysis")
-    print("  ✅ Phase 3: Document Processing")
-    print("  ✅ Phase 4: PRD Generation")
-    print("  ✅ Phase 5: Use Case Generation")
-    print("  ✅ Phase 6: Workflow Orchestration")
-    print("  ✅ Phase 7: Template Generation")
-    print("  ✅ Phase 8: Analysis Execution")
-    print()
-    print("Next: Phase 9 - Report Generation from results!")
-    print()
+    print_lines(
+        "",
+        "🎉 Complete pipeline executed successfully!",
+        "",
+        "Phases completed:",
+        "  ✅ Phase 1: LLM Foundation",
+        "  ✅ Phase 2: Schema Analysis",
+        "  ✅ Phase 3: Document Processing",
+        "  ✅ Phase 4: PRD Generation",
+        "  ✅ Phase 5: Use Case Generation",
+        "  ✅ Phase 6: Workflow Orchestration",
+        "  ✅ Phase 7: Template Generation",
+        "  ✅ Phase 8: Analysis Execution",
+        "",
+        "Next: Phase 9 - Report Generation from results!",
+        "",
+    )
 
 
 if __name__ == '__main__':
@@ -13,9 +13,13 @@ Perfect for testing GAE analyses like PageRank, Louvain, shortest paths, etc.
 """
 
 import random
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from graph_analytics_ai.db_connection import get_db_connection
 
+from example_utils import print_lines
+
 
 # Sample data for realistic generation
 FIRST_NAMES = [
@@ -34,6 +38,24 @@ LAST_NAMES = [
     "Harris", "Clark", "Lewis", "Robinson", "Walker", "Young", "Hall"
 ]
 
+EDGE_DEFINITIONS = [
+    {
+        "edge_collection": "purchased",
+        "from_vertex_collections": ["users"],
+        "to_vertex_collections": ["products"]
+    },
+    {
+        "edge_collection": "viewed",
+        "from_vertex_collections": ["users"],
+        "to_vertex_collections": ["products"]
+    },
+    {
+        "edge_collection": "belongs_to",
+        "from_vertex_collections": ["products"],
+        "to_vertex_collections": ["categories"]
+    }
+]
+
 CATEGORIES = [
     {"name": "Electronics", "description": "Computers, phones, and gadgets"},
     {"name": "Clothing", "description": "Fashion and apparel"},
@@ -145,6 +167,70 @@ PRODUCTS_BY_CATEGORY = {
 }
 
 
+# Documents per insert_many() request
+BATCH_SIZE = 1000
+
+# Documents per bulk import request
+IMPORT_BATCH_SIZE = 10000
+
+
+def insert_batched(collection, docs):
+    """
+    Insert documents in BATCH_SIZE chunks, one request per chunk.
+    
+    Writes don't wait for fsync; this is seed data that can be regenerated.
+    
+    Args:
+        collection: Target ArangoDB collection
+        docs: Documents to insert
+    
+    Returns:
+        list: Metadata (``_key``, ``_id``, ``_rev``) for each document, in order
+    
+    Raises:
+        DocumentInsertError: If any document in a chunk is rejected
+    """
+    metadata = []
+    for start in range(0, len(docs), BATCH_SIZE):
+        metadata.extend(
+            collection.insert_many(
+                docs[start:start + BATCH_SIZE],
+                sync=False,
+                raise_on_document_error=True,
+            )
+        )
+    return metadata
+
+
+def import_batched(collection, docs, from_prefix=None, to_prefix=None):
+    """
+    Load documents through the bulk import API (``/_api/import``).
+    
+    Cheaper per document than insert_many() but returns no keys, so it is
+    used for the edges, whose keys are never read.
+    
+    Args:
+        collection: Target ArangoDB collection
+        docs: Documents to import
+        from_prefix: Collection prepended server-side to bare ``_from`` keys
+        to_prefix: Collection prepended server-side to bare ``_to`` keys
+    
+    Returns:
+        int: Number of documents created
+    """
+    created = 0
+    for start in range(0, len(docs), IMPORT_BATCH_SIZE):
+        result = collection.import_bulk(
+            docs[start:start + IMPORT_BATCH_SIZE],
+            details=False,
+            from_prefix=from_prefix,
+            to_prefix=to_prefix,
+            sync=False,
+        )
+        created += result["created"]
+    return created
+
+
 def create_test_data(num_users=100, num_interactions=500):
     """
     Create test data in the ArangoDB cluster.
@@ -156,12 +242,21 @@ def create_test_data(num_users=100, num_interactions=500):
     Returns:
         dict: Statistics about created data
     """
-    print("=" * 60)
-    print("Creating Test Data for GAE Testing")
-    print("=" * 60)
-    print()
+    print_lines(
+        "=" * 60,
+        "Creating Test Data for GAE Testing",
+        "=" * 60,
+        "",
+    )
     
     db = get_db_connection()
+    # One reference time for the whole run; per-document dates are offsets from it
+    now = datetime.utcnow()
+    now_iso = now.isoformat()
+    
+    def dates_back(days):
+        """Formatted dates for 0..days days before now, indexed by offset."""
+        return [(now - timedelta(days=d)).isoformat() for d in range(days + 1)]
     stats = {
         "users": 0,
         "products": 0,
@@ -171,102 +266,113 @@ def create_test_data(num_users=100, num_interactions=500):
         "belongs_to": 0,
     }
     
-    # Create collections
-    print("1. Creating collections...")
+    # Create the named graph first; ArangoDB creates any vertex and edge
+    # collection it references that does not exist yet.
+    print("1. Creating collections and named graph...")
+    if db.has_graph("ecommerce_graph"):
+        db.delete_graph("ecommerce_graph")
+    db.create_graph(name="ecommerce_graph", edge_definitions=EDGE_DEFINITIONS)
     
     # Vertex collections
-    if not db.has_collection("users"):
-        db.create_collection("users")
     users_coll = db.collection("users")
-    
-    if not db.has_collection("products"):
-        db.create_collection("products")
     products_coll = db.collection("products")
-    
-    if not db.has_collection("categories"):
-        db.create_collection("categories")
     categories_coll = db.collection("categories")
     
     # Edge collections
-    if not db.has_collection("purchased"):
-        db.create_collection("purchased", edge=True)
     purchased_coll = db.collection("purchased")
-    
-    if not db.has_collection("viewed"):
-        db.create_collection("viewed", edge=True)
     viewed_coll = db.collection("viewed")
-    
-    if not db.has_collection("belongs_to"):
-        db.create_collection("belongs_to", edge=True)
     belongs_to_coll = db.collection("belongs_to")
     
-    print("   ✓ Collections created")
+    print("   ✓ Collections and 'ecommerce_graph' named graph created")
     print()
     
     # Create categories
     print("2. Creating categories...")
-    category_keys = {}
-    for cat in CATEGORIES:
-        doc = categories_coll.insert({
+    category_docs = [
+        {
             "name": cat["name"],
             "description": cat["description"],
-            "created_at": datetime.utcnow().isoformat()
-        })
-        category_keys[cat["name"]] = doc["_key"]
-        stats["categories"] += 1
+            "created_at": now_iso
+        }
+        for cat in CATEGORIES
+    ]
+    category_keys = {
+        cat["name"]: meta["_key"]
+        for cat, meta in zip(CATEGORIES, insert_batched(categories_coll, category_docs))
+    }
+    stats["categories"] = len(category_keys)
     
     print(f"   ✓ Created {stats['categories']} categories")
     print()
     
     # Create products
     print("3. Creating products...")
-    product_keys = []
-    for category_name, products in PRODUCTS_BY_CATEGORY.items():
-        for product_name, price, description in products:
-            # Create product
-            product_doc = products_coll.insert({
-                "name": product_name,
-                "price": price,
-                "description": description,
-                "category": category_name,
-                "stock": random.randint(10, 100),
-                "rating": round(random.uniform(3.5, 5.0), 1),
-                "created_at": datetime.utcnow().isoformat()
-            })
-            product_keys.append(product_doc["_key"])
-            stats["products"] += 1
-            
-            # Create belongs_to edge
-            belongs_to_coll.insert({
-                "_from": f"products/{product_doc['_key']}",
-                "_to": f"categories/{category_keys[category_name]}",
-                "created_at": datetime.utcnow().isoformat()
-            })
-            stats["belongs_to"] += 1
-    
-    print(f"   ✓ Created {stats['products']} products")
-    print(f"   ✓ Created {stats['belongs_to']} belongs_to edges")
-    print()
+    product_docs = [
+        {
+            "name": product_name,
+            "price": price,
+            "description": description,
+            "category": category_name,
+            "stock": random.randint(10, 100),
+            "rating": round(random.uniform(3.5, 5.0), 1),
+            "created_at": now_iso
+        }
+        for category_name, products in PRODUCTS_BY_CATEGORY.items()
+        for product_name, price, description in products
+    ]
+    product_keys = [meta["_key"] for meta in insert_batched(products_coll, product_docs)]
+    stats["products"] = len(product_keys)
+    price_by_key = {
+        product_key: product["price"]
+        for product, product_key in zip(product_docs, product_keys)
+    }
+    
+    # Link each product to its category
+    belongs_to_docs = [
+        {
+            "_from": product_key,
+            "_to": category_keys[product["category"]],
+            "created_at": now_iso
+        }
+        for product, product_key in zip(product_docs, product_keys)
+    ]
+    stats["belongs_to"] = import_batched(
+        belongs_to_coll, belongs_to_docs, "products", "categories"
+    )
+    
+    print_lines(
+        f"   ✓ Created {stats['products']} products",
+        f"   ✓ Created {stats['belongs_to']} belongs_to edges",
+        "",
+    )
     
     # Create users
     print("4. Creating users...")
-    user_keys = []
-    for i in range(num_users):
-        first_name = random.choice(FIRST_NAMES)
-        last_name = random.choice(LAST_NAMES)
-        
-        doc = users_coll.insert({
+    user_docs = [
+        {
             "username": f"{first_name.lower()}{last_name.lower()}{i}",
             "email": f"{first_name.lower()}.{last_name.lower()}{i}@example.com",
             "first_name": first_name,
             "last_name": last_name,
-            "age": random.randint(18, 70),
-            "location": random.choice(["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"]),
-            "member_since": (datetime.utcnow() - timedelta(days=random.randint(30, 730))).isoformat(),
+            "age": age,
+            "location": location,
+            "member_since": member_since,
             "total_spent": 0,  # Will be updated
-        })
-        user_keys.append(doc["_key"])
-        stats["users"] += 1
+        }
+        for i, first_name, last_name, age, location, member_since in zip(
+            range(num_users),
+            random.choices(FIRST_NAMES, k=num_users),
+            random.choices(LAST_NAMES, k=num_users),
+            random.choices(range(18, 71), k=num_users),
+            random.choices(
+                ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"],
+                k=num_users,
+            ),
+            random.choices(dates_back(730)[30:], k=num_users),
+        )
+    ]
+    user_keys = [meta["_key"] for meta in insert_batched(users_coll, user_docs)]
+    stats["users"] = len(user_keys)
     
     print(f"   ✓ Created {stats['users']} users")
     print()
@@ -274,98 +380,103 @@ def create_test_data(num_users=100, num_interactions=500):
     # Create interactions (purchases and views)
     print("5. Creating user interactions...")
     
+    # Each field is drawn for all interactions at once; dates are picked
+    # from pre-formatted days rather than formatted per edge. _from/_to hold
+    # bare keys; the collection prefixes are added by the import.
     # Purchases (realistic shopping patterns)
-    for _ in range(num_interactions):
-        user_key = random.choice(user_keys)
-        product_key = random.choice(product_keys)
-        
-        # Get product to know the price
-        product = products_coll.get(product_key)
-        
-        # Create purchase
-        purchase_date = datetime.utcnow() - timedelta(days=random.randint(0, 180))
-        purchased_coll.insert({
-            "_from": f"users/{user_key}",
-            "_to": f"products/{product_key}",
-            "quantity": random.randint(1, 3),
-            "price_paid": product["price"],
-            "purchased_at": purchase_date.isoformat(),
-        })
-        stats["purchased"] += 1
-        
-        # Update user's total spent
-        user = users_coll.get(user_key)
-        user["total_spent"] = user.get("total_spent", 0) + product["price"]
-        users_coll.update({"_key": user_key, "total_spent": user["total_spent"]})
+    buyers = random.choices(user_keys, k=num_interactions)
+    bought = random.choices(product_keys, k=num_interactions)
+    purchased_docs = [
+        {
+            "_from": user_key,
+            "_to": product_key,
+            "quantity": quantity,
+            "price_paid": price_by_key[product_key],
+            "purchased_at": purchased_at,
+        }
+        for user_key, product_key, quantity, purchased_at in zip(
+            buyers,
+            bought,
+            random.choices(range(1, 4), k=num_interactions),
+            random.choices(dates_back(180), k=num_interactions),
+        )
+    ]
+    total_spent = defaultdict(float)
+    for user_key, product_key in zip(buyers, bought):
+        total_spent[user_key] += price_by_key[product_key]
     
     # Views (more views than purchases - realistic)
-    for _ in range(num_interactions * 3):
-        user_key = random.choice(user_keys)
-        product_key = random.choice(product_keys)
-        
-        viewed_coll.insert({
-            "_from": f"users/{user_key}",
-            "_to": f"products/{product_key}",
-            "duration_seconds": random.randint(5, 300),
-            "viewed_at": (datetime.utcnow() - timedelta(days=random.randint(0, 90))).isoformat(),
-        })
-        stats["viewed"] += 1
-    
-    print(f"   ✓ Created {stats['purchased']} purchase edges")
-    print(f"   ✓ Created {stats['viewed']} view edges")
-    print()
+    num_views = num_interactions * 3
+    viewed_docs = [
+        {
+            "_from": user_key,
+            "_to": product_key,
+            "duration_seconds": duration,
+            "viewed_at": viewed_at,
+        }
+        for user_key, product_key, duration, viewed_at in zip(
+            random.choices(user_keys, k=num_views),
+            random.choices(product_keys, k=num_views),
+            random.choices(range(5, 301), k=num_views),
+            random.choices(dates_back(90), k=num_views),
+        )
+    ]
+    
+    # Each user's total spent
+    spent_docs = [
+        {"_key": user_key, "total_spent": amount}
+        for user_key, amount in total_spent.items()
+    ]
     
-    # Create a named graph
-    print("6. Creating named graph...")
-    try:
-        if db.has_graph("ecommerce_graph"):
-            db.delete_graph("ecommerce_graph")
-        
-        db.create_graph(
-            name="ecommerce_graph",
-            edge_definitions=[
-                {
-                    "edge_collection": "purchased",
-                    "from_vertex_collections": ["users"],
-                    "to_vertex_collections": ["products"]
-                },
-                {
-                    "edge_collection": "viewed",
-                    "from_vertex_collections": ["users"],
-                    "to_vertex_collections": ["products"]
-                },
-                {
-                    "edge_collection": "belongs_to",
-                    "from_vertex_collections": ["products"],
-                    "to_vertex_collections": ["categories"]
-                }
-            ]
+    def update_spent():
+        for start in range(0, len(spent_docs), BATCH_SIZE):
+            users_coll.update_many(
+                spent_docs[start:start + BATCH_SIZE], sync=False, silent=True
+            )
+    
+    # The three writes touch different collections, so overlap their
+    # round-trips instead of sending them one after another
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        purchased = pool.submit(
+            import_batched, purchased_coll, purchased_docs, "users", "products"
+        )
+        viewed = pool.submit(
+            import_batched, viewed_coll, viewed_docs, "users", "products"
         )
-        print("   ✓ Created 'ecommerce_graph' named graph")
-    except Exception as e:
-        print(f"   ⚠ Graph creation: {e}")
+        spent = pool.submit(update_spent)
+        stats["purchased"] = purchased.result()
+        stats["viewed"] = viewed.result()
+        spent.result()
     
-    print()
-    print("=" * 60)
-    print("✅ Test Data Creation Complete!")
-    print("=" * 60)
-    print()
-    print("📊 Statistics:")
-    print(f"   Users:       {stats['users']:>5}")
-    print(f"   Products:    {stats['products']:>5}")
-    print(f"   Categories:  {stats['categories']:>5}")
-    print(f"   Purchased:   {stats['purchased']:>5} edges")
-    print(f"   Viewed:      {stats['viewed']:>5} edges")
-    print(f"   Belongs_to:  {stats['belongs_to']:>5} edges")
-    print(f"   Total edges: {stats['purchased'] + stats['viewed'] + stats['belongs_to']:>5}")
-    print()
-    print("🎯 Perfect for GAE Analyses:")
-    print("   • PageRank - Find influential products")
-    print("   • Louvain - Discover customer communities")
-    print("   • Shortest Path - Product recommendation paths")
-    print("   • Betweenness - Key connector products")
-    print("   • k-Core - Dense purchasing patterns")
-    print()
+    print_lines(
+        f"   ✓ Created {stats['purchased']} purchase edges",
+        f"   ✓ Created {stats['viewed']} view edges",
+        "",
+    )
+    
+    print_lines(
+        "",
+        "=" * 60,
+        "✅ Test Data Creation Complete!",
+        "=" * 60,
+        "",
+        "📊 Statistics:",
+        f"   Users:       {stats['users']:>5}",
+        f"   Products:    {stats['products']:>5}",
+        f"   Categories:  {stats['categories']:>5}",
+        f"   Purchased:   {stats['purchased']:>5} edges",
+        f"   Viewed:      {stats['viewed']:>5} edges",
+        f"   Belongs_to:  {stats['belongs_to']:>5} edges",
+        f"   Total edges: {stats['purchased'] + stats['viewed'] + stats['belongs_to']:>5}",
+        "",
+        "🎯 Perfect for GAE Analyses:",
+        "   • PageRank - Find influential products",
+        "   • Louvain - Discover customer communities",
+        "   • Shortest Path - Product recommendation paths",
+        "   • Betweenness - Key connector products",
+        "   • k-Core - Dense purchasing patterns",
+        "",
+    )
     
     return stats
 
@@ -377,8 +488,10 @@ if __name__ == "__main__":
         num_interactions=500  # 500 purchases, 1500 views
     )
     
-    print("Next steps:")
-    print("1. Review the data in ArangoDB UI")
-    print("2. Test schema extraction with AI")
-    print("3. Continue with Phase 7 - Template Generation")
+    print_lines(
+        "Next steps:",
+        "1. Review the data in ArangoDB UI",
+        "2. Test schema extraction with AI",
+        "3. Continue with Phase 7 - Template Generation",
+    )
 
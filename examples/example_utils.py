@@ -0,0 +1,13 @@
+"""
+Shared helpers for the example scripts.
+
+The examples are run as scripts from this directory, so they import this
+module directly (``from example_utils import print_lines``).
+"""
+
+import sys
+
+
+def print_lines(*lines):
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
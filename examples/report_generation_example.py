@@ -19,7 +19,6 @@ from graph_analytics_ai.ai.llm import create_llm_provider
 from graph_analytics_ai.ai.generation.use_cases import UseCaseGenerator
 from graph_analytics_ai.ai.templates import TemplateGenerator
 from graph_analytics_ai.ai.execution import AnalysisExecutor
-from graph_analytics_ai.ai.reporting import ReportGenerator, ReportFormat
 from graph_analytics_ai.ai.documents.models import (
     ExtractedRequirements,
     Requirement,
@@ -137,6 +136,9 @@ def complete_pipeline_with_reports():
         print("No successful results to report on")
         return
     
+    # Only needed once there is something to report on
+    from graph_analytics_ai.ai.reporting import ReportGenerator, ReportFormat
+    
     report_gen = ReportGenerator(use_llm_interpretation=False)  # Use heuristics for speed
     
     # Generate report
@@ -167,11 +169,11 @@ def complete_pipeline_with_reports():
     output_dir.mkdir(exist_ok=True)
     
     report_path = output_dir / "analysis_report.md"
-    report_path.write_text(markdown_report)
+    report_path.write_bytes(markdown_report.encode("utf-8"))
     
     json_path = output_dir / "analysis_report.json"
     json_report = report_gen.format_report(report, ReportFormat.JSON)
-    json_path.write_text(json_report)
+    json_path.write_bytes(json_report.encode("utf-8"))
     
     print()
     print("💾 Reports saved:")
@@ -19,15 +19,15 @@ from graph_analytics_ai.ai.documents.models import (
     RequirementType
 )
 import os
+import pprint
+
+from example_utils import print_lines
 
 
 def example_template_generation():
     """Generate GAE templates from use cases."""
     
-    print("=" * 70)
-    print("Example: GAE Template Generation")
-    print("=" * 70)
-    print()
+    print_lines("=" * 70, "Example: GAE Template Generation", "=" * 70, "")
     
     # ========================================================================
     # 1. Extract Schema from Real Cluster
@@ -39,14 +39,17 @@ def example_template_generation():
         endpoint=os.getenv('ARANGO_ENDPOINT'),
         database=os.getenv('ARANGO_DATABASE'),
         username='root',
-        password=os.getenv('ARANGO_PASSWORD')
+        password=os.getenv('ARANGO_PASSWORD'),
+        use_cache=True
     )
     schema = extractor.extract()
     
-    print(f"   ✓ Extracted {len(schema.vertex_collections)} vertex collections")
-    print(f"   ✓ Extracted {len(schema.edge_collections)} edge collections")
-    print(f"   ✓ Total: {schema.total_documents} documents, {schema.total_edges} edges")
-    print()
+    print_lines(
+        f"   ✓ Extracted {len(schema.vertex_collections)} vertex collections",
+        f"   ✓ Extracted {len(schema.edge_collections)} edge collections",
+        f"   ✓ Total: {schema.total_documents} documents, {schema.total_edges} edges",
+        "",
+    )
     
     # ========================================================================
     # 2. Analyze Schema
@@ -58,9 +61,11 @@ def example_template_generation():
     
     try:
         analysis = analyzer.analyze(schema)
-        print(f"   ✓ Domain: {analysis.domain}")
-        print(f"   ✓ Complexity: {analysis.complexity_score:.1f}/10")
-        print(f"   ✓ Key entities: {', '.join(analysis.key_entities[:3])}")
+        print_lines(
+            f"   ✓ Domain: {analysis.domain}",
+            f"   ✓ Complexity: {analysis.complexity_score:.1f}/10",
+            f"   ✓ Key entities: {', '.join(analysis.key_entities[:3])}",
+        )
     except Exception as e:
         print(f"   ⚠️  LLM analysis failed (using fallback): {e}")
         analysis = analyzer._create_fallback_analysis(schema)
@@ -119,9 +124,11 @@ def example_template_generation():
         risks=[]
     )
     
-    print(f"   ✓ Created {len(requirements.objectives)} objectives")
-    print(f"   ✓ Created {len(requirements.requirements)} requirements")
-    print()
+    print_lines(
+        f"   ✓ Created {len(requirements.objectives)} objectives",
+        f"   ✓ Created {len(requirements.requirements)} requirements",
+        "",
+    )
     
     # ========================================================================
     # 4. Generate Use Cases
@@ -134,12 +141,14 @@ def example_template_generation():
         schema_analysis=analysis
     )
     
-    print(f"   ✓ Generated {len(use_cases)} use cases:")
-    for uc in use_cases[:5]:  # Show first 5
-        print(f"      • {uc.id}: {uc.title} [{uc.use_case_type.value}]")
+    lines = [f"   ✓ Generated {len(use_cases)} use cases:"]
+    lines += [
+        f"      • {uc.id}: {uc.title} [{uc.use_case_type.value}]"
+        for uc in use_cases[:5]  # Show first 5
+    ]
     if len(use_cases) > 5:
-        print(f"      ... and {len(use_cases) - 5} more")
-    print()
+        lines.append(f"      ... and {len(use_cases) - 5} more")
+    print_lines(*lines, "")
     
     # ========================================================================
     # 5. Generate Templates
@@ -157,94 +166,86 @@ def example_template_generation():
         schema_analysis=analysis
     )
     
-    print(f"   ✓ Generated {len(templates)} GAE analysis templates")
-    print()
+    print_lines(f"   ✓ Generated {len(templates)} GAE analysis templates", "")
     
     # ========================================================================
     # 6. Display Template Details
     # ========================================================================
-    print("6️⃣  Template Details:")
-    print()
+    lines = ["6️⃣  Template Details:", ""]
     
     for i, template in enumerate(templates[:3], 1):  # Show first 3 in detail
-        print(f"   Template {i}: {template.name}")
-        print(f"   {'─' * 66}")
-        print(f"   Algorithm: {template.algorithm.algorithm.value}")
-        print(f"   Engine Size: {template.config.engine_size.value}")
-        print(f"   Estimated Runtime: {template.estimated_runtime_seconds:.1f}s")
-        print()
-        
-        print("   Parameters:")
-        for key, value in template.algorithm.parameters.items():
-            print(f"      • {key}: {value}")
-        print()
+        lines += [
+            f"   Template {i}: {template.name}",
+            f"   {'─' * 66}",
+            f"   Algorithm: {template.algorithm.algorithm.value}",
+            f"   Engine Size: {template.config.engine_size.value}",
+            f"   Estimated Runtime: {template.estimated_runtime_seconds:.1f}s",
+            "",
+            "   Parameters:",
+        ]
+        lines += [
+            f"      • {key}: {value}"
+            for key, value in template.algorithm.parameters.items()
+        ]
+        lines.append("")
         
         if template.config.vertex_collections:
-            print(f"   Vertex Collections: {', '.join(template.config.vertex_collections)}")
+            lines.append(f"   Vertex Collections: {', '.join(template.config.vertex_collections)}")
         if template.config.edge_collections:
-            print(f"   Edge Collections: {', '.join(template.config.edge_collections)}")
+            lines.append(f"   Edge Collections: {', '.join(template.config.edge_collections)}")
         
-        print(f"   Result Collection: {template.config.result_collection}")
-        print()
+        lines += [f"   Result Collection: {template.config.result_collection}", ""]
     
     if len(templates) > 3:
-        print(f"   ... and {len(templates) - 3} more templates")
-        print()
+        lines += [f"   ... and {len(templates) - 3} more templates", ""]
+    print_lines(*lines)
     
     # ========================================================================
     # 7. Show AnalysisConfig Format
     # ========================================================================
-    print("7️⃣  Example AnalysisConfig (for GAE Orchestrator):")
-    print()
+    lines = ["7️⃣  Example AnalysisConfig (for GAE Orchestrator):", ""]
     
     if templates:
         template = templates[0]
         config = template.to_analysis_config()
         
-        print("   ```python")
-        print("   analysis_config = {")
-        for key, value in config.items():
-            if isinstance(value, str):
-                print(f"       '{key}': '{value}',")
-            elif isinstance(value, list):
-                if value:
-                    print(f"       '{key}': {value},")
-                else:
-                    print(f"       '{key}': [],")
-            else:
-                print(f"       '{key}': {value},")
-        print("   }")
-        print("   ```")
-        print()
+        prefix = "   analysis_config = "
+        formatted = pprint.pformat(config, width=80 - len(prefix), sort_dicts=False)
+        lines += [
+            "   ```python",
+            prefix + formatted.replace("\n", "\n" + " " * len(prefix)),
+            "   ```",
+            "",
+        ]
+    print_lines(*lines)
     
     # ========================================================================
     # 8. Summary
     # ========================================================================
-    print("=" * 70)
-    print("✅ Template Generation Complete!")
-    print("=" * 70)
-    print()
-    
-    print("📊 Summary:")
-    print(f"   • Schema: {schema.total_documents} documents, {schema.total_edges} edges")
-    print(f"   • Objectives: {len(requirements.objectives)}")
-    print(f"   • Use Cases: {len(use_cases)}")
-    print(f"   • Templates: {len(templates)}")
-    print()
-    
-    print("🎯 Templates Ready For:")
-    print("   • GAE execution on AMP cluster")
-    print("   • Parameter optimization")
-    print("   • Batch analysis runs")
-    print("   • Workflow automation")
-    print()
-    
-    print("🚀 Next Steps:")
-    print("   • Validate templates")
-    print("   • Execute on GAE cluster")
-    print("   • Analyze results")
-    print("   • Generate reports")
-    print()
+    print_lines(
+        "=" * 70,
+        "✅ Template Generation Complete!",
+        "=" * 70,
+        "",
+        "📊 Summary:",
+        f"   • Schema: {schema.total_documents} documents, {schema.total_edges} edges",
+        f"   • Objectives: {len(requirements.objectives)}",
+        f"   • Use Cases: {len(use_cases)}",
+        f"   • Templates: {len(templates)}",
+        "",
+        "🎯 Templates Ready For:",
+        "   • GAE execution on AMP cluster",
+        "   • Parameter optimization",
+        "   • Batch analysis runs",
+        "   • Workflow automation",
+        "",
+        "🚀 Next Steps:",
+        "   • Validate templates",
+        "   • Execute on GAE cluster",
+        "   • Analyze results",
+        "   • Generate reports",
+        "",
+    )
     
     return templates
 
@@ -10,31 +10,26 @@ This script:
 """
 
 import os
-import json
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
+from example_utils import print_lines
+
 # Load environment variables
 load_dotenv()
 
-# Traditional workflow imports
-from graph_analytics_ai.db_connection import get_db_connection
-from graph_analytics_ai.ai.schema import SchemaExtractor, SchemaAnalyzer
-from graph_analytics_ai.ai.documents.models import ExtractedRequirements, Objective, Priority
-from graph_analytics_ai.ai.generation import UseCaseGenerator
-from graph_analytics_ai.ai.templates import TemplateGenerator, TemplateValidator
-
-# Agentic workflow imports
-from graph_analytics_ai.ai.agents import AgenticWorkflowRunner
+# Platform modules (database driver, LLM SDKs, agents) are imported inside
+# the functions that use them, so a failed environment check exits quickly.
 
 
 def print_section(title):
     """Print a formatted section header."""
-    print(f"\n{'='*70}")
-    print(f"  {title}")
-    print(f"{'='*70}\n")
+    print_lines(f"\n{'='*70}", f"  {title}", f"{'='*70}\n")
 
 
 def validate_environment():
@@ -61,15 +56,18 @@ def validate_environment():
     return True
 
 
-def extract_schema():
+def extract_schema(use_cache=True):
     """Extract schema from existing database."""
     print_section("SCHEMA EXTRACTION")
     
+    from graph_analytics_ai.db_connection import get_db_connection
+    from graph_analytics_ai.ai.schema import SchemaExtractor
+    
     try:
-        db = get_db_connection()
+        db = get_db_connection(reuse=True)
         print(f"✓ Connected to database: {db.name}")
         
-        extractor = SchemaExtractor(db)
+        extractor = SchemaExtractor(db, use_cache=use_cache)
         schema = extractor.extract()
         
         print("✓ Schema extracted:")
@@ -84,19 +82,40 @@ def extract_schema():
         return None, None
 
 
-def run_traditional_workflow(schema, db):
-    """Run traditional workflow orchestration."""
+def run_traditional_workflow(schema, db, provider, use_cache=True, schema_ready=None):
+    """
+    Run traditional workflow orchestration.
+    
+    Sets ``schema_ready`` once the schema analysis is done (or has failed),
+    so the agentic run's SchemaAnalyst can be served from its cached responses.
+    """
     print_section("TRADITIONAL WORKFLOW - Orchestration")
     
-    start_time = time.time()
+    from graph_analytics_ai.ai.agents import AgentNames
+    from graph_analytics_ai.ai.llm import CachingLLMProvider
+    from graph_analytics_ai.ai.schema import SchemaAnalyzer
+    from graph_analytics_ai.ai.documents.models import ExtractedRequirements, Objective, Priority
+    from graph_analytics_ai.ai.generation import UseCaseGenerator
+    from graph_analytics_ai.ai.templates import TemplateGenerator, TemplateValidator
+    
+    start_time = time.perf_counter()
     
     try:
         # 1. Schema Analysis
         print("Step 1: Analyzing schema...")
-        analyzer = SchemaAnalyzer()
+        if use_cache:
+            # Cached responses are shared with the agentic run's SchemaAnalyst
+            provider = CachingLLMProvider(
+                provider, namespace=AgentNames.SCHEMA_ANALYST
+            )
+        analyzer = SchemaAnalyzer(provider)
         analysis = analyzer.analyze(schema)
-        print(f"  ✓ Complexity score: {analysis.complexity_score:.2f}")
-        print(f"  ✓ Suggested analyses: {len(analysis.suggested_analyses)}")
+        if schema_ready is not None:
+            schema_ready.set()
+        print_lines(
+            f"  ✓ Complexity score: {analysis.complexity_score:.2f}",
+            f"  ✓ Suggested analyses: {len(analysis.suggested_analyses)}",
+        )
         
         # 2. Create requirements (simulating document processing)
         print("\nStep 2: Creating requirements...")
@@ -130,9 +149,10 @@ def run_traditional_workflow(schema, db):
         print("\nStep 3: Generating use cases...")
         uc_generator = UseCaseGenerator()
         use_cases = uc_generator.generate(requirements, analysis)
-        print(f"  ✓ Use cases generated: {len(use_cases)}")
-        for uc in use_cases:
-            print(f"    - {uc.title} ({uc.use_case_type.value})")
+        print_lines(
+            f"  ✓ Use cases generated: {len(use_cases)}",
+            *(f"    - {uc.title} ({uc.use_case_type.value})" for uc in use_cases),
+        )
         
         # 4. Generate templates
         print("\nStep 4: Generating analysis templates...")
@@ -142,18 +162,14 @@ def run_traditional_workflow(schema, db):
         
         # Validate templates
         validator = TemplateValidator()
-        valid_templates = []
-        for template in templates:
-            result = validator.validate(template)
-            if result.is_valid:
-                valid_templates.append(template)
-                print(f"    ✓ {template.name}")
-            else:
-                print(f"    ✗ {template.name}: {result.errors}")
-        
-        print(f"\n  ✓ Valid templates: {len(valid_templates)}/{len(templates)}")
+        valid_templates, invalid = validator.validate_batch(templates)
+        print_lines(
+            *(f"    ✓ {template.name}" for template in valid_templates),
+            *(f"    ✗ {template.name}: {result.errors}" for template, result in invalid),
+            f"\n  ✓ Valid templates: {len(valid_templates)}/{len(templates)}",
+        )
         
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         
         result = {
             'workflow_type': 'traditional',
@@ -191,21 +207,33 @@ def run_traditional_workflow(schema, db):
         
     except Exception as e:
         print(f"\n✗ Traditional workflow failed: {e}")
+        if schema_ready is not None:
+            schema_ready.set()
         import traceback
-        traceback.print_exc()
+        # One write keeps the traceback intact while the other workflow prints
+        sys.stderr.write(traceback.format_exc())
         return {
             'workflow_type': 'traditional',
             'success': False,
             'error': str(e),
-            'duration_seconds': time.time() - start_time
+            'duration_seconds': time.perf_counter() - start_time
         }
 
 
-def run_agentic_workflow():
-    """Run agentic workflow with autonomous agents."""
+def run_agentic_workflow(provider, use_cache=True, schema_ready=None):
+    """
+    Run agentic workflow with autonomous agents.
+    
+    Waits for ``schema_ready`` (if given) before running, so its schema step
+    reuses the cached schema extraction and the traditional run's analysis.
+    """
     print_section("AGENTIC WORKFLOW - Autonomous Agents")
     
-    start_time = time.time()
+    from graph_analytics_ai.ai.agents import AgenticWorkflowRunner
+    from graph_analytics_ai.ai.llm.cache import DEFAULT_CACHE_DIR
+    from graph_analytics_ai.ai.schema.extractor import DEFAULT_SCHEMA_CACHE_DIR
+    
+    start_time = time.perf_counter()
     
     try:
         # Read use case document
@@ -218,8 +246,14 @@ def run_agentic_workflow():
         
         # Initialize agentic runner
         print("\nInitializing agentic workflow runner...")
-        runner = AgenticWorkflowRunner()
+        runner = AgenticWorkflowRunner(
+            llm_provider=provider,
+            llm_cache_dir=str(DEFAULT_CACHE_DIR) if use_cache else None,
+            schema_cache_dir=str(DEFAULT_SCHEMA_CACHE_DIR) if use_cache else None,
+        )
         print("✓ Runner initialized")
+        if schema_ready is not None:
+            schema_ready.wait()
         
         # Note: For now, agentic runner doesn't take input file
         # It will use the existing graph and generate requirements autonomously
@@ -231,7 +265,7 @@ def run_agentic_workflow():
         
         state = runner.run()
         
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         
         # Extract results
         result = {
@@ -271,12 +305,13 @@ def run_agentic_workflow():
     except Exception as e:
         print(f"\n✗ Agentic workflow failed: {e}")
         import traceback
-        traceback.print_exc()
+        # One write keeps the traceback intact while the other workflow prints
+        sys.stderr.write(traceback.format_exc())
         return {
             'workflow_type': 'agentic',
             'success': False,
             'error': str(e),
-            'duration_seconds': time.time() - start_time
+            'duration_seconds': time.perf_counter() - start_time
         }
 
 
@@ -330,30 +365,35 @@ def compare_results(traditional, agentic):
         trad_algos = {t['algorithm'] for t in traditional['templates']}
         agen_algos = {t['algorithm'] for t in agentic.get('templates', [])}
         
-        print("\nAlgorithms Used:")
-        print(f"  Traditional: {', '.join(sorted(trad_algos))}")
-        print(f"  Agentic:     {', '.join(sorted(agen_algos))}")
+        # Sort each set once; the sorted lists feed both the output and the JSON
+        common = sorted(trad_algos & agen_algos)
+        only_trad = sorted(trad_algos - agen_algos)
+        only_agen = sorted(agen_algos - trad_algos)
         
-        common = trad_algos & agen_algos
-        only_trad = trad_algos - agen_algos
-        only_agen = agen_algos - trad_algos
-        
-        print(f"\n  Common:      {', '.join(sorted(common)) if common else 'None'}")
-        print(f"  Traditional only: {', '.join(sorted(only_trad)) if only_trad else 'None'}")
-        print(f"  Agentic only:     {', '.join(sorted(only_agen)) if only_agen else 'None'}")
+        print_lines(
+            "\nAlgorithms Used:",
+            f"  Traditional: {', '.join(sorted(trad_algos))}",
+            f"  Agentic:     {', '.join(sorted(agen_algos))}",
+            f"\n  Common:      {', '.join(common) or 'None'}",
+            f"  Traditional only: {', '.join(only_trad) or 'None'}",
+            f"  Agentic only:     {', '.join(only_agen) or 'None'}",
+        )
         
         comparison['comparison']['algorithms'] = {
-            'common': list(common),
-            'traditional_only': list(only_trad),
-            'agentic_only': list(only_agen)
+            'common': common,
+            'traditional_only': only_trad,
+            'agentic_only': only_agen
         }
     
     # Reports (agentic workflow produces these)
     if 'reports' in agentic:
-        print("\nReports Generated (Agentic only):")
+        lines = ["\nReports Generated (Agentic only):"]
         for report in agentic['reports']:
-            print(f"  - {report['title']}")
-            print(f"    Insights: {report['insights_count']}, Recommendations: {report['recommendations_count']}")
+            lines += [
+                f"  - {report['title']}",
+                f"    Insights: {report['insights_count']}, Recommendations: {report['recommendations_count']}",
+            ]
+        print_lines(*lines)
     
     return comparison
 
@@ -367,8 +407,9 @@ def generate_report(comparison):
     output_dir.mkdir(exist_ok=True)
     
     results_file = output_dir / "validation_results.json"
-    with open(results_file, 'w') as f:
-        json.dump(comparison, f, indent=2, default=str)
+    from graph_analytics_ai.ai.json_utils import dumps_json
+    
+    results_file.write_bytes(dumps_json(comparison, indent=True))
     
     print(f"✓ Detailed results saved to: {results_file}")
     
@@ -406,8 +447,14 @@ def generate_report(comparison):
     return comp.get('both_successful', False)
 
 
-def main():
-    """Main validation workflow."""
+def main(use_cache=True):
+    """
+    Main validation workflow.
+    
+    Args:
+        use_cache: Reuse cached schema extraction and LLM responses from
+            earlier runs while the database is unchanged. Disable for CI.
+    """
     print("\n" + "="*70)
     print("  WORKFLOW VALIDATION - Traditional vs Agentic")
     print("="*70)
@@ -418,15 +465,31 @@ def main():
         return False
     
     # 2. Extract schema
-    schema, db = extract_schema()
+    schema, db = extract_schema(use_cache)
     if not schema:
         return False
     
-    # 3. Run traditional workflow
-    traditional_result = run_traditional_workflow(schema, db)
-    
-    # 4. Run agentic workflow
-    agentic_result = run_agentic_workflow()
+    # One LLM provider serves both workflows, so they share its HTTP
+    # session and connection pool
+    from graph_analytics_ai.ai.llm import create_llm_provider
+    provider = create_llm_provider()
+    
+    # 3-4. Run both workflows concurrently; both wait mostly on the LLM and
+    # database. The agentic runner opens its own connection, so the two
+    # threads never share `db`. Their progress output may interleave.
+    # With caching, the agentic run starts once the traditional schema
+    # analysis is done, so its SchemaAnalyst hits the cache instead of
+    # repeating the same calls.
+    schema_ready = threading.Event() if use_cache else None
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        traditional_future = pool.submit(
+            run_traditional_workflow, schema, db, provider, use_cache, schema_ready
+        )
+        agentic_future = pool.submit(
+            run_agentic_workflow, provider, use_cache, schema_ready
+        )
+        traditional_result = traditional_future.result()
+        agentic_result = agentic_future.result()
     
     if not agentic_result:
         print("\n✗ Cannot complete validation - agentic workflow failed to initialize")
@@ -444,8 +507,20 @@ def main():
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="Validate Traditional and Agentic workflows"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-extract the schema and re-query the LLM instead of reusing cached results"
+    )
+    args = parser.parse_args()
+    
     try:
-        success = main()
+        success = main(use_cache=not args.no_cache)
         exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\n\nValidation interrupted by user")
@@ -101,41 +101,22 @@ def example_with_progress_monitoring():
         enable_checkpoints=True
     )
     
-    # Monitor progress in background
-    import time
-    from threading import Thread
-    
-    def monitor():
-        """Monitor and display progress."""
-        while True:
-            if not orchestrator.state:
-                time.sleep(1)
-                continue
-            
-            progress = orchestrator.get_progress()
-            if progress['status'] == 'not_started':
-                break
-            
-            print(f"\rProgress: {progress['progress'] * 100:.1f}% "
-                  f"[{progress['completed_steps']}/{progress['total_steps']} steps] "
-                  f"Current: {progress['current_step'] or 'None'}", 
-                  end='', flush=True)
-            
-            if progress['status'] in ('completed', 'failed'):
-                break
-            
-            time.sleep(2)
-    
-    # Start monitoring
-    monitor_thread = Thread(target=monitor, daemon=True)
-    monitor_thread.start()
-    
-    # Run workflow
+    def show_progress(progress):
+        """Display progress as the orchestrator reports each step transition."""
+        print(f"\rProgress: {progress['progress'] * 100:.1f}% "
+              f"[{progress['completed_steps']}/{progress['total_steps']} steps] "
+              f"Current: {progress['current_step'] or 'None'}", 
+              end='', flush=True)
+    
+    # Run workflow; progress is pushed to the callback, no polling needed.
+    # To run it in the background instead, start run_complete_workflow on a
+    # Thread and block on orchestrator.finished.wait().
     result = orchestrator.run_complete_workflow(
         business_requirements=["requirements.pdf"],
         database_endpoint="http://localhost:8529",
         database_name="my_graph",
-        database_password=""
+        database_password="",
+        on_progress=show_progress
     )
     
     print()  # New line after progress
@@ -152,22 +133,22 @@ def example_resume_from_checkpoint():
     
     output_dir = "./workflow_output"
     
-    # Check for existing checkpoint
-    checkpoint_files = list(Path(output_dir).glob("checkpoint_*.json"))
-    
-    if not checkpoint_files:
-        print("No checkpoint found. Run a workflow first.")
-        return
-    
-    print(f"Found {len(checkpoint_files)} checkpoint(s)")
-    print()
-    
     # Create orchestrator
     orchestrator = WorkflowOrchestrator(
         output_dir=output_dir,
         enable_checkpoints=True
     )
     
+    # Check for an existing checkpoint (read from the checkpoint index)
+    checkpoint = orchestrator.latest_checkpoint()
+    
+    if checkpoint is None:
+        print("No checkpoint found. Run a workflow first.")
+        return
+    
+    print(f"Found checkpoint: {checkpoint.name}")
+    print()
+    
     # Resume workflow
     print("Resuming workflow from last checkpoint...")
     result = orchestrator.run_complete_workflow(
@@ -51,21 +51,51 @@ Note:
     - Additional dependencies: pip install graph-analytics-ai[ai]
 """
 
-# LLM providers
-from .llm import (
-    LLMProvider,
-    LLMConfig,
-    LLMResponse,
-    LLMProviderError,
-    create_llm_provider,
-    get_default_provider,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Static analyzers and IDEs see the real names; at runtime they are
+    # resolved lazily by __getattr__ below
+    from . import documents, generation, schema, workflow
+    from .llm import (
+        LLMConfig,
+        LLMProvider,
+        LLMProviderError,
+        LLMResponse,
+        create_llm_provider,
+        get_default_provider,
+    )
+
+# Public names are resolved on first attribute access (PEP 562), so
+# ``import graph_analytics_ai.ai`` stays cheap and importing one subpackage
+# (e.g. ai.schema) does not pull in the LLM providers or the whole pipeline.
+_LAZY_ATTRS = {
+    # LLM providers
+    "LLMProvider": ".llm",
+    "LLMConfig": ".llm",
+    "LLMResponse": ".llm",
+    "LLMProviderError": ".llm",
+    "create_llm_provider": ".llm",
+    "get_default_provider": ".llm",
+}
+_LAZY_SUBMODULES = ("schema", "documents", "generation", "workflow")
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_LAZY_SUBMODULES))
 
-# Schema analysis / documents / generation / workflow (import submodules for convenience)
-from . import schema
-from . import documents
-from . import generation
-from . import workflow
 
 __version__ = "3.0.0"  # AI module version (v3.0 = Phase 10 complete - All features)
 
@@ -5,18 +5,57 @@ Autonomous agents for intelligent graph analytics workflow orchestration.
 Implements a supervisor pattern with specialized domain agents.
 """
 
-from .base import Agent, AgentType, AgentMessage, AgentState, handle_agent_errors
-from .orchestrator import OrchestratorAgent
-from .specialized import (
-    SchemaAnalysisAgent,
-    RequirementsAgent,
-    UseCaseAgent,
-    TemplateAgent,
-    ExecutionAgent,
-    ReportingAgent,
-)
-from .runner import AgenticWorkflowRunner
-from .constants import AgentNames, WorkflowSteps, AgentDefaults
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import Agent, AgentType, AgentMessage, AgentState, handle_agent_errors
+    from .orchestrator import OrchestratorAgent
+    from .specialized import (
+        SchemaAnalysisAgent,
+        RequirementsAgent,
+        UseCaseAgent,
+        TemplateAgent,
+        ExecutionAgent,
+        ReportingAgent,
+    )
+    from .runner import AgenticWorkflowRunner
+    from .constants import AgentNames, WorkflowSteps, AgentDefaults
+
+# Agents are resolved on first attribute access (PEP 562): importing, say,
+# AgentNames or the runner does not load every specialized agent (and the
+# schema/generation/execution stacks they depend on) up front.
+_LAZY_ATTRS = {
+    "Agent": ".base",
+    "AgentType": ".base",
+    "AgentMessage": ".base",
+    "AgentState": ".base",
+    "handle_agent_errors": ".base",
+    "OrchestratorAgent": ".orchestrator",
+    "SchemaAnalysisAgent": ".specialized",
+    "RequirementsAgent": ".specialized",
+    "UseCaseAgent": ".specialized",
+    "TemplateAgent": ".specialized",
+    "ExecutionAgent": ".specialized",
+    "ReportingAgent": ".specialized",
+    "AgenticWorkflowRunner": ".runner",
+    "AgentNames": ".constants",
+    "WorkflowSteps": ".constants",
+    "AgentDefaults": ".constants",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # Base
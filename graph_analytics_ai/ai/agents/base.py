@@ -105,7 +105,7 @@ class AgentType(Enum):
     QUALITY_ASSURANCE = "quality_assurance"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentMessage:
     """
     Message between agents.
@@ -266,22 +266,7 @@ class AgentState:
             ],
             # Serialize execution results
             "execution_results": [
-                {
-                    "job_id": r.job.job_id if hasattr(r, "job") else None,
-                    "template_name": r.job.template_name if hasattr(r, "job") else None,
-                    "algorithm": r.job.algorithm if hasattr(r, "job") else None,
-                    "success": r.success,
-                    "status": str(r.job.status) if hasattr(r, "job") else None,
-                    "execution_time": (
-                        r.job.execution_time_seconds if hasattr(r, "job") else None
-                    ),
-                    "result_count": r.job.result_count if hasattr(r, "job") else None,
-                    "result_collection": (
-                        r.job.result_collection if hasattr(r, "job") else None
-                    ),
-                    "error": r.error if hasattr(r, "error") else None,
-                }
-                for r in self.execution_results
+                _execution_result_to_dict(r) for r in self.execution_results
             ],
             # Serialize reports
             "reports": [
@@ -296,6 +281,23 @@ class AgentState:
         }
 
 
+def _execution_result_to_dict(result: Any) -> Dict[str, Any]:
+    """Summarize an execution result, tolerating results without a job."""
+    job = getattr(result, "job", None)
+    has_job = job is not None
+    return {
+        "job_id": job.job_id if has_job else None,
+        "template_name": job.template_name if has_job else None,
+        "algorithm": job.algorithm if has_job else None,
+        "success": result.success,
+        "status": str(job.status) if has_job else None,
+        "execution_time": job.execution_time_seconds if has_job else None,
+        "result_count": job.result_count if has_job else None,
+        "result_collection": job.result_collection if has_job else None,
+        "error": getattr(result, "error", None),
+    }
+
+
 class Agent(ABC):
     """
     Base class for all agents.
@@ -365,12 +367,14 @@ class Agent(ABC):
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self.process, message, state)
 
-    def reason(self, prompt: str) -> str:
+    def reason(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """
         Use LLM to reason about a problem.
 
         Args:
             prompt: Reasoning prompt
+            system_prompt: Optional static instructions sent as a separate,
+                provider-cacheable prefix
 
         Returns:
             LLM response
@@ -387,7 +391,10 @@ class Agent(ABC):
                 data={"prompt_length": len(prompt)},
             )
 
-        response = self.llm_provider.generate(prompt)
+        if system_prompt:
+            response = self.llm_provider.generate(prompt, system_prompt=system_prompt)
+        else:
+            response = self.llm_provider.generate(prompt)
 
         # Record LLM call end
         if self.trace_collector:
@@ -636,13 +643,12 @@ class SpecializedAgent(Agent):
         Returns:
             LLM response
         """
-        full_prompt = f"""
-{self.system_prompt}
-
-Context:
+        # Keep the agent's system prompt as a byte-identical prefix so
+        # providers can serve it from their prompt cache across calls
+        task_prompt = f"""Context:
 {context}
 
 Task:
 {prompt}
 """
-        return self.reason(full_prompt)
+        return self.reason(task_prompt, system_prompt=self.system_prompt)
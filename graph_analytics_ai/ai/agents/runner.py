@@ -4,9 +4,15 @@ Agentic workflow runner.
 High-level interface for running the agentic workflow.
 """
 
-from typing import Dict, List, Optional, Any
-
-from ..llm import create_llm_provider
+import io
+import sys
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+
+from ..json_utils import dumps_json, loads_json
+from ..llm import create_llm_provider, CachingLLMProvider
 from ...db_connection import get_db_connection
 
 from .base import AgentState
@@ -21,6 +27,91 @@ from .specialized import (
 )
 from .constants import AgentNames
 
+_BANNER = "=" * 70
+
+# AgentState.to_dict() keys written to results.json by export_state_ndjson;
+# everything else goes to workflow.json
+_RESULT_KEYS = ("use_cases", "templates", "execution_results", "reports")
+
+# Optional (label, attribute) pairs rendered only when present and non-empty
+_INSIGHT_FIELDS = (("Business Impact", "business_impact"),)
+_RECOMMENDATION_FIELDS = (
+    ("Effort", "effort_estimate"),
+    ("Expected Impact", "expected_impact"),
+)
+
+
+class _FilenameTranslation(dict):
+    """
+    str.translate table that keeps alphanumerics, '-' and '_' and maps
+    every other character to '_'.
+
+    Entries are computed on first sight of a code point and memoized, so
+    sanitizing a title is a single C-level pass after warm-up.
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        keep = char.isalnum() or char in "-_"
+        self[codepoint] = codepoint if keep else ord("_")
+        return self[codepoint]
+
+
+_FILENAME_TABLE = _FilenameTranslation()
+
+
+def _append_optional_fields(
+    parts: List[str], obj: Any, fields: Tuple[Tuple[str, str], ...]
+) -> None:
+    """Append a markdown bullet for each populated optional attribute."""
+    for label, attr in fields:
+        value = getattr(obj, attr, None)
+        if value:
+            parts.append(f"- **{label}:** {value}\n")
+
+
+def _serialize_report(report: Any, index: int) -> Tuple[str, str]:
+    """
+    Render a report as markdown.
+
+    Args:
+        report: Analysis report to render
+        index: 1-based position of the report in the workflow output
+
+    Returns:
+        Tuple of (filename, markdown text)
+    """
+    # Generate filename from report title
+    safe_title = report.title.translate(_FILENAME_TABLE).lower()
+    filename = f"report_{index:02d}_{safe_title}.md"
+
+    parts = [
+        f"# {report.title}\n\n",
+        f"**Generated:** {report.generated_at}\n\n",
+        f"## Summary\n\n{report.summary}\n\n",
+    ]
+
+    if report.insights:
+        parts.append(f"## Insights ({len(report.insights)})\n\n")
+        for j, insight in enumerate(report.insights, 1):
+            parts.append(f"### {j}. {insight.title}\n\n")
+            parts.append(f"{insight.description}\n\n")
+            parts.append(f"- **Type:** {insight.insight_type}\n")
+            parts.append(f"- **Confidence:** {insight.confidence:.0%}\n")
+            _append_optional_fields(parts, insight, _INSIGHT_FIELDS)
+            parts.append("\n")
+
+    if report.recommendations:
+        parts.append(f"## Recommendations ({len(report.recommendations)})\n\n")
+        for j, rec in enumerate(report.recommendations, 1):
+            parts.append(f"### {j}. {rec.title}\n\n")
+            parts.append(f"{rec.description}\n\n")
+            parts.append(f"- **Priority:** {rec.priority}\n")
+            _append_optional_fields(parts, rec, _RECOMMENDATION_FIELDS)
+            parts.append("\n")
+
+    return filename, "".join(parts)
+
 
 class AgenticWorkflowRunner:
     """
@@ -49,6 +140,8 @@ class AgenticWorkflowRunner:
         enable_tracing: bool = True,
         enable_debug_mode: bool = False,
         catalog: Optional[Any] = None,
+        llm_cache_dir: Optional[str] = None,
+        schema_cache_dir: Optional[str] = None,
     ):
         """
         Initialize workflow runner.
@@ -63,8 +156,13 @@ class AgenticWorkflowRunner:
             enable_tracing: Whether to enable workflow tracing (default: True)
             enable_debug_mode: Whether to enable verbose debug mode (default: False)
             catalog: Optional analysis catalog for tracking executions and lineage
+            llm_cache_dir: Optional directory for caching agent LLM responses on
+                disk, keyed by agent name and request hash (disabled if None)
+            schema_cache_dir: Optional directory for caching the extracted schema,
+                reused while the database's collections are unchanged
+                (disabled if None)
         """
-        self.db = db_connection or get_db_connection()
+        self.db = db_connection or get_db_connection(reuse=True)
         self.llm_provider = llm_provider or create_llm_provider()
         self.graph_name = graph_name
         self.core_collections = core_collections or []
@@ -72,6 +170,8 @@ class AgenticWorkflowRunner:
         self.enable_tracing = enable_tracing
         self.enable_debug_mode = enable_debug_mode
         self.catalog = catalog
+        self.llm_cache_dir = llm_cache_dir
+        self.schema_cache_dir = schema_cache_dir
 
         # Initialize tracing
         self.trace_collector = None
@@ -104,22 +204,23 @@ class AgenticWorkflowRunner:
         """Create all specialized agents."""
         return {
             AgentNames.SCHEMA_ANALYST: SchemaAnalysisAgent(
-                llm_provider=self.llm_provider,
+                llm_provider=self._agent_provider(AgentNames.SCHEMA_ANALYST),
                 db_connection=self.db,
                 trace_collector=self.trace_collector,
+                schema_cache_dir=self.schema_cache_dir,
             ),
             AgentNames.REQUIREMENTS_ANALYST: RequirementsAgent(
-                llm_provider=self.llm_provider,
+                llm_provider=self._agent_provider(AgentNames.REQUIREMENTS_ANALYST),
                 trace_collector=self.trace_collector,
                 catalog=self.catalog,
             ),
             AgentNames.USE_CASE_EXPERT: UseCaseAgent(
-                llm_provider=self.llm_provider,
+                llm_provider=self._agent_provider(AgentNames.USE_CASE_EXPERT),
                 trace_collector=self.trace_collector,
                 catalog=self.catalog,
             ),
             AgentNames.TEMPLATE_ENGINEER: TemplateAgent(
-                llm_provider=self.llm_provider,
+                llm_provider=self._agent_provider(AgentNames.TEMPLATE_ENGINEER),
                 graph_name=self.graph_name,
                 core_collections=self.core_collections,
                 satellite_collections=self.satellite_collections,
@@ -127,18 +228,26 @@ class AgenticWorkflowRunner:
                 catalog=self.catalog,
             ),
             AgentNames.EXECUTION_SPECIALIST: ExecutionAgent(
-                llm_provider=self.llm_provider,
+                llm_provider=self._agent_provider(AgentNames.EXECUTION_SPECIALIST),
                 trace_collector=self.trace_collector,
                 catalog=self.catalog,
             ),
             AgentNames.REPORTING_SPECIALIST: ReportingAgent(
-                llm_provider=self.llm_provider,
+                llm_provider=self._agent_provider(AgentNames.REPORTING_SPECIALIST),
                 trace_collector=self.trace_collector,
                 catalog=self.catalog,
                 db_connection=self.db,
             ),
         }
 
+    def _agent_provider(self, agent_name: str):
+        """Get the LLM provider for an agent, wrapped in a cache if enabled."""
+        if self.llm_cache_dir is None:
+            return self.llm_provider
+        return CachingLLMProvider(
+            self.llm_provider, cache_dir=self.llm_cache_dir, namespace=agent_name
+        )
+
     def run(
         self,
         input_documents: Optional[List[Dict[str, Any]]] = None,
@@ -164,7 +273,7 @@ class AgenticWorkflowRunner:
             print("   📊 Tracing enabled")
         if self.enable_debug_mode:
             print("   🐛 Debug mode enabled")
-        print("=" * 70)
+        print(_BANNER)
         print()
 
         # Record workflow start
@@ -192,7 +301,7 @@ class AgenticWorkflowRunner:
             self.trace_collector.record_event(TraceEventType.WORKFLOW_END)
 
         print()
-        print("=" * 70)
+        print(_BANNER)
         print("🎉 Agentic Workflow Complete!")
         print()
 
@@ -238,7 +347,7 @@ class AgenticWorkflowRunner:
             print("   🐛 Debug mode enabled")
         if enable_parallelism:
             print("   ⚡ Parallel execution enabled")
-        print("=" * 70)
+        print(_BANNER)
         print()
 
         # Record workflow start
@@ -268,7 +377,7 @@ class AgenticWorkflowRunner:
             self.trace_collector.record_event(TraceEventType.WORKFLOW_END)
 
         print()
-        print("=" * 70)
+        print(_BANNER)
         print("🎉 Agentic Workflow Complete!")
         print()
 
@@ -279,29 +388,34 @@ class AgenticWorkflowRunner:
 
     def _print_summary(self, state: AgentState) -> None:
         """Print workflow summary."""
-        print("📊 Summary:")
-        print(f"   • Steps completed: {len(state.completed_steps)}")
-        print(f"   • Use cases: {len(state.use_cases)}")
-        print(f"   • Templates: {len(state.templates)}")
-        print(f"   • Executions: {len(state.execution_results)}")
-        print(f"   • Reports: {len(state.reports)}")
-        print(f"   • Messages exchanged: {len(state.messages)}")
-        print(f"   • Errors: {len(state.errors)}")
-        print()
+        lines = [
+            "📊 Summary:",
+            f"   • Steps completed: {len(state.completed_steps)}",
+            f"   • Use cases: {len(state.use_cases)}",
+            f"   • Templates: {len(state.templates)}",
+            f"   • Executions: {len(state.execution_results)}",
+            f"   • Reports: {len(state.reports)}",
+            f"   • Messages exchanged: {len(state.messages)}",
+            f"   • Errors: {len(state.errors)}",
+            "",
+        ]
 
         if state.reports:
-            print("📄 Generated Reports:")
+            lines.append("📄 Generated Reports:")
             for i, report in enumerate(state.reports, 1):
-                print(f"   {i}. {report.title}")
-                print(f"      • Insights: {len(report.insights)}")
-                print(f"      • Recommendations: {len(report.recommendations)}")
-        print()
+                lines.append(f"   {i}. {report.title}")
+                lines.append(f"      • Insights: {len(report.insights)}")
+                lines.append(f"      • Recommendations: {len(report.recommendations)}")
+        lines.append("")
 
         if state.errors:
-            print("⚠️  Errors encountered:")
+            lines.append("⚠️  Errors encountered:")
             for error in state.errors:
-                print(f"   • {error['agent']}: {error['error']}")
-            print()
+                lines.append(f"   • {error['agent']}: {error['error']}")
+            lines.append("")
+
+        # One write instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def get_agent_messages(self, state: AgentState) -> List[Dict[str, Any]]:
         """
@@ -323,14 +437,59 @@ class AgenticWorkflowRunner:
             state: Workflow state
             output_path: Output file path
         """
-        import json
         from pathlib import Path
 
         data = state.to_dict()
 
-        Path(output_path).write_text(json.dumps(data, indent=2, default=str))
+        Path(output_path).write_bytes(dumps_json(data, indent=True))
         print(f"💾 State exported to: {output_path}")
 
+    def export_state_ndjson(self, state: AgentState, output_dir: str) -> None:
+        """
+        Export workflow state to a directory, with messages as NDJSON.
+
+        Writes ``workflow.json`` (step/summary fields), ``results.json``
+        (use cases, templates, execution results and reports) and
+        ``messages.ndjson`` (one agent message per line), so the message log
+        can be streamed with :meth:`iter_exported_messages` instead of
+        loading one large document.
+
+        Args:
+            state: Workflow state
+            output_dir: Output directory path
+        """
+        from pathlib import Path
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        data = state.to_dict()
+        results = {key: data.pop(key, []) for key in _RESULT_KEYS}
+
+        (output_path / "workflow.json").write_bytes(dumps_json(data, indent=True))
+        (output_path / "results.json").write_bytes(dumps_json(results, indent=True))
+        with open(output_path / "messages.ndjson", "wb") as f:
+            for msg in state.messages:
+                f.write(dumps_json(msg.to_dict(), newline=True))
+
+        print(f"💾 State exported to: {output_path}")
+
+    @staticmethod
+    def iter_exported_messages(path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream agent messages from a ``messages.ndjson`` export.
+
+        Args:
+            path: Path to messages.ndjson
+
+        Yields:
+            One message dictionary per line
+        """
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield loads_json(line)
+
     def export_reports(self, state: AgentState, output_dir: str) -> None:
         """
         Export reports to markdown files.
@@ -348,51 +507,56 @@ class AgenticWorkflowRunner:
             print("⚠️  No reports to export")
             return
 
-        for i, report in enumerate(state.reports, 1):
-            # Generate filename from report title
-            safe_title = "".join(
-                c if c.isalnum() or c in (" ", "-", "_") else "_" for c in report.title
-            )
-            safe_title = safe_title.replace(" ", "_").lower()
-            filename = f"report_{i:02d}_{safe_title}.md"
+        rendered = [
+            _serialize_report(report, i) for i, report in enumerate(state.reports, 1)
+        ]
 
+        def _write(item):
+            filename, text = item
             filepath = output_path / filename
+            filepath.write_text(text)
+            return filepath
 
-            # Write report as markdown
-            with open(filepath, "w") as f:
-                f.write(f"# {report.title}\n\n")
-                f.write(f"**Generated:** {report.generated_at}\n\n")
-                f.write(f"## Summary\n\n{report.summary}\n\n")
-
-                if report.insights:
-                    f.write(f"## Insights ({len(report.insights)})\n\n")
-                    for j, insight in enumerate(report.insights, 1):
-                        f.write(f"### {j}. {insight.title}\n\n")
-                        f.write(f"{insight.description}\n\n")
-                        f.write(f"- **Type:** {insight.insight_type}\n")
-                        f.write(f"- **Confidence:** {insight.confidence:.0%}\n")
-                        if insight.business_impact:
-                            f.write(
-                                f"- **Business Impact:** {insight.business_impact}\n"
-                            )
-                        f.write("\n")
-
-                if report.recommendations:
-                    f.write(f"## Recommendations ({len(report.recommendations)})\n\n")
-                    for j, rec in enumerate(report.recommendations, 1):
-                        f.write(f"### {j}. {rec.title}\n\n")
-                        f.write(f"{rec.description}\n\n")
-                        f.write(f"- **Priority:** {rec.priority}\n")
-                        if hasattr(rec, "effort_estimate") and rec.effort_estimate:
-                            f.write(f"- **Effort:** {rec.effort_estimate}\n")
-                        if hasattr(rec, "expected_impact") and rec.expected_impact:
-                            f.write(f"- **Expected Impact:** {rec.expected_impact}\n")
-                        f.write("\n")
-
-            print(f"📄 Report {i} exported to: {filepath}")
+        # Rendering is cheap; overlap the per-file writes
+        with ThreadPoolExecutor(max_workers=min(8, len(rendered))) as pool:
+            for i, filepath in enumerate(pool.map(_write, rendered), 1):
+                print(f"📄 Report {i} exported to: {filepath}")
 
         print(f"\n✓ Exported {len(state.reports)} reports to {output_path}")
 
+    def export_reports_archive(self, state: AgentState, output_path: str) -> None:
+        """
+        Export reports as markdown files inside a single tar archive.
+
+        Same file names and content as :meth:`export_reports`, but written
+        through one open file instead of one file per report, which is
+        cheaper for large runs and convenient for backup or transfer.
+
+        Args:
+            state: Workflow state
+            output_path: Path of the .tar file to write
+        """
+        from pathlib import Path
+
+        if not state.reports:
+            print("⚠️  No reports to export")
+            return
+
+        archive_path = Path(output_path)
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        mtime = time.time()
+
+        with tarfile.open(archive_path, "w") as tar:
+            for i, report in enumerate(state.reports, 1):
+                filename, text = _serialize_report(report, i)
+                data = text.encode("utf-8")
+                info = tarfile.TarInfo(name=filename)
+                info.size = len(data)
+                info.mtime = mtime
+                tar.addfile(info, io.BytesIO(data))
+
+        print(f"✓ Exported {len(state.reports)} reports to {archive_path}")
+
     def export_trace(
         self, output_dir: str, formats: Optional[List[str]] = None
     ) -> None:
@@ -446,9 +610,9 @@ class AgenticWorkflowRunner:
         if trace.performance:
             perf = trace.performance
 
-            print("\n" + "=" * 70)
+            print(f"\n{_BANNER}")
             print("📊 Workflow Trace Summary")
-            print("=" * 70 + "\n")
+            print(f"{_BANNER}\n")
 
             print(f"Trace ID: {trace.trace_id}")
             print(f"Total Events: {len(trace.events)}")
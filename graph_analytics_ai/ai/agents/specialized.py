@@ -50,6 +50,7 @@ Your goal: Provide deep insights about graph structure to guide analytics."""
         llm_provider: LLMProvider,
         db_connection,
         trace_collector: Optional[Any] = None,
+        schema_cache_dir: Optional[str] = None,
     ):
         super().__init__(
             agent_type=AgentType.SCHEMA_ANALYSIS,
@@ -59,7 +60,11 @@ Your goal: Provide deep insights about graph structure to guide analytics."""
             trace_collector=trace_collector,
         )
         self.db = db_connection
-        self.extractor = SchemaExtractor(db_connection)
+        self.extractor = SchemaExtractor(
+            db_connection,
+            use_cache=schema_cache_dir is not None,
+            cache_dir=schema_cache_dir,
+        )
         self.analyzer = SchemaAnalyzer(llm_provider)
 
     @handle_agent_errors
@@ -1087,15 +1092,18 @@ Remember: Business stakeholders need insights they can act on immediately, not j
                 self.generator.industry = self.industry
 
         baseline_epoch_id = state.metadata.get("baseline_epoch_id")
-        reports = []
-        for i, result in enumerate(successful_results):
-            # Add use case-specific context if available
+
+        # Add use case-specific context if available
+        contexts = []
+        for i in range(len(successful_results)):
             use_case_context = context.copy()
             if i < len(state.use_cases):
                 use_case_context["use_case"] = context["use_cases"][i]
+            contexts.append(use_case_context)
 
-            report = self.generator.generate_report(result, context=use_case_context)
+        reports = self.generator.generate_reports(successful_results, contexts)
 
+        for result, report in zip(successful_results, reports):
             # Baseline comparison (best-effort): prepend delta insights when available
             if baseline_epoch_id and self.catalog and self.db:
                 try:
@@ -1122,8 +1130,6 @@ Remember: Business stakeholders need insights they can act on immediately, not j
                 except Exception:
                     pass
 
-            reports.append(report)
-
         state.reports = reports
         state.mark_step_complete("reporting")
 
@@ -5,9 +5,13 @@ Executes GAE analysis templates using the existing GAEOrchestrator.
 Provides high-level interface with monitoring and result collection.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Optional, Dict, Any
+import copy
+import json
 import logging
+import threading
 
 from ...gae_orchestrator import GAEOrchestrator, AnalysisConfig
 from ..templates.models import AnalysisTemplate
@@ -85,6 +89,19 @@ class AnalysisExecutor:
         self.config = config or ExecutionConfig()
         self.orchestrator = orchestrator or GAEOrchestrator()
         self.job_history: List[AnalysisJob] = []
+        # Orchestrator results by job ID; created up front so background
+        # submissions from submit_template() share one dict
+        self._analysis_results: Dict[str, Any] = {}
+        # Successful results by template config, when config.cache_results
+        self._result_cache: Dict[str, ExecutionResult] = {}
+        # Created on first submit_template() call
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # GAEOrchestrator.run_analysis is not re-entrant (it manages one
+        # engine and cleans up existing ones), so runs are serialized
+        self._orchestrator_lock = threading.Lock()
+        # Database connection for result collection, opened on first use
+        self._db = None
+        self._db_lock = threading.Lock()
 
         # Catalog integration (optional)
         self.catalog = catalog if CATALOG_AVAILABLE else None
@@ -119,6 +136,14 @@ class AnalysisExecutor:
         Returns:
             ExecutionResult with job info and results
         """
+        cache_key = None
+        if wait and self.config.cache_results:
+            cache_key = self._cache_key(template)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                # Callers get their own job/result objects to modify
+                return copy.deepcopy(cached)
+
         # Convert template to AnalysisConfig
         analysis_config = self._template_to_config(template)
 
@@ -187,7 +212,7 @@ class AnalysisExecutor:
                         # Log but don't fail execution if tracking fails
                         logger.warning(f"Failed to track execution in catalog: {e}")
 
-                return ExecutionResult(
+                result = ExecutionResult(
                     job=job,
                     success=True,
                     results=results,
@@ -196,6 +221,9 @@ class AnalysisExecutor:
                         "result_count": job.result_count,
                     },
                 )
+                if cache_key is not None:
+                    self._result_cache[cache_key] = copy.deepcopy(result)
+                return result
             else:
                 job.status = ExecutionStatus.FAILED
                 job.completed_at = datetime.now()
@@ -217,12 +245,17 @@ class AnalysisExecutor:
         """
         Execute multiple templates.
 
+        Templates always run one at a time: GAEOrchestrator.run_analysis
+        manages a single engine per orchestrator and cleans up existing
+        engines before starting, so concurrent runs would stop each other's
+        engines.
+
         Args:
             templates: Templates to execute
-            parallel: Whether to run in parallel (not yet implemented)
+            parallel: Accepted for compatibility; execution is sequential
 
         Returns:
-            List of execution results
+            List of execution results, in template order
         """
         results = []
 
@@ -239,6 +272,50 @@ class AnalysisExecutor:
 
         return results
 
+    def submit_template(self, template: AnalysisTemplate, **kwargs) -> Future:
+        """
+        Start executing a template in the background.
+
+        Lets callers dispatch the next template while they are still
+        processing the previous result, e.g. generating its report.
+        Submitted templates run one at a time, in submission order.
+
+        Args:
+            template: Template to execute
+            **kwargs: Passed to execute_template (epoch_id, requirements_id, ...)
+
+        Returns:
+            Future resolving to the template's ExecutionResult
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="gae-executor"
+            )
+        return self._pool.submit(self.execute_template, template, True, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Release the background pool used by submit_template.
+
+        Args:
+            wait: Whether to wait for submitted templates to finish
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+    def clear_cache(self) -> None:
+        """Forget cached results so identical templates run again."""
+        self._result_cache.clear()
+
+    @staticmethod
+    def _cache_key(template: AnalysisTemplate) -> str:
+        """Build a result-cache key from the template's analysis config."""
+        config = template.to_analysis_config()
+        # The template name does not affect what the cluster computes
+        config.pop("name", None)
+        return json.dumps(config, sort_keys=True, default=str)
+
     def get_job_status(self, job_id: str) -> Optional[ExecutionStatus]:
         """
         Get current status of a job.
@@ -333,12 +410,10 @@ class AnalysisExecutor:
             Job ID
         """
         # Actually run the analysis using GAEOrchestrator
-        result = self.orchestrator.run_analysis(config)
+        with self._orchestrator_lock:
+            result = self.orchestrator.run_analysis(config)
 
         # Store the result for later retrieval
-        if not hasattr(self, "_analysis_results"):
-            self._analysis_results = {}
-
         # Use the result's job_id if available, otherwise generate one
         job_id = result.job_id if result.job_id else str(__import__("uuid").uuid4())
         self._analysis_results[job_id] = result
@@ -356,10 +431,7 @@ class AnalysisExecutor:
             True if successful, False if failed
         """
         # Get the actual analysis result
-        if (
-            not hasattr(self, "_analysis_results")
-            or job.job_id not in self._analysis_results
-        ):
+        if job.job_id not in self._analysis_results:
             job.error_message = "Job result not found"
             return False
 
@@ -382,6 +454,23 @@ class AnalysisExecutor:
             job.error_message = f"Unexpected status: {result.status}"
             return False
 
+    def _get_db(self):
+        """
+        Get the database connection used to read result collections.
+
+        Connecting verifies credentials and lists databases, so the
+        connection is opened once and shared by every job this executor
+        collects, including ones running in the submit_template() pool.
+        It is taken from the process-wide connection cache, so it is shared
+        with the workflow runner when both use the same settings.
+        """
+        with self._db_lock:
+            if self._db is None:
+                from ...db_connection import get_db_connection
+
+                self._db = get_db_connection(reuse=True)
+            return self._db
+
     def _collect_results(self, job: AnalysisJob) -> List[Dict[str, Any]]:
         """
         Collect results from completed job.
@@ -406,10 +495,7 @@ class AnalysisExecutor:
                 if result.documents_updated:
                     job.result_count = result.documents_updated
 
-            # Get database connection
-            from ...db_connection import get_db_connection
-
-            db = get_db_connection()
+            db = self._get_db()
 
             # Check if result collection exists
             if not db.has_collection(job.result_collection):
@@ -434,7 +520,10 @@ class AnalysisExecutor:
             )
 
             selection_desc = effective_selection.strategy.value
-            if effective_selection.strategy.value == "top_k" and effective_selection.sort_field:
+            if (
+                effective_selection.strategy.value == "top_k"
+                and effective_selection.sort_field
+            ):
                 direction = "desc" if effective_selection.sort_desc else "asc"
                 selection_desc = f"top_k({effective_selection.sort_field} {direction})"
             elif (
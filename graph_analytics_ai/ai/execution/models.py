@@ -182,6 +182,15 @@ class ExecutionConfig:
     store_job_history: bool = True
     """Whether to store job execution history."""
 
+    cache_results: bool = False
+    """
+    Whether to reuse results of identical templates within this executor.
+
+    Templates are matched on their full analysis config (algorithm, graph,
+    parameters, collections, engine size), so re-running the same template
+    returns the earlier successful result without submitting a new job.
+    """
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -195,6 +204,7 @@ class ExecutionConfig:
             "retry_on_failure": self.retry_on_failure,
             "max_retries": self.max_retries,
             "store_job_history": self.store_job_history,
+            "cache_results": self.cache_results,
         }
 
 
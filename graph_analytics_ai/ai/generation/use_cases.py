@@ -25,6 +25,25 @@ class UseCaseType(Enum):
     SIMILARITY = "similarity"
 
 
+# Algorithm-name substrings mapped to use case types, checked in order.
+_ALGORITHM_TYPE_KEYWORDS = (
+    ("pagerank", UseCaseType.CENTRALITY),
+    ("betweenness", UseCaseType.CENTRALITY),
+    ("centrality", UseCaseType.CENTRALITY),
+    ("community", UseCaseType.COMMUNITY),
+    ("cluster", UseCaseType.COMMUNITY),
+    ("modularity", UseCaseType.COMMUNITY),
+    ("propagation", UseCaseType.COMMUNITY),
+    ("shortest", UseCaseType.PATHFINDING),
+    ("path", UseCaseType.PATHFINDING),
+    ("dijkstra", UseCaseType.PATHFINDING),
+    ("pattern", UseCaseType.PATTERN),
+    ("motif", UseCaseType.PATTERN),
+    ("anomaly", UseCaseType.ANOMALY),
+    ("outlier", UseCaseType.ANOMALY),
+)
+
+
 @dataclass
 class UseCase:
     """Represents a single graph analytics use case."""
@@ -295,28 +314,14 @@ class UseCaseGenerator:
     def _map_algorithm_to_type(self, algorithm: str) -> UseCaseType:
         """Map algorithm name to use case type."""
         alg_lower = algorithm.lower()
-
-        if (
-            "pagerank" in alg_lower
-            or "betweenness" in alg_lower
-            or "centrality" in alg_lower
-        ):
-            return UseCaseType.CENTRALITY
-        elif (
-            "community" in alg_lower
-            or "cluster" in alg_lower
-            or "modularity" in alg_lower
-            or "propagation" in alg_lower
-        ):
-            return UseCaseType.COMMUNITY
-        elif "shortest" in alg_lower or "path" in alg_lower or "dijkstra" in alg_lower:
-            return UseCaseType.PATHFINDING
-        elif "pattern" in alg_lower or "motif" in alg_lower:
-            return UseCaseType.PATTERN
-        elif "anomaly" in alg_lower or "outlier" in alg_lower:
-            return UseCaseType.ANOMALY
-
-        return UseCaseType.CENTRALITY
+        return next(
+            (
+                use_case_type
+                for keyword, use_case_type in _ALGORITHM_TYPE_KEYWORDS
+                if keyword in alg_lower
+            ),
+            UseCaseType.CENTRALITY,
+        )
 
     def _extract_data_needs(
         self, text: str, extracted: ExtractedRequirements
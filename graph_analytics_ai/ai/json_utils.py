@@ -0,0 +1,120 @@
+"""
+JSON serialization and cache-file helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+encoder otherwise, or for payloads orjson rejects (e.g. integers wider than
+64 bits). The fallback encodes datetimes, enums and dataclasses the way
+orjson does, so both paths produce equivalent JSON.
+"""
+
+import dataclasses
+import json
+import os
+import tempfile
+from datetime import date, datetime, time
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> Any:
+    """Fallback encoder for the types orjson serializes natively."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return str(value)
+
+
+def dumps_json(
+    data: Any, indent: bool = False, sort_keys: bool = False, newline: bool = False
+) -> bytes:
+    """
+    Serialize data to UTF-8 JSON.
+
+    Datetimes are written in ISO 8601, enums as their value, dataclasses as
+    objects, and other values JSON cannot represent (paths, ...) with str().
+
+    Args:
+        data: Data to serialize
+        indent: Indent nested values by two spaces
+        sort_keys: Sort dictionary keys, for stable output
+        newline: Append a trailing newline (for NDJSON records)
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        try:
+            return orjson.dumps(data, default=str, option=option)
+        except TypeError:
+            pass
+
+    text = json.dumps(
+        data,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        default=_default,
+        ensure_ascii=False,
+    )
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def loads_json(data: Any) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text as str or bytes
+
+    Returns:
+        Decoded value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """
+    Replace ``path`` with ``text`` through a uniquely named temporary file.
+
+    Concurrent writers (threads or processes) never share a temporary file,
+    and readers see either the old or the new complete content.
+
+    Args:
+        path: File to write; its directory must exist
+        text: New file content
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
@@ -40,6 +40,10 @@ from .factory import create_llm_provider, get_default_provider
 
 from .openrouter import OpenRouterProvider
 
+from .cache import CachingLLMProvider
+
+from .null import NullLLMProvider
+
 
 __all__ = [
     # Base classes
@@ -55,4 +59,6 @@ __all__ = [
     "get_default_provider",
     # Providers
     "OpenRouterProvider",
+    "CachingLLMProvider",
+    "NullLLMProvider",
 ]
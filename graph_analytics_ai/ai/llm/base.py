@@ -8,6 +8,7 @@ ensuring a consistent interface regardless of the underlying provider
 
 import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
@@ -153,6 +154,52 @@ class LLMProvider(ABC):
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, lambda: self.generate(prompt, **kwargs))
 
+    def generate_batch(
+        self, prompts: List[str], max_workers: int = 8, **kwargs
+    ) -> List[LLMResponse]:
+        """
+        Generate text for several independent prompts in one round.
+
+        Default implementation issues the requests concurrently from a thread
+        pool, so N prompts cost roughly one round-trip of latency instead of N.
+        Providers with a native batch endpoint should override this.
+
+        Args:
+            prompts: Prompts to generate from.
+            max_workers: Maximum number of concurrent requests.
+            **kwargs: Additional generation parameters.
+
+        Returns:
+            LLMResponse for each prompt, in the same order.
+
+        Raises:
+            LLMProviderError: If any generation fails.
+        """
+        if not prompts:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as pool:
+            return list(pool.map(lambda p: self.generate(p, **kwargs), prompts))
+
+    async def generate_batch_async(
+        self, prompts: List[str], **kwargs
+    ) -> List[LLMResponse]:
+        """
+        Generate text for several independent prompts concurrently (async version).
+
+        Args:
+            prompts: Prompts to generate from.
+            **kwargs: Additional generation parameters.
+
+        Returns:
+            LLMResponse for each prompt, in the same order.
+
+        Raises:
+            LLMProviderError: If any generation fails.
+        """
+        return list(
+            await asyncio.gather(*(self.generate_async(p, **kwargs) for p in prompts))
+        )
+
     @abstractmethod
     def generate_structured(
         self, prompt: str, schema: Dict[str, Any], **kwargs
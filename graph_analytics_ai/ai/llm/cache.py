@@ -0,0 +1,185 @@
+"""
+On-disk response cache for LLM providers.
+
+Wraps any LLMProvider so that identical requests are answered from disk
+instead of re-invoking the model. Responses are stored as JSON files under
+``{cache_dir}/{namespace}/{sha256}.json``; the namespace is usually the
+name of the agent or component making the call, so the linear and agentic
+workflows can share entries when they run the same step over the same input.
+Entries read or written by a wrapper are also kept in memory, so repeated
+requests within one process skip the disk as well.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..json_utils import write_text_atomic
+from .base import LLMProvider, LLMResponse
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "gaai"
+
+
+class CachingLLMProvider(LLMProvider):
+    """
+    LLM provider wrapper that memoizes responses on disk.
+
+    The cache key covers the model, sampling parameters and the full
+    request payload, so a hit is only returned for byte-identical requests.
+
+    Example:
+        >>> from graph_analytics_ai.ai.llm import create_llm_provider
+        >>> from graph_analytics_ai.ai.llm.cache import CachingLLMProvider
+        >>>
+        >>> provider = CachingLLMProvider(
+        ...     create_llm_provider(), namespace="SchemaAnalyst"
+        ... )
+        >>> provider.generate("Describe this schema...")  # calls the LLM
+        >>> provider.generate("Describe this schema...")  # served from disk
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache_dir: Optional[str] = None,
+        namespace: str = "default",
+    ):
+        """
+        Initialize caching wrapper.
+
+        Args:
+            provider: Provider to delegate cache misses to.
+            cache_dir: Root cache directory (default: ~/.cache/gaai).
+            namespace: Subdirectory for this caller's entries (e.g. agent name).
+        """
+        super().__init__(provider.config)
+        self.provider = provider
+        self.namespace = namespace
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR) / namespace
+        self._memory: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, kind: str, payload: Any, kwargs: Dict[str, Any]) -> str:
+        """Build a stable SHA-256 key for a request."""
+        request = {
+            "kind": kind,
+            "model": self.config.model,
+            "max_tokens": self.config.max_tokens,
+            "temperature": self.config.temperature,
+            "payload": payload,
+            "kwargs": kwargs,
+        }
+        canonical = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _load(self, key: str) -> Optional[Any]:
+        """Read a cached entry from memory, then disk, or None on miss."""
+        text = self._memory.get(key)
+        try:
+            if text is None:
+                text = (self.cache_dir / f"{key}.json").read_text()
+            data = json.loads(text)
+        except (OSError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+        # Keep the serialized form so every hit returns a fresh object
+        self._memory[key] = text
+        self.hits += 1
+        return data
+
+    def _save(self, key: str, data: Any) -> None:
+        """Write an entry atomically so concurrent readers never see partial JSON."""
+        text = json.dumps(data, default=str)
+        self._memory[key] = text
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(self.cache_dir / f"{key}.json", text)
+        except OSError:
+            # Caching is best effort; the response is still returned
+            pass
+
+    def _cached_response(self, key: str) -> Optional[LLMResponse]:
+        data = self._load(key)
+        return LLMResponse(**data) if data is not None else None
+
+    def generate(self, prompt: str, **kwargs) -> LLMResponse:
+        """Generate text, serving identical prompts from the cache."""
+        key = self._key("generate", prompt, kwargs)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+
+        response = self.provider.generate(prompt, **kwargs)
+        self._save(key, asdict(response))
+        return response
+
+    async def generate_async(self, prompt: str, **kwargs) -> LLMResponse:
+        """Generate text (async), serving identical prompts from the cache."""
+        key = self._key("generate", prompt, kwargs)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.generate_async(prompt, **kwargs)
+        self._save(key, asdict(response))
+        return response
+
+    def generate_structured(
+        self, prompt: str, schema: Dict[str, Any], **kwargs
+    ) -> Dict[str, Any]:
+        """Generate structured output, served from the cache on a hit."""
+        key = self._key("structured", {"prompt": prompt, "schema": schema}, kwargs)
+        cached = self._load(key)
+        if cached is not None:
+            return cached
+
+        result = self.provider.generate_structured(prompt, schema, **kwargs)
+        self._save(key, result)
+        return result
+
+    async def generate_structured_async(
+        self, prompt: str, schema: Dict[str, Any], **kwargs
+    ) -> Dict[str, Any]:
+        """Generate structured output (async), served from the cache on a hit."""
+        key = self._key("structured", {"prompt": prompt, "schema": schema}, kwargs)
+        cached = self._load(key)
+        if cached is not None:
+            return cached
+
+        result = await self.provider.generate_structured_async(prompt, schema, **kwargs)
+        self._save(key, result)
+        return result
+
+    def chat(self, messages: List[Dict[str, str]], **kwargs) -> LLMResponse:
+        """Chat completion, serving identical conversations from the cache."""
+        key = self._key("chat", messages, kwargs)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+
+        response = self.provider.chat(messages, **kwargs)
+        self._save(key, asdict(response))
+        return response
+
+    async def chat_async(self, messages: List[Dict[str, str]], **kwargs) -> LLMResponse:
+        """Chat completion (async), serving identical conversations from the cache."""
+        key = self._key("chat", messages, kwargs)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.chat_async(messages, **kwargs)
+        self._save(key, asdict(response))
+        return response
+
+    def estimate_cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        """Delegate cost estimation to the wrapped provider."""
+        return self.provider.estimate_cost(prompt_tokens, completion_tokens)
+
+    @property
+    def name(self) -> str:
+        """Name of the wrapped provider."""
+        return self.provider.name
@@ -0,0 +1,48 @@
+"""
+No-op LLM provider.
+
+Used where a provider is required by the API but no model should be
+called, e.g. report generation with ``use_llm_interpretation=False`` in
+examples and tests that must run without API keys.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .base import LLMConfig, LLMProvider, LLMResponse
+
+
+class NullLLMProvider(LLMProvider):
+    """
+    LLM provider that never calls a model and returns empty output.
+
+    Example:
+        >>> from graph_analytics_ai.ai.llm import NullLLMProvider
+        >>> from graph_analytics_ai.ai.reporting import ReportGenerator
+        >>>
+        >>> generator = ReportGenerator(
+        ...     llm_provider=NullLLMProvider(), use_llm_interpretation=False
+        ... )
+    """
+
+    def __init__(self, config: Optional[LLMConfig] = None):
+        """
+        Initialize the null provider.
+
+        Args:
+            config: Optional configuration (a placeholder is used by default).
+        """
+        super().__init__(config or LLMConfig(api_key="", model="null"))
+
+    def generate(self, prompt: str, **kwargs) -> LLMResponse:
+        """Return an empty response."""
+        return LLMResponse(content="", model=self.config.model)
+
+    def generate_structured(
+        self, prompt: str, schema: Dict[str, Any], **kwargs
+    ) -> Dict[str, Any]:
+        """Return an empty structured result."""
+        return {}
+
+    def chat(self, messages: List[Dict[str, str]], **kwargs) -> LLMResponse:
+        """Return an empty response."""
+        return LLMResponse(content="", model=self.config.model)
@@ -6,17 +6,18 @@ https://openrouter.ai/
 """
 
 import asyncio
+import importlib.util
 import json
 import time
 import requests
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 
-try:
+if TYPE_CHECKING:
     import aiohttp
 
-    AIOHTTP_AVAILABLE = True
-except ImportError:
-    AIOHTTP_AVAILABLE = False
+# aiohttp is only needed for the async path and is slow to import, so it is
+# located here and imported on first async request
+AIOHTTP_AVAILABLE = importlib.util.find_spec("aiohttp") is not None
 
 from .base import (
     LLMProvider,
@@ -38,6 +39,9 @@ OPENROUTER_PRICING = {
     "openai/gpt-3.5-turbo": {"input": 0.50, "output": 1.50},
 }
 
+# Models that only cache prompt prefixes marked with cache_control
+PROMPT_CACHING_MODEL_PREFIXES = ("anthropic/", "claude")
+
 
 class OpenRouterProvider(LLMProvider):
     """
@@ -79,7 +83,7 @@ class OpenRouterProvider(LLMProvider):
                 "X-Title": "Graph Analytics AI",
             }
         )
-        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_session: Optional["aiohttp.ClientSession"] = None
 
     def __del__(self):
         """
@@ -102,10 +106,57 @@ class OpenRouterProvider(LLMProvider):
                 pass
 
     def generate(self, prompt: str, **kwargs) -> LLMResponse:
-        """Generate text from a prompt using OpenRouter."""
-        messages = [{"role": "user", "content": prompt}]
+        """
+        Generate text from a prompt using OpenRouter.
+
+        Pass ``system_prompt`` to send a static instruction prefix as a
+        separate system message, which lets the provider cache it.
+        """
+        messages = self._build_messages(prompt, kwargs.pop("system_prompt", None))
         return self.chat(messages, **kwargs)
 
+    @staticmethod
+    def _build_messages(
+        prompt: str, system_prompt: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Build chat messages for a single prompt with optional system prefix."""
+        messages: List[Dict[str, Any]] = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _apply_prompt_caching(
+        self, messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Mark system messages as cacheable for models that need explicit breakpoints.
+
+        Anthropic models only cache prefixes tagged with ``cache_control``;
+        OpenAI and Gemini models cache repeated prefixes automatically, so
+        their messages are sent unchanged.
+        """
+        if not self.config.model.lower().startswith(PROMPT_CACHING_MODEL_PREFIXES):
+            return messages
+
+        cached = []
+        for message in messages:
+            if message.get("role") == "system" and isinstance(
+                message.get("content"), str
+            ):
+                message = {
+                    **message,
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": message["content"],
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
+                }
+            cached.append(message)
+        return cached
+
     def generate_structured(
         self, prompt: str, schema: Dict[str, Any], **kwargs
     ) -> Dict[str, Any]:
@@ -147,7 +198,7 @@ Return only the JSON, no additional text."""
         # Merge kwargs with config
         params = {
             "model": self.config.model,
-            "messages": messages,
+            "messages": self._apply_prompt_caching(messages),
             "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
             "temperature": kwargs.get("temperature", self.config.temperature),
         }
@@ -180,7 +231,7 @@ Return only the JSON, no additional text."""
 
     async def generate_async(self, prompt: str, **kwargs) -> LLMResponse:
         """Generate text from a prompt using OpenRouter (async version)."""
-        messages = [{"role": "user", "content": prompt}]
+        messages = self._build_messages(prompt, kwargs.pop("system_prompt", None))
         return await self.chat_async(messages, **kwargs)
 
     async def generate_structured_async(
@@ -228,7 +279,7 @@ Return only the JSON, no additional text."""
         # Merge kwargs with config
         params = {
             "model": self.config.model,
-            "messages": messages,
+            "messages": self._apply_prompt_caching(messages),
             "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
             "temperature": kwargs.get("temperature", self.config.temperature),
         }
@@ -266,6 +317,8 @@ Return only the JSON, no additional text."""
                 "aiohttp is required for async requests. Install with: pip install aiohttp"
             )
 
+        import aiohttp
+
         url = f"{self.BASE_URL}/chat/completions"
 
         # Get or create async session
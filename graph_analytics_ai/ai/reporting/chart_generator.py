@@ -6,17 +6,33 @@ Creates interactive visualizations using Plotly for different graph algorithms.
 
 from typing import List, Dict, Any
 from collections import Counter
+import importlib.util
 import logging
 
-try:
-    import plotly.graph_objects as go
-    from plotly.subplots import make_subplots
-
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+# Plotly is slow to import, so only its presence is checked here; the
+# modules are imported when the first ChartGenerator is created
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+if not PLOTLY_AVAILABLE:
     logging.warning("Plotly not available. Install with: pip install plotly")
 
+go = None
+make_subplots = None
+
+
+def _import_plotly() -> None:
+    """Import the Plotly modules used by ChartGenerator (once)."""
+    global go, make_subplots
+    if go is None:
+        import plotly.graph_objects as graph_objects
+        from plotly.subplots import make_subplots as subplots
+
+        go, make_subplots = graph_objects, subplots
+
+
+def _group_sizes(results: List[Dict[str, Any]], field: str) -> Counter:
+    """Count result rows per value of ``field``, skipping rows without it."""
+    return Counter(r[field] for r in results if field in r)
+
 
 class ChartGenerator:
     """
@@ -47,6 +63,7 @@ class ChartGenerator:
             raise ImportError(
                 "Plotly is required for chart generation. Install with: pip install plotly"
             )
+        _import_plotly()
 
         self.theme = theme
         self.logger = logging.getLogger(__name__)
@@ -107,7 +124,7 @@ class ChartGenerator:
 
         fig1.update_xaxes(tickangle=45)
         charts["top_influencers"] = fig1.to_html(
-            include_plotlyjs="cdn", div_id="pagerank-top"
+            full_html=False, include_plotlyjs="cdn", div_id="pagerank-top"
         )
 
         # Chart 2: Distribution
@@ -135,7 +152,7 @@ class ChartGenerator:
             fig2.update_xaxes(type="log", title="PageRank Score (log scale)")
 
         charts["distribution"] = fig2.to_html(
-            include_plotlyjs=False, div_id="pagerank-dist"
+            full_html=False, include_plotlyjs=False, div_id="pagerank-dist"
         )
 
         # Chart 3: Cumulative influence
@@ -180,7 +197,7 @@ class ChartGenerator:
         )
 
         charts["cumulative"] = fig3.to_html(
-            include_plotlyjs=False, div_id="pagerank-cumulative"
+            full_html=False, include_plotlyjs=False, div_id="pagerank-cumulative"
         )
 
         return charts
@@ -206,16 +223,17 @@ class ChartGenerator:
         charts = {}
 
         # Calculate component sizes
-        components = [r.get("component", "") for r in results if "component" in r]
-        if not components:
+        component_sizes = _group_sizes(results, "component")
+        if not component_sizes:
             self.logger.warning("No component data found in results")
             return charts
 
-        component_sizes = Counter(components)
-        sorted_components = component_sizes.most_common()
+        # Sizes only; ranked (label, size) pairs are built for the top N alone
+        sizes = sorted(component_sizes.values(), reverse=True)
+        num_components = len(sizes)
 
         # Chart 1: Top N Largest Components
-        top_components = sorted_components[:top_n]
+        top_components = component_sizes.most_common(top_n)
 
         fig1 = go.Figure()
         fig1.add_trace(
@@ -244,12 +262,10 @@ class ChartGenerator:
         )
 
         charts["top_components"] = fig1.to_html(
-            include_plotlyjs="cdn", div_id="wcc-top"
+            full_html=False, include_plotlyjs="cdn", div_id="wcc-top"
         )
 
         # Chart 2: Size Distribution (histogram)
-        sizes = [size for _, size in sorted_components]
-
         fig2 = go.Figure()
         fig2.add_trace(
             go.Histogram(
@@ -270,41 +286,29 @@ class ChartGenerator:
         )
 
         # Use log scale for both axes if highly skewed
-        if (
-            len(sorted_components) > 100
-            and sorted_components[0][1] > sorted_components[-1][1] * 100
-        ):
+        if num_components > 100 and sizes[0] > sizes[-1] * 100:
             fig2.update_xaxes(type="log")
             fig2.update_yaxes(type="log")
 
         charts["size_distribution"] = fig2.to_html(
-            include_plotlyjs=False, div_id="wcc-dist"
+            full_html=False, include_plotlyjs=False, div_id="wcc-dist"
         )
 
         # Chart 3: Connectivity Overview (pie/donut chart)
-        sorted_components[0][1] if sorted_components else 0
-        len(results)
+        top_5 = component_sizes.most_common(5)
+        top_5_sizes = [size for _, size in top_5]
+        top_5_labels = [
+            f"Component {i+1}<br>({size:,} nodes)" for i, (_, size) in enumerate(top_5)
+        ]
 
         # Group smaller components
-        if len(sorted_components) > 5:
-            top_5_sizes = [size for _, size in sorted_components[:5]]
-            top_5_labels = [
-                f"Component {i+1}<br>({size:,} nodes)"
-                for i, (_, size) in enumerate(sorted_components[:5])
-            ]
-
-            other_size = sum(size for _, size in sorted_components[5:])
+        if num_components > 5:
+            other_size = sum(sizes) - sum(top_5_sizes)
             if other_size > 0:
                 top_5_sizes.append(other_size)
                 top_5_labels.append(
-                    f"Other {len(sorted_components) - 5}<br>Components<br>({other_size:,} nodes)"
+                    f"Other {num_components - 5}<br>Components<br>({other_size:,} nodes)"
                 )
-        else:
-            top_5_sizes = [size for _, size in sorted_components]
-            top_5_labels = [
-                f"Component {i+1}<br>({size:,} nodes)"
-                for i, (_, size) in enumerate(sorted_components)
-            ]
 
         fig3 = go.Figure()
         fig3.add_trace(
@@ -334,7 +338,7 @@ class ChartGenerator:
             showlegend=True,
             annotations=[
                 dict(
-                    text=f"{len(sorted_components)}<br>Components",
+                    text=f"{num_components}<br>Components",
                     x=0.5,
                     y=0.5,
                     font_size=20,
@@ -344,7 +348,7 @@ class ChartGenerator:
         )
 
         charts["connectivity"] = fig3.to_html(
-            include_plotlyjs=False, div_id="wcc-connectivity"
+            full_html=False, include_plotlyjs=False, div_id="wcc-connectivity"
         )
 
         return charts
@@ -413,7 +417,7 @@ class ChartGenerator:
 
         fig1.update_xaxes(tickangle=45)
         charts["top_bridges"] = fig1.to_html(
-            include_plotlyjs="cdn", div_id="betweenness-top"
+            full_html=False, include_plotlyjs="cdn", div_id="betweenness-top"
         )
 
         # Chart 2: Distribution
@@ -443,7 +447,7 @@ class ChartGenerator:
                 fig2.update_xaxes(type="log")
 
         charts["distribution"] = fig2.to_html(
-            include_plotlyjs=False, div_id="betweenness-dist"
+            full_html=False, include_plotlyjs=False, div_id="betweenness-dist"
         )
 
         return charts
@@ -468,16 +472,13 @@ class ChartGenerator:
         charts = {}
 
         # Calculate community sizes
-        communities = [r.get("community", "") for r in results if "community" in r]
-        if not communities:
+        community_sizes = _group_sizes(results, "community")
+        if not community_sizes:
             self.logger.warning("No community data found in results")
             return charts
 
-        community_sizes = Counter(communities)
-        sorted_communities = community_sizes.most_common()
-
         # Chart 1: Top N Communities
-        top_communities = sorted_communities[:top_n]
+        top_communities = community_sizes.most_common(top_n)
 
         fig1 = go.Figure()
         fig1.add_trace(
@@ -501,11 +502,11 @@ class ChartGenerator:
         )
 
         charts["top_communities"] = fig1.to_html(
-            include_plotlyjs="cdn", div_id="community-top"
+            full_html=False, include_plotlyjs="cdn", div_id="community-top"
         )
 
         # Chart 2: Size Distribution
-        sizes = [size for _, size in sorted_communities]
+        sizes = sorted(community_sizes.values(), reverse=True)
 
         fig2 = go.Figure()
         fig2.add_trace(
@@ -527,7 +528,7 @@ class ChartGenerator:
         )
 
         charts["size_distribution"] = fig2.to_html(
-            include_plotlyjs=False, div_id="community-dist"
+            full_html=False, include_plotlyjs=False, div_id="community-dist"
         )
 
         return charts
@@ -599,7 +600,9 @@ class ChartGenerator:
 
         fig.update_layout(height=200, template=self.theme, showlegend=False)
 
-        return fig.to_html(include_plotlyjs=False, div_id="metrics-summary")
+        return fig.to_html(
+            full_html=False, include_plotlyjs=False, div_id="metrics-summary"
+        )
 
     def _format_node_id(self, node_id: str, max_length: int = 20) -> str:
         """
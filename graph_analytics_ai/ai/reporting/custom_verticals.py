@@ -27,14 +27,13 @@ def load_custom_vertical(project_root: Path) -> Optional[Dict[str, Any]]:
     """
     vertical_path = project_root / ".graph-analytics" / "industry_vertical.json"
     
-    if not vertical_path.exists():
-        logger.debug(f"No custom vertical found at {vertical_path}")
-        return None
-    
     try:
         vertical_data = json.loads(vertical_path.read_text())
         logger.info(f"Loaded custom vertical: {vertical_data['metadata']['display_name']}")
         return vertical_data
+    except FileNotFoundError:
+        logger.debug(f"No custom vertical found at {vertical_path}")
+        return None
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse custom vertical JSON: {e}")
         return None
@@ -65,14 +64,13 @@ def load_platform_custom_vertical(industry_name: str) -> Optional[Dict[str, Any]
     
     vertical_path = verticals_dir / f"{industry_name}.json"
     
-    if not vertical_path.exists():
-        logger.debug(f"No platform custom vertical found: {industry_name}")
-        return None
-    
     try:
         vertical_data = json.loads(vertical_path.read_text())
         logger.info(f"Loaded platform custom vertical: {vertical_data['metadata']['display_name']}")
         return vertical_data
+    except FileNotFoundError:
+        logger.debug(f"No platform custom vertical found: {industry_name}")
+        return None
     except Exception as e:
         logger.error(f"Error loading platform custom vertical {industry_name}: {e}")
         return None
@@ -4,9 +4,13 @@ Report generator for GAE analysis results.
 Generates actionable intelligence reports with insights and recommendations.
 """
 
+import hashlib
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
+from ..json_utils import dumps_json
 from ..llm.base import LLMProvider
 from ..llm.factory import create_llm_provider
 from ..execution.models import ExecutionResult, AnalysisJob
@@ -21,6 +25,20 @@ from .models import (
 )
 from .algorithm_insights import detect_patterns
 
+# Formatted reports kept per generator, keyed by report content and format
+_FORMAT_CACHE_SIZE = 128
+
+
+def _report_fingerprint(report: AnalysisReport) -> bytes:
+    """Stable digest of a report's content, used to key formatted output."""
+    canonical = dumps_json(report.to_dict(), sort_keys=True)
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+
+def _report_to_json(report: AnalysisReport) -> str:
+    """Serialize a report to indented JSON."""
+    return dumps_json(report.to_dict(), indent=True).decode("utf-8")
+
 
 class ReportGenerator:
     """
@@ -66,6 +84,9 @@ class ReportGenerator:
         self.use_llm_interpretation = use_llm_interpretation
         self.enable_charts = enable_charts
         self.industry = industry
+        self._format_cache: "OrderedDict[Tuple[bytes, ReportFormat], str]" = (
+            OrderedDict()
+        )
 
         # Import chart generator if enabled
         if self.enable_charts:
@@ -101,6 +122,55 @@ class ReportGenerator:
             execution_result: Result from analysis execution
             context: Optional additional context (use case, requirements, etc.)
 
+        Returns:
+            Complete analysis report
+        """
+        return self._build_report(execution_result, context)
+
+    def generate_reports(
+        self,
+        execution_results: List[ExecutionResult],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        max_workers: int = 8,
+    ) -> List[AnalysisReport]:
+        """
+        Generate one report per execution result concurrently.
+
+        Each report's LLM interpretation is a separate network round-trip,
+        so building them from a thread pool costs roughly the slowest report
+        instead of the sum of all of them.
+
+        Args:
+            execution_results: Results to report on
+            contexts: Optional context per result (same order)
+            max_workers: Maximum number of reports generated at once
+
+        Returns:
+            Reports in the same order as execution_results
+        """
+        if not execution_results:
+            return []
+        if contexts is None:
+            contexts = [None] * len(execution_results)
+
+        workers = min(max_workers, len(execution_results))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.generate_report, execution_results, contexts))
+
+    def _build_report(
+        self,
+        execution_result: ExecutionResult,
+        context: Optional[Dict[str, Any]] = None,
+        llm_response: Optional[str] = None,
+    ) -> AnalysisReport:
+        """
+        Build a report, optionally from an already-fetched LLM interpretation.
+
+        Args:
+            execution_result: Result from analysis execution
+            context: Optional additional context
+            llm_response: Prefetched LLM interpretation (fetched on demand if None)
+
         Returns:
             Complete analysis report
         """
@@ -139,7 +209,9 @@ class ReportGenerator:
 
         # Generate insights
         if self.use_llm_interpretation and execution_result.results:
-            report.insights = self._generate_insights_llm(execution_result, context)
+            report.insights = self._generate_insights_llm(
+                execution_result, context, llm_response
+            )
         else:
             report.insights = self._generate_insights_heuristic(execution_result)
 
@@ -241,11 +313,13 @@ class ReportGenerator:
         all_insights = []
         all_recommendations = []
 
-        for result in execution_results:
-            if result.success:
-                individual_report = self.generate_report(result)
-                all_insights.extend(individual_report.insights)
-                all_recommendations.extend(individual_report.recommendations)
+        successful = [r for r in execution_results if r.success]
+        responses = self._prefetch_llm_interpretations(successful)
+
+        for result, response in zip(successful, responses):
+            individual_report = self._build_report(result, llm_response=response)
+            all_insights.extend(individual_report.insights)
+            all_recommendations.extend(individual_report.recommendations)
 
         report.insights = all_insights
         report.recommendations = all_recommendations
@@ -258,6 +332,37 @@ class ReportGenerator:
 
         return report
 
+    def _prefetch_llm_interpretations(
+        self, execution_results: List[ExecutionResult]
+    ) -> List[Optional[str]]:
+        """
+        Fetch LLM interpretations for several results in one batched round.
+
+        Returns one entry per result; None means the result is interpreted
+        individually (no LLM, no rows, or the batch failed).
+        """
+        responses: List[Optional[str]] = [None] * len(execution_results)
+        if not self.use_llm_interpretation:
+            return responses
+
+        indexed_prompts = [
+            (i, self._create_insight_prompt(r.job, r.results[:10], None))
+            for i, r in enumerate(execution_results)
+            if r.results
+        ]
+        if not indexed_prompts:
+            return responses
+
+        try:
+            batch = self.llm_provider.generate_batch([p for _, p in indexed_prompts])
+        except Exception as e:
+            print(f"Batched LLM interpretation failed, falling back per report: {e}")
+            return responses
+
+        for (i, _), response in zip(indexed_prompts, batch):
+            responses[i] = response.content
+        return responses
+
     def format_report(
         self, report: AnalysisReport, format: ReportFormat = ReportFormat.MARKDOWN
     ) -> str:
@@ -271,12 +376,26 @@ class ReportGenerator:
         Returns:
             Formatted report string
         """
+        # Re-rendering an unchanged report is common when the same report is
+        # exported repeatedly; the key changes whenever the content does
+        key = (_report_fingerprint(report), format)
+        cached = self._format_cache.get(key)
+        if cached is not None:
+            self._format_cache.move_to_end(key)
+            return cached
+
+        formatted = self._format_uncached(report, format)
+        self._format_cache[key] = formatted
+        if len(self._format_cache) > _FORMAT_CACHE_SIZE:
+            self._format_cache.popitem(last=False)
+        return formatted
+
+    def _format_uncached(self, report: AnalysisReport, format: ReportFormat) -> str:
+        """Render a report in the given format."""
         if format == ReportFormat.MARKDOWN:
             return self._format_markdown(report)
         elif format == ReportFormat.JSON:
-            import json
-
-            return json.dumps(report.to_dict(), indent=2)
+            return _report_to_json(report)
         elif format == ReportFormat.HTML:
             return self._format_html(report)
         elif format == ReportFormat.TEXT:
@@ -379,20 +498,22 @@ class ReportGenerator:
         self,
         execution_result: ExecutionResult,
         context: Optional[Dict[str, Any]] = None,
+        llm_response: Optional[str] = None,
     ) -> List[Insight]:
         """Generate insights using LLM interpretation with validation."""
         try:
-            # Prepare data for LLM
-            job = execution_result.job
-            results_sample = execution_result.results[:10]  # Top 10 for context
+            if llm_response is None:
+                # Prepare data for LLM
+                job = execution_result.job
+                results_sample = execution_result.results[:10]  # Top 10 for context
 
-            prompt = self._create_insight_prompt(job, results_sample, context)
+                prompt = self._create_insight_prompt(job, results_sample, context)
 
-            # Get LLM interpretation
-            response = self.llm_provider.generate(prompt)
+                # Get LLM interpretation
+                llm_response = self.llm_provider.generate(prompt).content
 
             # Parse LLM response into insights
-            insights = self._parse_llm_insights(response.content)
+            insights = self._parse_llm_insights(llm_response)
 
             # Validate insights
             insights = self._validate_insights(insights)
@@ -769,9 +890,7 @@ class ReportGenerator:
             return insights
 
         # Count communities/labels and sizes
-        from collections import Counter
-        labels = [r.get("label", 0) for r in results]
-        label_counts = Counter(labels)
+        label_counts = Counter(r.get("label", 0) for r in results)
         
         num_communities = len(label_counts)
         total_nodes = len(results)
@@ -789,8 +908,7 @@ class ReportGenerator:
         
         # Analyze community size distribution
         if num_communities > 1:
-            sizes = sorted(label_counts.values(), reverse=True)
-            largest_community = sizes[0]
+            largest_community = max(label_counts.values())
             largest_pct = (largest_community / total_nodes * 100) if total_nodes > 0 else 0
             
             insights.append(
@@ -814,9 +932,7 @@ class ReportGenerator:
             return insights
 
         # Count components and analyze sizes
-        from collections import Counter
-        components = [r.get("component", 0) for r in results]
-        component_counts = Counter(components)
+        component_counts = Counter(r.get("component", 0) for r in results)
         
         num_components = len(component_counts)
         total_nodes = len(results)
@@ -834,8 +950,8 @@ class ReportGenerator:
         
         # Analyze component size distribution
         if num_components > 1:
-            sizes = sorted(component_counts.values(), reverse=True)
-            largest_component = sizes[0]
+            sizes = component_counts.values()
+            largest_component = max(sizes)
             largest_pct = (largest_component / total_nodes * 100) if total_nodes > 0 else 0
             singletons = sum(1 for size in sizes if size == 1)
             
@@ -861,9 +977,7 @@ class ReportGenerator:
             return insights
 
         # Count components and analyze sizes
-        from collections import Counter
-        components = [r.get("component", 0) for r in results]
-        component_counts = Counter(components)
+        component_counts = Counter(r.get("component", 0) for r in results)
         
         num_components = len(component_counts)
         total_nodes = len(results)
@@ -881,8 +995,8 @@ class ReportGenerator:
         
         # Analyze SCC size distribution
         if num_components > 1:
-            sizes = sorted(component_counts.values(), reverse=True)
-            largest_scc = sizes[0]
+            sizes = component_counts.values()
+            largest_scc = max(sizes)
             largest_pct = (largest_scc / total_nodes * 100) if total_nodes > 0 else 0
             singletons = sum(1 for size in sizes if size == 1)
             
@@ -4,8 +4,9 @@ HTML report formatter with embedded charts.
 Generates complete HTML reports with interactive Plotly charts.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime
+from pathlib import Path
 
 from .models import AnalysisReport, Insight, Recommendation
 from .chart_generator import ChartGenerator, is_plotly_available
@@ -27,9 +28,8 @@ class HTMLReportFormatter:
         >>> formatter = HTMLReportFormatter()
         >>> html = formatter.format_report(report, charts)
         >>>
-        >>> # Save to file
-        >>> with open('report.html', 'w') as f:
-        ...     f.write(html)
+        >>> # Or stream straight to a file
+        >>> formatter.write_report(report, 'report.html', charts)
     """
 
     def __init__(self, theme: str = "modern"):
@@ -59,25 +59,68 @@ class HTMLReportFormatter:
         Returns:
             Complete HTML document string
         """
-        charts = charts or {}
-
-        # Build HTML document
-        html_parts = [
-            self._generate_html_header(report.title),
-            self._generate_executive_summary(report),
-            self._generate_charts_section(charts),
-            self._generate_insights_section(report.insights),
-            self._generate_recommendations_section(report.recommendations),
-            self._generate_metrics_section(report.metrics, report.dataset_info),
-        ]
+        return "\n".join(self.iter_report(report, charts, include_raw_data))
 
-        if include_raw_data:
-            html_parts.append(self._generate_raw_data_section(report))
+    def write_report(
+        self,
+        report: AnalysisReport,
+        path: str,
+        charts: Optional[Dict[str, str]] = None,
+        include_raw_data: bool = False,
+    ) -> None:
+        """
+        Write the HTML report to a file, streaming it chunk by chunk.
+
+        Produces the same document as :meth:`format_report` without ever
+        holding the whole (often multi-megabyte, chart-heavy) page in
+        memory as one string.
+
+        Args:
+            report: Analysis report to format
+            path: Output file path
+            charts: Dictionary of chart HTML strings
+            include_raw_data: Include raw data section
+        """
+        with open(Path(path), "wb", buffering=1 << 20) as f:
+            for i, chunk in enumerate(
+                self.iter_report(report, charts, include_raw_data)
+            ):
+                if i:
+                    f.write(b"\n")
+                f.write(chunk.encode("utf-8"))
+
+    def iter_report(
+        self,
+        report: AnalysisReport,
+        charts: Optional[Dict[str, str]] = None,
+        include_raw_data: bool = False,
+    ) -> Iterator[str]:
+        """
+        Yield the HTML document in newline-separated chunks.
+
+        Each chart is its own chunk, so large embedded charts are never
+        concatenated with the rest of the page.
+
+        Args:
+            report: Analysis report to format
+            charts: Dictionary of chart HTML strings
+            include_raw_data: Include raw data section
 
-        html_parts.append(self._generate_footer(report.generated_at))
-        html_parts.append(self._generate_html_close())
+        Yields:
+            HTML fragments, to be joined with newlines
+        """
+        yield self._generate_html_header(report.title)
+        yield self._generate_executive_summary(report)
+        yield from self._iter_charts_section(charts or {})
+        yield self._generate_insights_section(report.insights)
+        yield self._generate_recommendations_section(report.recommendations)
+        yield self._generate_metrics_section(report.metrics, report.dataset_info)
+
+        if include_raw_data:
+            yield self._generate_raw_data_section(report)
 
-        return "\n".join(html_parts)
+        yield self._generate_footer(report.generated_at)
+        yield self._generate_html_close()
 
     def _generate_html_header(self, title: str) -> str:
         """Generate HTML header with styling."""
@@ -143,19 +186,23 @@ class HTMLReportFormatter:
 
     def _generate_charts_section(self, charts: Dict[str, str]) -> str:
         """Generate charts section."""
+        return "\n".join(self._iter_charts_section(charts))
+
+    def _iter_charts_section(self, charts: Dict[str, str]) -> Iterator[str]:
+        """Yield charts section lines, one chart per chunk."""
         if not charts:
-            return ""
+            yield ""
+            return
 
-        html = ['        <section class="section charts-section">']
-        html.append("            <h2>Visualizations</h2>")
+        yield '        <section class="section charts-section">'
+        yield "            <h2>Visualizations</h2>"
 
         for chart_name, chart_html in charts.items():
-            html.append('            <div class="chart-container">')
-            html.append(chart_html)
-            html.append("            </div>")
+            yield '            <div class="chart-container">'
+            yield chart_html
+            yield "            </div>"
 
-        html.append("        </section>")
-        return "\n".join(html)
+        yield "        </section>"
 
     def _generate_insights_section(self, insights: List[Insight]) -> str:
         """Generate insights section."""
@@ -38,7 +38,7 @@ class RecommendationType(Enum):
     MONITORING = "monitoring"
 
 
-@dataclass
+@dataclass(slots=True)
 class Insight:
     """
     A single insight from analysis.
@@ -76,7 +76,7 @@ class Insight:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Recommendation:
     """
     Actionable recommendation based on analysis.
@@ -116,7 +116,7 @@ class Recommendation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportSection:
     """
     A section of the report.
@@ -144,7 +144,7 @@ class ReportSection:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisReport:
     """
     Complete analysis report.
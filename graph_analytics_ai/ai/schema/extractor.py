@@ -5,11 +5,18 @@ This module extracts schema information from an ArangoDB database,
 including collections, attributes, relationships, and sample data.
 """
 
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
 from typing import Dict, List, Optional, Set, Any
 from arango import ArangoClient
 from arango.database import StandardDatabase
 from arango.collection import StandardCollection
 
+from ..json_utils import write_text_atomic
 from .models import (
     GraphSchema,
     CollectionSchema,
@@ -18,6 +25,13 @@ from .models import (
     Relationship,
 )
 
+DEFAULT_SCHEMA_CACHE_DIR = Path.home() / ".cache" / "gaai" / "schema"
+
+# In-process layer in front of the disk cache, keyed by fingerprint
+_MEMORY_CACHE_SIZE = 8
+_memory_cache: "OrderedDict[str, GraphSchema]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
 
 class SchemaExtractor:
     """
@@ -36,6 +50,14 @@ class SchemaExtractor:
         >>>
         >>> print(f"Found {len(schema.vertex_collections)} vertex collections")
         >>> print(f"Total documents: {schema.total_documents}")
+
+        Repeated runs against an unchanged database can skip sampling by
+        enabling the on-disk cache:
+
+        >>> extractor = SchemaExtractor(db, use_cache=True)
+        >>> schema = extractor.extract()  # samples collections, writes cache
+        >>> schema = extractor.extract()  # served from memory, or from
+        ...                               # ~/.cache/gaai/schema in a new process
     """
 
     def __init__(
@@ -43,6 +65,8 @@ class SchemaExtractor:
         db: StandardDatabase,
         sample_size: int = 100,
         max_samples_per_collection: int = 3,
+        use_cache: bool = False,
+        cache_dir: Optional[str] = None,
     ):
         """
         Initialize schema extractor.
@@ -51,10 +75,16 @@ class SchemaExtractor:
             db: ArangoDB database connection.
             sample_size: Number of documents to sample for attribute analysis.
             max_samples_per_collection: Maximum sample documents to store per collection.
+            use_cache: Reuse a previously extracted schema while the database's
+                endpoint, collections, their revisions and named graphs are
+                unchanged.
+            cache_dir: Cache directory (default: ~/.cache/gaai/schema).
         """
         self.db = db
         self.sample_size = sample_size
         self.max_samples_per_collection = max_samples_per_collection
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir or DEFAULT_SCHEMA_CACHE_DIR)
 
     def extract(self) -> GraphSchema:
         """
@@ -63,8 +93,6 @@ class SchemaExtractor:
         Returns:
             GraphSchema containing all schema information.
         """
-        schema = GraphSchema(database_name=self.db.name)
-
         # Get all collections
         collections = self.db.collections()
 
@@ -73,13 +101,47 @@ class SchemaExtractor:
             col for col in collections if not col["name"].startswith("_")
         ]
 
+        if not self.use_cache:
+            return self._extract_schema(user_collections)
+
+        fingerprint = self._fingerprint(user_collections)
+        if fingerprint is None:
+            # Changes can't be detected, so a cached schema could go stale
+            return self._extract_schema(user_collections)
+
+        with _memory_cache_lock:
+            if fingerprint in _memory_cache:
+                _memory_cache.move_to_end(fingerprint)
+                # Callers get their own schema objects to modify
+                return copy.deepcopy(_memory_cache[fingerprint])
+
+        cache_path = self.cache_dir / f"schema-{fingerprint}.json"
+        try:
+            schema = GraphSchema.from_dict(json.loads(cache_path.read_text()))
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+            schema = self._extract_schema(user_collections)
+            self._save_cached(cache_path, schema)
+
+        with _memory_cache_lock:
+            _memory_cache[fingerprint] = copy.deepcopy(schema)
+            if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+                _memory_cache.popitem(last=False)
+        return schema
+
+    def _extract_schema(self, user_collections: List[Dict[str, Any]]) -> GraphSchema:
+        """Sample the given collections and build the schema."""
+        schema = GraphSchema(database_name=self.db.name)
+        counts = self._collection_counts([col["name"] for col in user_collections])
+
         # Process each collection
         for col_info in user_collections:
             col_name = col_info["name"]
             col_type = self._determine_collection_type(col_info)
 
             # Extract collection schema
-            col_schema = self._extract_collection_schema(col_name, col_type)
+            col_schema = self._extract_collection_schema(
+                col_name, col_type, counts.get(col_name)
+            )
 
             # Add to appropriate category
             if col_type == CollectionType.VERTEX:
@@ -104,6 +166,89 @@ class SchemaExtractor:
 
         return schema
 
+    def _collection_counts(self, col_names: List[str]) -> Dict[str, int]:
+        """
+        Count documents in all given collections with a single AQL query.
+
+        Returns an empty dict if the query fails, in which case each
+        collection is counted individually.
+        """
+        if not col_names:
+            return {}
+        try:
+            cursor = self.db.aql.execute(
+                """
+                FOR name IN @names
+                    RETURN {name: name, count: COLLECTION_COUNT(name)}
+                """,
+                bind_vars={"names": col_names},
+            )
+            return {row["name"]: int(row["count"]) for row in cursor}
+        except Exception:
+            return {}
+
+    def _fingerprint(self, user_collections: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Identify the database state a cached schema was extracted from.
+
+        Covers the server endpoint, database name, sampling settings, the
+        user graph names and each collection's name, type and revision, so
+        any write to a collection or graph definition produces a new
+        fingerprint.
+
+        Returns None if a collection revision or the graph list can't be
+        read, in which case the schema must not be cached.
+        """
+        collections = []
+        for col in user_collections:
+            revision = self._collection_revision(col["name"])
+            if revision is None:
+                return None
+            collections.append((col["name"], col.get("type"), revision))
+
+        try:
+            graph_names = sorted(
+                g["name"] for g in self.db.graphs() if not g["name"].startswith("_")
+            )
+        except Exception:
+            return None
+
+        state = {
+            "endpoint": self._endpoint(),
+            "database": self.db.name,
+            "sample_size": self.sample_size,
+            "max_samples_per_collection": self.max_samples_per_collection,
+            "collections": sorted(collections),
+            "graphs": graph_names,
+        }
+        canonical = json.dumps(state, sort_keys=True, default=str)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _endpoint(self) -> List[str]:
+        """Get the server URLs the database connection talks to."""
+        hosts = getattr(getattr(self.db, "conn", None), "_hosts", None)
+        if isinstance(hosts, str):
+            return [hosts]
+        if isinstance(hosts, (list, tuple)):
+            return sorted(str(host) for host in hosts)
+        return []
+
+    def _collection_revision(self, col_name: str) -> Optional[str]:
+        """Get a collection's revision, or None if the server doesn't report one."""
+        try:
+            return self.db.collection(col_name).revision()
+        except Exception:
+            return None
+
+    def _save_cached(self, path: Path, schema: GraphSchema) -> None:
+        """Write a schema atomically so concurrent readers never see partial JSON."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(path, json.dumps(schema.to_dict(), default=str))
+        except OSError:
+            # Caching is best effort; the extracted schema is still returned
+            pass
+
     def _determine_collection_type(self, col_info: Dict[str, Any]) -> CollectionType:
         """Determine if collection is vertex, edge, or document."""
         col_type = col_info.get("type")
@@ -119,14 +264,19 @@ class SchemaExtractor:
         return CollectionType.VERTEX
 
     def _extract_collection_schema(
-        self, col_name: str, col_type: CollectionType
+        self,
+        col_name: str,
+        col_type: CollectionType,
+        document_count: Optional[int] = None,
     ) -> CollectionSchema:
         """Extract schema for a single collection."""
         collection = self.db.collection(col_name)
+        if document_count is None:
+            document_count = collection.count()
 
         # Create collection schema
         col_schema = CollectionSchema(
-            name=col_name, type=col_type, document_count=collection.count()
+            name=col_name, type=col_type, document_count=document_count
         )
 
         # Sample documents for attribute analysis
@@ -363,6 +513,8 @@ def create_extractor(
     password: str = "",
     verify_ssl: bool = True,
     sample_size: int = 100,
+    use_cache: bool = False,
+    cache_dir: Optional[str] = None,
 ) -> SchemaExtractor:
     """
     Create a schema extractor with ArangoDB connection.
@@ -374,6 +526,9 @@ def create_extractor(
         password: Password.
         verify_ssl: Whether to verify SSL certificates.
         sample_size: Number of documents to sample per collection.
+        use_cache: Reuse a previously extracted schema while the database is
+            unchanged (see SchemaExtractor).
+        cache_dir: Cache directory (default: ~/.cache/gaai/schema).
 
     Returns:
         Configured SchemaExtractor instance.
@@ -389,4 +544,6 @@ def create_extractor(
     client = ArangoClient(hosts=endpoint, verify_override=verify_ssl)
     db = client.db(database, username=username, password=password)
 
-    return SchemaExtractor(db, sample_size=sample_size)
+    return SchemaExtractor(
+        db, sample_size=sample_size, use_cache=use_cache, cache_dir=cache_dir
+    )
@@ -37,6 +37,27 @@ class AttributeInfo:
     present_count: int = 0
     """Number of documents where this attribute is present."""
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "data_types": sorted(self.data_types),
+            "sample_values": self.sample_values,
+            "null_count": self.null_count,
+            "present_count": self.present_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AttributeInfo":
+        """Create from dictionary produced by to_dict()."""
+        return cls(
+            name=data["name"],
+            data_types=set(data.get("data_types", [])),
+            sample_values=data.get("sample_values", []),
+            null_count=data.get("null_count", 0),
+            present_count=data.get("present_count", 0),
+        )
+
     @property
     def presence_ratio(self) -> float:
         """Ratio of documents that have this attribute."""
@@ -83,6 +104,36 @@ class CollectionSchema:
     to_collections: Set[str] = field(default_factory=set)
     """Collections that edges point to (for edge collections)."""
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "type": self.type.value,
+            "document_count": self.document_count,
+            "attributes": {
+                name: attr.to_dict() for name, attr in self.attributes.items()
+            },
+            "sample_documents": self.sample_documents,
+            "from_collections": sorted(self.from_collections),
+            "to_collections": sorted(self.to_collections),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CollectionSchema":
+        """Create from dictionary produced by to_dict()."""
+        return cls(
+            name=data["name"],
+            type=CollectionType(data["type"]),
+            document_count=data.get("document_count", 0),
+            attributes={
+                name: AttributeInfo.from_dict(attr)
+                for name, attr in data.get("attributes", {}).items()
+            },
+            sample_documents=data.get("sample_documents", []),
+            from_collections=set(data.get("from_collections", [])),
+            to_collections=set(data.get("to_collections", [])),
+        )
+
     def get_key_attributes(self, top_n: int = 5) -> List[str]:
         """
         Get the most important attributes based on presence ratio.
@@ -128,6 +179,21 @@ class Relationship:
     relationship_type: Optional[str] = None
     """Semantic type of relationship (e.g., 'KNOWS', 'PURCHASED')."""
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "edge_collection": self.edge_collection,
+            "from_collection": self.from_collection,
+            "to_collection": self.to_collection,
+            "edge_count": self.edge_count,
+            "relationship_type": self.relationship_type,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Relationship":
+        """Create from dictionary produced by to_dict()."""
+        return cls(**data)
+
     def __str__(self) -> str:
         """String representation of relationship."""
         rel_type = f" ({self.relationship_type})" if self.relationship_type else ""
@@ -198,6 +264,49 @@ class GraphSchema:
             )
         ]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the full schema to a JSON-serializable dictionary.
+
+        Unlike to_summary_dict(), nothing is dropped, so the result can be
+        turned back into an equal GraphSchema with from_dict().
+        """
+        return {
+            "database_name": self.database_name,
+            "vertex_collections": {
+                name: col.to_dict() for name, col in self.vertex_collections.items()
+            },
+            "edge_collections": {
+                name: col.to_dict() for name, col in self.edge_collections.items()
+            },
+            "document_collections": {
+                name: col.to_dict() for name, col in self.document_collections.items()
+            },
+            "relationships": [rel.to_dict() for rel in self.relationships],
+            "graph_names": self.graph_names,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GraphSchema":
+        """Create from dictionary produced by to_dict()."""
+
+        def collections(key: str) -> Dict[str, CollectionSchema]:
+            return {
+                name: CollectionSchema.from_dict(col)
+                for name, col in data.get(key, {}).items()
+            }
+
+        return cls(
+            database_name=data["database_name"],
+            vertex_collections=collections("vertex_collections"),
+            edge_collections=collections("edge_collections"),
+            document_collections=collections("document_collections"),
+            relationships=[
+                Relationship.from_dict(rel) for rel in data.get("relationships", [])
+            ],
+            graph_names=data.get("graph_names", []),
+        )
+
     def to_summary_dict(self) -> Dict[str, Any]:
         """
         Convert schema to a summary dictionary for LLM consumption.
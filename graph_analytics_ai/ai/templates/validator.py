@@ -220,7 +220,7 @@ class TemplateValidator:
             errors.append("Graph name is required")
 
         # Check engine size
-        if config.engine_size not in list(EngineSize):
+        if not isinstance(config.engine_size, EngineSize):
             errors.append(f"Invalid engine size: {config.engine_size}")
 
         # Check result collection
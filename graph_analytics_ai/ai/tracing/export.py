@@ -115,7 +115,8 @@ class TraceExporter:
         perf = self.trace.performance.to_dict() if self.trace.performance else {}
 
         # Generate HTML with embedded CSS and JavaScript
-        html = f"""<!DOCTYPE html>
+        parts = [
+            f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -390,7 +391,8 @@ class TraceExporter:
         
         <div class="timeline">
             <div class="timeline-header">Event Timeline</div>
-"""
+""",
+        ]
 
         for event in timeline:
             event_type = event["event"].replace("_", " ").title()
@@ -415,7 +417,7 @@ class TraceExporter:
             if "error" in event["event"].lower():
                 event_class.append("error-event")
 
-            html += f"""
+            parts.append(f"""
             <div class="timeline-event {' '.join(event_class)}">
                 <div class="{dot_class}"></div>
                 <div class="timeline-content">
@@ -427,9 +429,9 @@ class TraceExporter:
                     <div class="timeline-summary">{summary}</div>
                 </div>
             </div>
-"""
+""")
 
-        html += """
+        parts.append("""
         </div>
     </div>
     
@@ -458,9 +460,9 @@ class TraceExporter:
     </script>
 </body>
 </html>
-"""
+""")
 
-        return html
+        return "".join(parts)
 
     def _generate_agent_diagram_svg(self) -> str:
         """Generate SVG diagram of agent interactions."""
@@ -481,7 +483,8 @@ class TraceExporter:
         agent_y = 80
         agent_spacing = width / (agent_count + 1)
 
-        svg = f"""<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">
+        parts = [
+            f"""<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">
     <style>
         .agent-box {{ fill: #2196F3; stroke: #1976D2; stroke-width: 2; }}
         .agent-text {{ fill: white; font-family: Arial, sans-serif; font-size: 12px; text-anchor: middle; }}
@@ -491,7 +494,8 @@ class TraceExporter:
     </style>
     
     <text x="{width/2}" y="30" class="title">Agent Interaction Diagram</text>
-"""
+""",
+        ]
 
         # Draw agents
         agent_positions = {}
@@ -499,10 +503,10 @@ class TraceExporter:
             x = (i + 1) * agent_spacing
             agent_positions[agent] = x
 
-            svg += f"""
+            parts.append(f"""
     <rect x="{x-50}" y="{agent_y}" width="100" height="40" rx="5" class="agent-box"/>
     <text x="{x}" y="{agent_y + 25}" class="agent-text">{agent[:15]}</text>
-"""
+""")
 
         # Draw interactions
         message_y_start = agent_y + 60
@@ -523,23 +527,24 @@ class TraceExporter:
 
             # Draw curved line
             control_y = y + 20
-            svg += f"""
+            parts.append(f"""
     <path d="M {x1} {y} Q {(x1+x2)/2} {control_y} {x2} {y + 5}" class="message-line"/>
     <polygon points="{x2-5},{y+5} {x2},{y+8} {x2-5},{y+11}" class="message-arrow"/>
-"""
+""")
 
-        svg += """
+        parts.append("""
 </svg>
-"""
+""")
 
-        return svg
+        return "".join(parts)
 
     def _generate_markdown_report(self) -> str:
         """Generate markdown trace report."""
         perf = self.trace.performance.to_dict() if self.trace.performance else {}
         timeline = self.trace.get_timeline()
 
-        md = f"""# Workflow Trace Report
+        parts = [
+            f"""# Workflow Trace Report
 
 **Trace ID:** `{self.trace.trace_id}`  
 **Workflow ID:** `{self.trace.workflow_id}`  
@@ -565,54 +570,63 @@ class TraceExporter:
 
 ## Slowest Agents
 
-"""
+""",
+        ]
 
         for i, agent in enumerate(perf.get("slowest_agents", []), 1):
-            md += f"{i}. **{agent['agent']}**: {agent['total_time_ms']:.0f}ms ({agent['invocations']} invocations)\n"
+            parts.append(
+                f"{i}. **{agent['agent']}**: {agent['total_time_ms']:.0f}ms ({agent['invocations']} invocations)\n"
+            )
 
-        md += "\n---\n\n## Top LLM Consumers\n\n"
+        parts.append("\n---\n\n## Top LLM Consumers\n\n")
 
         for i, agent in enumerate(perf.get("top_llm_consumers", []), 1):
-            md += f"{i}. **{agent['agent']}**: {agent['total_tokens']:,} tokens ({agent['llm_calls']} calls)\n"
+            parts.append(
+                f"{i}. **{agent['agent']}**: {agent['total_tokens']:,} tokens ({agent['llm_calls']} calls)\n"
+            )
 
-        md += "\n---\n\n## Event Timeline\n\n"
+        parts.append("\n---\n\n## Event Timeline\n\n")
 
         for event in timeline:
             timestamp = event["timestamp"].split("T")[1][:12]  # Just time
             summary = event.get("summary", "")
             duration = event.get("duration_ms", 0)
 
-            md += f"**{timestamp}** - {summary}"
+            parts.append(f"**{timestamp}** - {summary}")
             if duration:
-                md += f" `({duration:.0f}ms)`"
-            md += "\n\n"
+                parts.append(f" `({duration:.0f}ms)`")
+            parts.append("\n\n")
 
-        md += "\n---\n\n## Agent Interactions\n\n"
+        parts.append("\n---\n\n## Agent Interactions\n\n")
 
         interactions = self.trace.get_agent_interactions()
         for interaction in interactions[:30]:  # Limit to first 30
-            md += f"- `{interaction['from_agent']}` → `{interaction['to_agent']}` ({interaction['message_type']})\n"
+            parts.append(
+                f"- `{interaction['from_agent']}` → `{interaction['to_agent']}` ({interaction['message_type']})\n"
+            )
 
         if len(interactions) > 30:
-            md += f"\n_... and {len(interactions) - 30} more interactions_\n"
+            parts.append(f"\n_... and {len(interactions) - 30} more interactions_\n")
 
-        md += "\n---\n\n## Detailed Metrics by Agent\n\n"
+        parts.append("\n---\n\n## Detailed Metrics by Agent\n\n")
 
         agent_metrics = perf.get("agent_metrics", {})
         for agent_name, metrics in agent_metrics.items():
-            md += f"### {agent_name}\n\n"
-            md += f"- **Invocations:** {metrics['invocation_count']}\n"
-            md += f"- **Total Time:** {metrics['total_time_ms']:.2f}ms\n"
-            md += f"- **Avg Time:** {metrics['avg_time_ms']:.2f}ms\n"
-            md += f"- **LLM Calls:** {metrics['llm_calls']}\n"
-            md += f"- **LLM Time:** {metrics['llm_time_ms']:.2f}ms ({metrics['llm_time_percent']:.1f}%)\n"
-            md += f"- **Total Tokens:** {metrics['total_tokens']:,}\n"
-            md += f"- **Tool Calls:** {metrics['tool_calls']}\n"
-            md += f"- **Messages Sent:** {metrics['messages_sent']}\n"
-            md += f"- **Messages Received:** {metrics['messages_received']}\n"
-            md += f"- **Errors:** {metrics['errors']}\n\n"
-
-        return md
+            parts.append(f"### {agent_name}\n\n")
+            parts.append(f"- **Invocations:** {metrics['invocation_count']}\n")
+            parts.append(f"- **Total Time:** {metrics['total_time_ms']:.2f}ms\n")
+            parts.append(f"- **Avg Time:** {metrics['avg_time_ms']:.2f}ms\n")
+            parts.append(f"- **LLM Calls:** {metrics['llm_calls']}\n")
+            parts.append(
+                f"- **LLM Time:** {metrics['llm_time_ms']:.2f}ms ({metrics['llm_time_percent']:.1f}%)\n"
+            )
+            parts.append(f"- **Total Tokens:** {metrics['total_tokens']:,}\n")
+            parts.append(f"- **Tool Calls:** {metrics['tool_calls']}\n")
+            parts.append(f"- **Messages Sent:** {metrics['messages_sent']}\n")
+            parts.append(f"- **Messages Received:** {metrics['messages_received']}\n")
+            parts.append(f"- **Errors:** {metrics['errors']}\n\n")
+
+        return "".join(parts)
 
 
 def export_trace(
@@ -5,6 +5,7 @@ Allows loading and inspecting saved traces, with debug mode for verbose logging.
 """
 
 import json
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -222,26 +223,20 @@ class TraceReplayer:
         """
         messages = self.trace.get_agent_interactions()
 
-        # Count messages between each pair
-        pairs = {}
+        # Count pairs, senders and receivers in a single pass
+        pairs = defaultdict(int)
+        agent_sends = defaultdict(int)
+        agent_receives = defaultdict(int)
         for msg in messages:
             from_agent = msg["from_agent"]
             to_agent = msg["to_agent"]
-            key = f"{from_agent} → {to_agent}"
-            pairs[key] = pairs.get(key, 0) + 1
+            pairs[f"{from_agent} → {to_agent}"] += 1
+            agent_sends[from_agent] += 1
+            agent_receives[to_agent] += 1
 
         # Find most active pairs
         sorted_pairs = sorted(pairs.items(), key=lambda x: x[1], reverse=True)
 
-        # Count messages per agent
-        agent_sends = {}
-        agent_receives = {}
-        for msg in messages:
-            from_agent = msg["from_agent"]
-            to_agent = msg["to_agent"]
-            agent_sends[from_agent] = agent_sends.get(from_agent, 0) + 1
-            agent_receives[to_agent] = agent_receives.get(to_agent, 0) + 1
-
         return {
             "total_messages": len(messages),
             "unique_pairs": len(pairs),
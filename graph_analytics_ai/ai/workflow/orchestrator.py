@@ -5,11 +5,12 @@ Coordinates the execution of all workflow steps with state management,
 error handling, and checkpointing.
 """
 
+import threading
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 
 from ..llm.base import LLMProvider
 from ..llm.factory import create_llm_provider
@@ -21,6 +22,10 @@ from .state import WorkflowState, WorkflowStatus, WorkflowStep
 from .steps import WorkflowSteps
 from .exceptions import WorkflowStepError, WorkflowCheckpointError
 
+# Index of checkpoint files in the output directory, one
+# "<workflow_id>\t<timestamp>\t<file name>" line per workflow run, newest last
+CHECKPOINT_INDEX = "_checkpoints.idx"
+
 
 @dataclass
 class WorkflowResult:
@@ -121,6 +126,11 @@ class WorkflowOrchestrator:
         self.steps_executor = WorkflowSteps(self.llm_provider)
         self.state: Optional[WorkflowState] = None
 
+        # Set when run_complete_workflow returns, whether it completed or failed
+        self.finished = threading.Event()
+        self._on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._indexed_workflow_id: Optional[str] = None
+
     def run_complete_workflow(
         self,
         business_requirements: List[str],
@@ -130,6 +140,7 @@ class WorkflowOrchestrator:
         database_password: str = "",
         product_name: str = "Graph Analytics AI Project",
         resume_from_checkpoint: bool = False,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> WorkflowResult:
         """
         Run the complete end-to-end workflow.
@@ -151,6 +162,10 @@ class WorkflowOrchestrator:
             database_password: Database password.
             product_name: Name for the product/project.
             resume_from_checkpoint: Whether to resume from last checkpoint.
+            on_progress: Optional callback invoked with ``get_progress()`` each
+                time a step starts, completes or fails, and when the workflow
+                finishes. Runs on the workflow's thread; exceptions it raises
+                are logged and ignored.
 
         Returns:
             WorkflowResult with paths to all generated artifacts.
@@ -158,6 +173,33 @@ class WorkflowOrchestrator:
         Raises:
             WorkflowError: If workflow fails after all retries.
         """
+        self.finished.clear()
+        self._on_progress = on_progress
+        try:
+            return self._run_complete_workflow(
+                business_requirements=business_requirements,
+                database_endpoint=database_endpoint,
+                database_name=database_name,
+                database_username=database_username,
+                database_password=database_password,
+                product_name=product_name,
+                resume_from_checkpoint=resume_from_checkpoint,
+            )
+        finally:
+            self._on_progress = None
+            self.finished.set()
+
+    def _run_complete_workflow(
+        self,
+        business_requirements: List[str],
+        database_endpoint: str,
+        database_name: str,
+        database_username: str,
+        database_password: str,
+        product_name: str,
+        resume_from_checkpoint: bool,
+    ) -> WorkflowResult:
+        """Run the workflow steps; see run_complete_workflow."""
         # Initialize or resume state
         if resume_from_checkpoint:
             self.state = self._load_checkpoint()
@@ -244,7 +286,7 @@ class WorkflowOrchestrator:
 
             # Mark workflow as completed
             self.state.mark_completed()
-            self._save_checkpoint()
+            self._state_changed()
 
             end_time = datetime.utcnow()
             duration = (end_time - start_time).total_seconds()
@@ -263,7 +305,7 @@ class WorkflowOrchestrator:
 
         except Exception as e:
             self.state.mark_failed(str(e))
-            self._save_checkpoint()
+            self._state_changed()
 
             return WorkflowResult(
                 workflow_id=self.state.workflow_id,
@@ -320,7 +362,7 @@ class WorkflowOrchestrator:
 
         # Mark step as started
         self.state.mark_step_started(step)
-        self._save_checkpoint()
+        self._state_changed()
 
         try:
             # Execute the step
@@ -329,7 +371,7 @@ class WorkflowOrchestrator:
             # Store result
             self.state.outputs[output_key] = result
             self.state.mark_step_completed(step, {output_key: str(type(result))})
-            self._save_checkpoint()
+            self._state_changed()
 
             return result
 
@@ -345,7 +387,7 @@ class WorkflowOrchestrator:
 
             # Mark step as failed
             self.state.mark_step_failed(step, error_msg)
-            self._save_checkpoint()
+            self._state_changed()
 
             raise WorkflowStepError(step.value, str(e), e)
 
@@ -362,6 +404,16 @@ class WorkflowOrchestrator:
             inputs=inputs,
         )
 
+    def _state_changed(self) -> None:
+        """Checkpoint the state and notify the progress callback, if any."""
+        self._save_checkpoint()
+        if self._on_progress:
+            try:
+                self._on_progress(self.get_progress())
+            except Exception as e:
+                # A faulty callback must not fail or retry the step, just log
+                print(f"Warning: Progress callback failed: {e}")
+
     def _save_checkpoint(self) -> None:
         """Save current state to checkpoint."""
         if not self.enable_checkpoints or not self.state:
@@ -372,20 +424,53 @@ class WorkflowOrchestrator:
                 self.output_dir / f"checkpoint_{self.state.workflow_id}.json"
             )
             self.state.save_checkpoint(checkpoint_path)
+
+            # Record each run once, so the index stays small however many
+            # steps re-save the same checkpoint file
+            if self._indexed_workflow_id != self.state.workflow_id:
+                with open(self.output_dir / CHECKPOINT_INDEX, "a") as f:
+                    f.write(
+                        f"{self.state.workflow_id}\t"
+                        f"{self.state.updated_at}\t"
+                        f"{checkpoint_path.name}\n"
+                    )
+                self._indexed_workflow_id = self.state.workflow_id
         except Exception as e:
             # Don't fail workflow if checkpoint fails, just log
             print(f"Warning: Failed to save checkpoint: {e}")
 
+    def latest_checkpoint(self) -> Optional[Path]:
+        """
+        Find the most recent checkpoint in the output directory.
+
+        Reads the checkpoint index rather than scanning the directory; output
+        directories written before the index existed fall back to the newest
+        checkpoint file by modification time.
+
+        Returns:
+            Path to the latest checkpoint, or None if there is none.
+        """
+        index_path = self.output_dir / CHECKPOINT_INDEX
+        if index_path.exists():
+            with open(index_path) as f:
+                lines = f.readlines()
+            for line in reversed(lines):
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) == 3 and (self.output_dir / parts[2]).exists():
+                    return self.output_dir / parts[2]
+
+        checkpoint_files = list(self.output_dir.glob("checkpoint_*.json"))
+        if not checkpoint_files:
+            return None
+        return max(checkpoint_files, key=lambda p: p.stat().st_mtime)
+
     def _load_checkpoint(self) -> WorkflowState:
         """Load most recent checkpoint."""
-        checkpoint_files = list(self.output_dir.glob("checkpoint_*.json"))
+        latest_checkpoint = self.latest_checkpoint()
 
-        if not checkpoint_files:
+        if latest_checkpoint is None:
             raise WorkflowCheckpointError("No checkpoint files found")
 
-        # Get most recent checkpoint
-        latest_checkpoint = max(checkpoint_files, key=lambda p: p.stat().st_mtime)
-
         try:
             return WorkflowState.load_checkpoint(latest_checkpoint)
         except Exception as e:
@@ -56,12 +56,8 @@ class TokenHelper:
         Returns:
             Cached token if valid, None otherwise
         """
-        if not self.cache_file.exists():
-            return None
-
         try:
-            with open(self.cache_file) as f:
-                data = json.load(f)
+            data = json.loads(self.cache_file.read_text())
 
             # Validate required fields
             if "token" not in data or "created_at" not in data:
@@ -81,6 +77,8 @@ class TokenHelper:
                 print("Cached token expired, generating new token...")
                 return None
 
+        except FileNotFoundError:
+            return None
         except (json.JSONDecodeError, ValueError, KeyError) as e:
             print(f"Warning: Failed to read cache: {e}")
             return None
@@ -25,19 +25,20 @@ async def generate_vertical_async(args):
     
     # Read input files
     logger.info(f"Reading business requirements from: {args.input}")
-    if not Path(args.input).exists():
+    try:
+        business_requirements = Path(args.input).read_text()
+    except FileNotFoundError:
         logger.error(f"Input file not found: {args.input}")
         return 1
     
-    business_requirements = Path(args.input).read_text()
-    
     # Read optional domain description
     domain_description = None
     if args.domain_description:
-        if not Path(args.domain_description).exists():
+        try:
+            domain_description = Path(args.domain_description).read_text()
+        except FileNotFoundError:
             logger.error(f"Domain description file not found: {args.domain_description}")
             return 1
-        domain_description = Path(args.domain_description).read_text()
         logger.info(f"Read domain description from: {args.domain_description}")
     
     # Initialize agent
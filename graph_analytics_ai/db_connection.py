@@ -4,15 +4,28 @@ ArangoDB Connection Helper
 Provides a unified interface to connect to ArangoDB clusters.
 """
 
+import threading
+
 from arango import ArangoClient
 
 from .config import get_arango_config, parse_ssl_verify
 
+# Verified connections shared by get_db_connection(reuse=True), keyed by the
+# full connection settings. A StandardDatabase is safe to share between
+# threads; its client keeps its own pool of HTTP connections.
+_connections = {}
+_connections_lock = threading.Lock()
+
 
-def get_db_connection():
+def get_db_connection(reuse: bool = False):
     """
     Establish connection to ArangoDB cluster.
 
+    Args:
+        reuse: Return the connection already established in this process for
+            the same settings, if any, instead of opening and verifying a new
+            one. Concurrent callers wait for the first connection attempt.
+
     Returns:
         StandardDatabase: ArangoDB database connection
 
@@ -29,6 +42,20 @@ def get_db_connection():
     database = config["database"]
     verify_ssl = parse_ssl_verify(config["verify_ssl"])
 
+    if not reuse:
+        return _connect(endpoint, username, password, database, verify_ssl)
+
+    key = (endpoint, username, password, database, verify_ssl)
+    with _connections_lock:
+        if key not in _connections:
+            _connections[key] = _connect(
+                endpoint, username, password, database, verify_ssl
+            )
+        return _connections[key]
+
+
+def _connect(endpoint, username, password, database, verify_ssl):
+    """Open a client, verify credentials and return the target database."""
     # Initialize ArangoDB client
     client = ArangoClient(hosts=endpoint)
 
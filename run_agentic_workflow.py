@@ -19,16 +19,22 @@ from dotenv import load_dotenv
 # Load environment
 load_dotenv()
 
+# Snapshot the connection settings once after .env is loaded
+_ENV_KEYS = ("ARANGO_ENDPOINT", "ARANGO_DATABASE", "ARANGO_USER", "ARANGO_PASSWORD")
+_ENV = {key: os.getenv(key) for key in _ENV_KEYS}
+
 from graph_analytics_ai.ai.workflow.orchestrator import WorkflowOrchestrator
 
+_BANNER = "=" * 70
+
 def main():
-    print("\n" + "="*70)
+    print(f"\n{_BANNER}")
     print("GRAPH ANALYTICS AI - WORKFLOW EXAMPLE")
-    print("="*70)
+    print(_BANNER)
     
     # Configuration - using example e-commerce use case
     use_case_file = "examples/use_case_document.md"
-    database_name = os.getenv("ARANGO_DATABASE", "graph-analytics-ai")
+    database_name = _ENV["ARANGO_DATABASE"] or "graph-analytics-ai"
     output_dir = "./workflow_output"
     
     # Verify use case file
@@ -37,9 +43,9 @@ def main():
         return 1
     
     # Get database credentials from environment
-    db_endpoint = os.getenv("ARANGO_ENDPOINT")
-    db_user = os.getenv("ARANGO_USER", "root")
-    db_password = os.getenv("ARANGO_PASSWORD")
+    db_endpoint = _ENV["ARANGO_ENDPOINT"]
+    db_user = _ENV["ARANGO_USER"] or "root"
+    db_password = _ENV["ARANGO_PASSWORD"]
     
     if not db_endpoint or not db_password:
         print("\n✗ Error: Database credentials not found in .env")
@@ -52,9 +58,9 @@ def main():
     print(f"   Endpoint: {db_endpoint}")
     print(f"   Output: {output_dir}")
     
-    print(f"\n{'='*70}")
+    print(f"\n{_BANNER}")
     print("INITIALIZING AGENTIC WORKFLOW ORCHESTRATOR")
-    print("="*70)
+    print(_BANNER)
     
     try:
         # Initialize orchestrator with LLM provider
@@ -72,9 +78,9 @@ def main():
         traceback.print_exc()
         return 1
     
-    print(f"\n{'='*70}")
+    print(f"\n{_BANNER}")
     print("RUNNING COMPLETE WORKFLOW")
-    print("="*70)
+    print(_BANNER)
     print("\nThe workflow will:")
     print("  1. Parse business use cases (LLM)")
     print("  2. Extract requirements (LLM)")
@@ -83,7 +89,7 @@ def main():
     print("  5. Generate Product Requirements Document (LLM)")
     print("  6. Generate use cases from requirements (LLM)")
     print("  7. Save all outputs")
-    print(f"\n{'='*70}\n")
+    print(f"\n{_BANNER}\n")
     
     try:
         # Run the complete workflow
@@ -98,9 +104,9 @@ def main():
         )
         
         # Display results
-        print(f"\n{'='*70}")
+        print(f"\n{_BANNER}")
         print("WORKFLOW RESULTS")
-        print("="*70)
+        print(_BANNER)
         
         print(f"\n📊 Status: {result.status}")
         print(f"   Workflow ID: {result.workflow_id}")
@@ -136,24 +142,24 @@ def main():
         
         # Success determination
         if result.status.value == 'completed':
-            print(f"\n{'='*70}")
+            print(f"\n{_BANNER}")
             print("✅ WORKFLOW COMPLETED SUCCESSFULLY!")
-            print("="*70)
+            print(_BANNER)
             print("\nNext Steps:")
             print(f"  1. Review generated artifacts in: {output_dir}/")
             print("  2. Templates will be in use cases output")
             print("  3. Use AnalysisExecutor to run the templates on GAE")
             return 0
         else:
-            print(f"\n{'='*70}")
+            print(f"\n{_BANNER}")
             print("⚠️  WORKFLOW INCOMPLETE")
-            print("="*70)
+            print(_BANNER)
             return 1
             
     except Exception as e:
-        print(f"\n{'='*70}")
+        print(f"\n{_BANNER}")
         print("✗ WORKFLOW FAILED")
-        print("="*70)
+        print(_BANNER)
         print(f"\nError: {e}")
         import traceback
         traceback.print_exc()
@@ -4,6 +4,8 @@ Tests for catalog integration with workflows.
 Tests automatic tracking in traditional, agentic, and parallel workflows.
 """
 
+import time
+
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, MagicMock, patch
@@ -213,6 +215,85 @@ class TestCatalogIntegration:
         # Should track all 3
         assert mock_catalog.track_execution.call_count == 3
 
+    @patch("graph_analytics_ai.ai.execution.executor.CATALOG_AVAILABLE", True)
+    def test_parallel_batch_execution_runs_sequentially(
+        self, mock_catalog, mock_orchestrator, sample_template
+    ):
+        """Test parallel=True still runs one analysis at a time and tracks all."""
+        running = []
+        overlapped = []
+        analysis_result = mock_orchestrator.run_analysis.return_value
+
+        def run_analysis(config):
+            overlapped.append(bool(running))
+            running.append(config)
+            time.sleep(0.01)
+            running.pop()
+            return analysis_result
+
+        mock_orchestrator.run_analysis.side_effect = run_analysis
+        executor = AnalysisExecutor(
+            orchestrator=mock_orchestrator, catalog=mock_catalog, auto_track=True
+        )
+
+        templates = [sample_template, sample_template, sample_template]
+
+        results = executor.execute_batch(templates, parallel=True)
+
+        assert len(results) == 3
+        assert all(r.success for r in results)
+        assert overlapped == [False, False, False]
+        assert mock_catalog.track_execution.call_count == 3
+
+    def test_cached_results_skip_resubmission(self, mock_orchestrator, sample_template):
+        """Test identical templates are served from the result cache."""
+        executor = AnalysisExecutor(
+            config=ExecutionConfig(cache_results=True),
+            orchestrator=mock_orchestrator,
+        )
+
+        first = executor.execute_template(sample_template)
+        second = executor.execute_template(sample_template)
+
+        assert first.success
+        assert second.success
+        assert second.job.job_id == first.job.job_id
+        assert mock_orchestrator.run_analysis.call_count == 1
+
+        # Cache hits are copies, so callers cannot change each other's results
+        assert second is not first
+        second.job.error_message = "changed by caller"
+        assert executor.execute_template(sample_template).job.error_message is None
+
+        executor.clear_cache()
+        executor.execute_template(sample_template)
+        assert mock_orchestrator.run_analysis.call_count == 2
+
+    @patch("graph_analytics_ai.db_connection.get_db_connection")
+    def test_result_collection_reuses_connection(
+        self, mock_get_db, mock_orchestrator, sample_template
+    ):
+        """Test one database connection serves every collected job."""
+        mock_get_db.return_value.has_collection.return_value = False
+        executor = AnalysisExecutor(orchestrator=mock_orchestrator)
+
+        executor.execute_batch([sample_template, sample_template])
+
+        assert mock_get_db.call_count == 1
+
+    def test_submit_template_returns_future(self, mock_orchestrator, sample_template):
+        """Test templates can be dispatched in the background."""
+        executor = AnalysisExecutor(orchestrator=mock_orchestrator)
+
+        try:
+            futures = [executor.submit_template(sample_template) for _ in range(2)]
+            results = [f.result(timeout=10) for f in futures]
+        finally:
+            executor.shutdown()
+
+        assert all(r.success for r in results)
+        assert mock_orchestrator.run_analysis.call_count == 2
+
     def test_executor_with_custom_workflow_mode(
         self, mock_catalog, mock_orchestrator, sample_template
     ):
@@ -120,6 +120,38 @@ class TestGetDBConnection:
             assert "secretpassword" not in str(exc_info.value)
             assert "***MASKED***" in str(exc_info.value)
 
+    @patch("graph_analytics_ai.db_connection._connections", {})
+    @patch("graph_analytics_ai.db_connection.ArangoClient")
+    @patch("graph_analytics_ai.db_connection.get_arango_config")
+    def test_reuse_returns_cached_connection(
+        self, mock_get_config, mock_client_class, mock_env_amp
+    ):
+        """Test that reuse=True connects and verifies only once per settings."""
+        mock_get_config.return_value = {
+            "endpoint": "https://test:8529",
+            "user": "testuser",
+            "password": "testpass",
+            "database": "testdb",
+            "verify_ssl": "true",
+        }
+
+        mock_client = MagicMock()
+        mock_sys_db = MagicMock()
+        mock_sys_db.databases.return_value = ["_system", "testdb"]
+        mock_client.db.return_value = mock_sys_db
+        mock_client_class.return_value = mock_client
+
+        first = get_db_connection(reuse=True)
+        second = get_db_connection(reuse=True)
+
+        assert first is second
+        mock_client_class.assert_called_once()
+        mock_sys_db.version.assert_called_once()
+
+        # Without reuse a fresh connection is still opened
+        get_db_connection()
+        assert mock_client_class.call_count == 2
+
 
 class TestGetConnectionInfo:
     """Tests for get_connection_info function."""
@@ -27,3 +27,11 @@ class TestAgentBase:
         from graph_analytics_ai.ai.agents.base import handle_agent_errors
 
         assert handle_agent_errors is not None
+
+    def test_package_exports_resolve_lazily(self):
+        """Test that package-level names resolve to the defining module's objects."""
+        import graph_analytics_ai.ai.agents as agents
+        from graph_analytics_ai.ai.agents.runner import AgenticWorkflowRunner
+
+        assert agents.AgenticWorkflowRunner is AgenticWorkflowRunner
+        assert set(agents.__all__) <= set(dir(agents))
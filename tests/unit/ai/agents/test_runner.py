@@ -0,0 +1,193 @@
+"""Tests for agentic workflow runner exports."""
+
+import json
+import tarfile
+from datetime import datetime
+from unittest.mock import Mock
+
+from graph_analytics_ai.ai import json_utils
+from graph_analytics_ai.ai.agents.base import AgentMessage, AgentState
+from graph_analytics_ai.ai.agents.runner import AgenticWorkflowRunner, _serialize_report
+from graph_analytics_ai.ai.reporting.models import (
+    AnalysisReport,
+    Insight,
+    InsightType,
+    Recommendation,
+    RecommendationType,
+)
+
+
+def _make_report(title: str = "PageRank Analysis: Top Nodes") -> AnalysisReport:
+    return AnalysisReport(
+        title=title,
+        summary="Influential customers identified.",
+        generated_at=datetime(2025, 1, 1, 12, 0, 0),
+        algorithm="pagerank",
+        insights=[
+            Insight(
+                title="Hub customers",
+                description="A few customers dominate influence.",
+                insight_type=InsightType.KEY_FINDING,
+                confidence=0.85,
+                business_impact="Target for loyalty program",
+            )
+        ],
+        recommendations=[
+            Recommendation(
+                title="Engage hubs",
+                description="Reach out to top customers.",
+                recommendation_type=RecommendationType.ACTION,
+                priority="high",
+                expected_impact="10% revenue lift",
+            )
+        ],
+    )
+
+
+class TestSerializeReport:
+    """Tests for markdown report rendering."""
+
+    def test_filename_from_title(self):
+        filename, _ = _serialize_report(_make_report(), 3)
+
+        assert filename == "report_03_pagerank_analysis__top_nodes.md"
+
+    def test_markdown_sections(self):
+        _, text = _serialize_report(_make_report(), 1)
+
+        assert text.startswith("# PageRank Analysis: Top Nodes\n\n")
+        assert "## Insights (1)" in text
+        assert "- **Confidence:** 85%" in text
+        assert "- **Business Impact:** Target for loyalty program" in text
+        assert "## Recommendations (1)" in text
+        assert "- **Priority:** high" in text
+        assert "- **Expected Impact:** 10% revenue lift" in text
+
+
+class TestExportReports:
+    """Tests for AgenticWorkflowRunner.export_reports."""
+
+    def test_writes_one_file_per_report(self, tmp_path):
+        runner = Mock(spec=AgenticWorkflowRunner)
+        state = AgentState(reports=[_make_report("First"), _make_report("Second")])
+
+        AgenticWorkflowRunner.export_reports(runner, state, str(tmp_path))
+
+        files = sorted(p.name for p in tmp_path.iterdir())
+        assert files == ["report_01_first.md", "report_02_second.md"]
+        assert (tmp_path / "report_02_second.md").read_text().startswith("# Second")
+
+    def test_no_reports(self, tmp_path):
+        runner = Mock(spec=AgenticWorkflowRunner)
+
+        AgenticWorkflowRunner.export_reports(runner, AgentState(), str(tmp_path))
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestExportReportsArchive:
+    """Tests for AgenticWorkflowRunner.export_reports_archive."""
+
+    def test_archive_matches_file_export(self, tmp_path):
+        runner = Mock(spec=AgenticWorkflowRunner)
+        state = AgentState(reports=[_make_report("First"), _make_report("Second")])
+        archive = tmp_path / "reports.tar"
+
+        AgenticWorkflowRunner.export_reports_archive(runner, state, str(archive))
+
+        with tarfile.open(archive) as tar:
+            assert tar.getnames() == ["report_01_first.md", "report_02_second.md"]
+            text = tar.extractfile("report_02_second.md").read().decode("utf-8")
+        assert text == _serialize_report(state.reports[1], 2)[1]
+
+    def test_no_reports(self, tmp_path):
+        runner = Mock(spec=AgenticWorkflowRunner)
+        archive = tmp_path / "reports.tar"
+
+        AgenticWorkflowRunner.export_reports_archive(runner, AgentState(), str(archive))
+
+        assert not archive.exists()
+
+
+class TestExportState:
+    """Tests for AgenticWorkflowRunner.export_state."""
+
+    def _export(self, tmp_path):
+        runner = Mock(spec=AgenticWorkflowRunner)
+        state = AgentState(reports=[_make_report("Café Network")])
+        path = tmp_path / "state.json"
+
+        AgenticWorkflowRunner.export_state(runner, state, str(path))
+
+        return path
+
+    def test_writes_readable_json(self, tmp_path):
+        path = self._export(tmp_path)
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["reports_count"] == 1
+        assert data["reports"][0]["title"] == "Café Network"
+        assert "Café" in path.read_text(encoding="utf-8")
+
+    def test_stdlib_fallback(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+
+        path = self._export(tmp_path)
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["reports"][0]["title"] == "Café Network"
+
+
+class TestExportStateNdjson:
+    """Tests for AgenticWorkflowRunner.export_state_ndjson."""
+
+    def _export(self, tmp_path):
+        runner = Mock(spec=AgenticWorkflowRunner)
+        state = AgentState(reports=[_make_report("Café Network")])
+        state.add_message(
+            AgentMessage(
+                from_agent="Orchestrator",
+                to_agent="SchemaAnalyst",
+                message_type="task",
+                content={"action": "analyze"},
+            )
+        )
+        state.add_message(
+            AgentMessage(
+                from_agent="SchemaAnalyst",
+                to_agent="Orchestrator",
+                message_type="result",
+                content={"collections": 3},
+            )
+        )
+
+        AgenticWorkflowRunner.export_state_ndjson(runner, state, str(tmp_path))
+
+        return state
+
+    def test_writes_split_files(self, tmp_path):
+        self._export(tmp_path)
+
+        workflow = json.loads((tmp_path / "workflow.json").read_text(encoding="utf-8"))
+        results = json.loads((tmp_path / "results.json").read_text(encoding="utf-8"))
+        assert workflow["messages_count"] == 2
+        assert "reports" not in workflow
+        assert results["reports"][0]["title"] == "Café Network"
+
+    def test_messages_one_per_line(self, tmp_path):
+        self._export(tmp_path)
+
+        lines = (tmp_path / "messages.ndjson").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["content"] == {"collections": 3}
+
+    def test_iter_exported_messages(self, tmp_path):
+        state = self._export(tmp_path)
+
+        messages = list(
+            AgenticWorkflowRunner.iter_exported_messages(
+                str(tmp_path / "messages.ndjson")
+            )
+        )
+
+        assert messages == [msg.to_dict() for msg in state.messages]
@@ -0,0 +1,23 @@
+"""Tests for specialized agents."""
+
+from unittest.mock import Mock
+
+from graph_analytics_ai.ai.agents.specialized import SchemaAnalysisAgent
+from graph_analytics_ai.ai.llm import NullLLMProvider
+
+
+class TestSchemaAnalysisAgent:
+    """Tests for SchemaAnalysisAgent construction."""
+
+    def test_schema_cache_disabled_by_default(self):
+        agent = SchemaAnalysisAgent(NullLLMProvider(), Mock())
+
+        assert agent.extractor.use_cache is False
+
+    def test_schema_cache_dir_enables_cache(self, tmp_path):
+        agent = SchemaAnalysisAgent(
+            NullLLMProvider(), Mock(), schema_cache_dir=str(tmp_path)
+        )
+
+        assert agent.extractor.use_cache is True
+        assert agent.extractor.cache_dir == tmp_path
@@ -0,0 +1,114 @@
+"""
+Unit tests for the on-disk LLM response cache.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from graph_analytics_ai.ai.llm import CachingLLMProvider, LLMConfig, LLMResponse
+
+
+@pytest.fixture
+def inner_provider():
+    """Create a mock provider that counts calls."""
+    provider = Mock()
+    provider.config = LLMConfig(api_key="test", model="test-model")
+    provider.name = "mock"
+    provider.generate.side_effect = lambda prompt, **kw: LLMResponse(
+        content=f"answer to {prompt}", total_tokens=7
+    )
+    provider.generate_structured.return_value = {"domain": "retail"}
+    return provider
+
+
+class TestCachingLLMProvider:
+    """Test caching wrapper behavior."""
+
+    def test_generate_hits_cache_on_repeat(self, inner_provider, tmp_path):
+        cached = CachingLLMProvider(inner_provider, cache_dir=str(tmp_path))
+
+        first = cached.generate("q1")
+        second = cached.generate("q1")
+
+        assert inner_provider.generate.call_count == 1
+        assert second.content == first.content == "answer to q1"
+        assert second.total_tokens == 7
+        assert (cached.hits, cached.misses) == (1, 1)
+
+    def test_distinct_prompts_miss(self, inner_provider, tmp_path):
+        cached = CachingLLMProvider(inner_provider, cache_dir=str(tmp_path))
+
+        cached.generate("q1")
+        cached.generate("q2")
+
+        assert inner_provider.generate.call_count == 2
+
+    def test_cache_shared_across_instances_in_namespace(self, inner_provider, tmp_path):
+        CachingLLMProvider(
+            inner_provider, cache_dir=str(tmp_path), namespace="SchemaAnalyst"
+        ).generate("q1")
+        CachingLLMProvider(
+            inner_provider, cache_dir=str(tmp_path), namespace="SchemaAnalyst"
+        ).generate("q1")
+        CachingLLMProvider(
+            inner_provider, cache_dir=str(tmp_path), namespace="Other"
+        ).generate("q1")
+
+        assert inner_provider.generate.call_count == 2
+        assert len(list((tmp_path / "SchemaAnalyst").glob("*.json"))) == 1
+
+    def test_structured_output_cached(self, inner_provider, tmp_path):
+        cached = CachingLLMProvider(inner_provider, cache_dir=str(tmp_path))
+        schema = {"type": "object"}
+
+        assert cached.generate_structured("q", schema) == {"domain": "retail"}
+        assert cached.generate_structured("q", schema) == {"domain": "retail"}
+        assert inner_provider.generate_structured.call_count == 1
+
+    def test_repeat_served_from_memory(self, inner_provider, tmp_path):
+        cached = CachingLLMProvider(inner_provider, cache_dir=str(tmp_path))
+        cached.generate("q1")
+        for path in (tmp_path / "default").glob("*.json"):
+            path.unlink()
+
+        assert cached.generate("q1").content == "answer to q1"
+        assert inner_provider.generate.call_count == 1
+
+    def test_concurrent_misses_write_same_entry(self, inner_provider, tmp_path):
+        providers = [
+            CachingLLMProvider(inner_provider, cache_dir=str(tmp_path))
+            for _ in range(8)
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(pool.map(lambda p: p.generate("q1"), providers))
+
+        assert all(r.content == "answer to q1" for r in responses)
+        assert [p.name for p in (tmp_path / "default").iterdir()] == [
+            next((tmp_path / "default").glob("*.json")).name
+        ]
+
+    def test_unwritable_cache_dir_is_ignored(self, inner_provider, tmp_path):
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory")
+        cached = CachingLLMProvider(inner_provider, cache_dir=str(blocker))
+
+        assert cached.generate("q1").content == "answer to q1"
+
+    def test_async_generate_uses_cache(self, inner_provider, tmp_path):
+        cached = CachingLLMProvider(inner_provider, cache_dir=str(tmp_path))
+        cached.generate("q1")
+
+        response = asyncio.run(cached.generate_async("q1"))
+
+        assert response.content == "answer to q1"
+        inner_provider.generate_async.assert_not_called()
+
+    def test_delegates_name(self, inner_provider, tmp_path):
+        cached = CachingLLMProvider(inner_provider, cache_dir=str(tmp_path))
+
+        assert cached.name == "mock"
+        assert cached.model_name == "test-model"
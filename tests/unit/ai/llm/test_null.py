@@ -0,0 +1,20 @@
+"""
+Unit tests for the no-op LLM provider.
+"""
+
+from graph_analytics_ai.ai.llm import LLMProvider, NullLLMProvider
+
+
+class TestNullLLMProvider:
+    """Test null provider behavior."""
+
+    def test_is_llm_provider(self):
+        assert isinstance(NullLLMProvider(), LLMProvider)
+
+    def test_returns_empty_output(self):
+        provider = NullLLMProvider()
+
+        assert provider.generate("prompt").content == ""
+        assert provider.chat([{"role": "user", "content": "hi"}]).content == ""
+        assert provider.generate_structured("prompt", {"type": "object"}) == {}
+        assert provider.estimate_cost(100, 100) == 0.0
@@ -4,6 +4,8 @@ Unit tests for OpenRouter LLM provider.
 Tests the OpenRouter provider implementation with mocked HTTP responses.
 """
 
+import json
+
 import pytest
 import responses
 
@@ -267,6 +269,61 @@ class TestOpenRouterProvider:
         assert provider.model_name == "google/gemini-2.5-flash"
 
 
+class TestPromptCaching:
+    """Test system prompt handling and provider-side prompt caching."""
+
+    def _add_ok_response(self):
+        responses.add(
+            responses.POST,
+            "https://openrouter.ai/api/v1/chat/completions",
+            json={"choices": [{"message": {"content": "ok"}}], "usage": {}},
+            status=200,
+        )
+
+    @responses.activate
+    def test_system_prompt_sent_as_system_message(self, provider):
+        """Test that system_prompt becomes a separate system message."""
+        self._add_ok_response()
+
+        provider.generate("Task", system_prompt="You are an expert.")
+
+        body = json.loads(responses.calls[0].request.body)
+        assert body["messages"] == [
+            {"role": "system", "content": "You are an expert."},
+            {"role": "user", "content": "Task"},
+        ]
+        assert "system_prompt" not in body
+
+    @responses.activate
+    def test_anthropic_system_prompt_marked_cacheable(self):
+        """Test that Anthropic models get a cache_control breakpoint."""
+        self._add_ok_response()
+        provider = OpenRouterProvider(
+            LLMConfig(api_key="test-api-key", model="anthropic/claude-3.5-sonnet")
+        )
+
+        provider.generate("Task", system_prompt="You are an expert.")
+
+        system = json.loads(responses.calls[0].request.body)["messages"][0]
+        assert system["content"] == [
+            {
+                "type": "text",
+                "text": "You are an expert.",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+    @responses.activate
+    def test_no_system_prompt_sends_single_user_message(self, provider):
+        """Test the default single-message request shape."""
+        self._add_ok_response()
+
+        provider.generate("Task")
+
+        body = json.loads(responses.calls[0].request.body)
+        assert body["messages"] == [{"role": "user", "content": "Task"}]
+
+
 class TestLLMResponse:
     """Test LLMResponse dataclass."""
 
@@ -0,0 +1,38 @@
+"""Tests for chart generator."""
+
+import pytest
+
+from graph_analytics_ai.ai.reporting.chart_generator import (
+    ChartGenerator,
+    is_plotly_available,
+)
+
+pytestmark = pytest.mark.skipif(
+    not is_plotly_available(), reason="plotly not installed"
+)
+
+
+class TestWccCharts:
+    """Tests for WCC chart generation."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.generator = ChartGenerator()
+        self.results = [
+            {"_key": f"Device/{i}", "component": f"C{i % 7 if i < 70 else i}"}
+            for i in range(100)
+        ]
+
+    def test_charts_are_embeddable_fragments(self):
+        """Test charts are div fragments, not standalone HTML documents."""
+        charts = self.generator.generate_wcc_charts(self.results)
+
+        assert set(charts) == {"top_components", "size_distribution", "connectivity"}
+        for chart_html in charts.values():
+            assert "<html" not in chart_html
+            assert "<body" not in chart_html
+            assert 'class="plotly-graph-div"' in chart_html
+
+    def test_no_component_field(self):
+        """Test results without component data produce no charts."""
+        assert self.generator.generate_wcc_charts([{"_key": "a"}]) == {}
@@ -4,7 +4,12 @@ import pytest
 from datetime import datetime
 from unittest.mock import Mock, MagicMock
 from graph_analytics_ai.ai.reporting.generator import ReportGenerator
-from graph_analytics_ai.ai.reporting.models import Insight, InsightType
+from graph_analytics_ai.ai.reporting.models import (
+    AnalysisReport,
+    Insight,
+    InsightType,
+    ReportFormat,
+)
 from graph_analytics_ai.ai.execution.models import ExecutionResult, AnalysisJob, ExecutionStatus
 
 
@@ -338,3 +343,113 @@ Looking at the data, I observe that the top 5 nodes have significantly higher sc
         
         assert len(insights) >= 1
         assert insights[0].title == "Top 5 Control 80% of Influence"
+
+
+class TestBatchReport:
+    """Tests for batched LLM interpretation in batch reports."""
+
+    def _result(self, name):
+        job = AnalysisJob(
+            job_id=f"job-{name}",
+            template_name=name,
+            algorithm="pagerank",
+            status=ExecutionStatus.COMPLETED,
+            submitted_at=datetime.now(),
+            execution_time_seconds=1.5,
+        )
+        return ExecutionResult(
+            job=job, success=True, results=[{"_key": "N1", "result": 0.5}]
+        )
+
+    def test_batch_report_issues_one_batched_llm_round(self):
+        """Test that batch reports prefetch all interpretations together."""
+        mock_llm = Mock()
+        mock_llm.generate_batch.return_value = [
+            Mock(content="- Title: First\n  Description: A.\n  Confidence: 0.9"),
+            Mock(content="- Title: Second\n  Description: B.\n  Confidence: 0.9"),
+        ]
+        generator = ReportGenerator(
+            llm_provider=mock_llm, use_llm_interpretation=True, enable_charts=False
+        )
+
+        generator.generate_batch_report([self._result("a"), self._result("b")])
+
+        mock_llm.generate_batch.assert_called_once()
+        assert len(mock_llm.generate_batch.call_args[0][0]) == 2
+        mock_llm.generate.assert_not_called()
+
+    def test_batch_failure_falls_back_per_report(self):
+        """Test that a failed batch falls back to individual LLM calls."""
+        mock_llm = Mock()
+        mock_llm.generate_batch.side_effect = RuntimeError("batch unavailable")
+        mock_llm.generate.return_value = Mock(content="unstructured")
+        generator = ReportGenerator(
+            llm_provider=mock_llm, use_llm_interpretation=True, enable_charts=False
+        )
+
+        generator.generate_batch_report([self._result("a"), self._result("b")])
+
+        assert mock_llm.generate.call_count >= 2
+
+    def test_generate_reports_keeps_order(self):
+        """Test concurrent report generation returns reports in input order."""
+        generator = ReportGenerator(
+            llm_provider=Mock(), use_llm_interpretation=False, enable_charts=False
+        )
+        results = [self._result(name) for name in ("a", "b", "c")]
+
+        reports = generator.generate_reports(results)
+
+        assert [r.title for r in reports] == [
+            "Analysis Report: a",
+            "Analysis Report: b",
+            "Analysis Report: c",
+        ]
+        assert generator.generate_reports([]) == []
+
+
+class TestFormatCache:
+    """Tests for memoized report formatting."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.generator = ReportGenerator(
+            llm_provider=Mock(), use_llm_interpretation=False, enable_charts=False
+        )
+        self.report = AnalysisReport(
+            title="PageRank Analysis",
+            summary="Top nodes identified.",
+            generated_at=datetime(2025, 1, 1),
+            algorithm="pagerank",
+        )
+
+    def test_repeat_format_served_from_cache(self):
+        """Test that formatting an unchanged report renders only once."""
+        first = self.generator.format_report(self.report, ReportFormat.MARKDOWN)
+        self.generator._format_markdown = Mock(side_effect=AssertionError)
+
+        assert self.generator.format_report(self.report, ReportFormat.MARKDOWN) == first
+
+    def test_changed_report_is_reformatted(self):
+        """Test that edits to a report invalidate its cached output."""
+        before = self.generator.format_report(self.report, ReportFormat.JSON)
+        self.report.summary = "Updated summary."
+
+        after = self.generator.format_report(self.report, ReportFormat.JSON)
+
+        assert after != before
+        assert "Updated summary." in after
+
+    def test_json_fallback_without_orjson(self, monkeypatch):
+        """Test JSON output parses the same with and without orjson."""
+        import json
+
+        from graph_analytics_ai.ai import json_utils
+
+        fast = json.loads(self.generator.format_report(self.report, ReportFormat.JSON))
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+        self.generator._format_cache.clear()
+
+        slow = json.loads(self.generator.format_report(self.report, ReportFormat.JSON))
+
+        assert fast == slow == self.report.to_dict()
@@ -0,0 +1,54 @@
+"""Tests for HTML report formatter."""
+
+from datetime import datetime
+
+from graph_analytics_ai.ai.reporting.html_formatter import HTMLReportFormatter
+from graph_analytics_ai.ai.reporting.models import (
+    AnalysisReport,
+    Insight,
+    InsightType,
+)
+
+
+def _make_report() -> AnalysisReport:
+    return AnalysisReport(
+        title="Household Analysis",
+        summary="Devices grouped into households.",
+        generated_at=datetime(2025, 1, 1, 12, 0, 0),
+        algorithm="wcc",
+        insights=[
+            Insight(
+                title="One dominant cluster",
+                description="Most devices share a component.",
+                insight_type=InsightType.KEY_FINDING,
+                confidence=0.9,
+            )
+        ],
+        metrics={"components": 4534},
+    )
+
+
+class TestWriteReport:
+    """Tests for HTMLReportFormatter.write_report."""
+
+    def test_matches_format_report(self, tmp_path):
+        """Test streamed file is identical to the in-memory document."""
+        formatter = HTMLReportFormatter()
+        report = _make_report()
+        charts = {"top": "<div>Top</div>", "dist": "<div>Dist – ✓</div>"}
+        path = tmp_path / "report.html"
+
+        formatter.write_report(report, str(path), charts=charts, include_raw_data=True)
+
+        expected = formatter.format_report(report, charts=charts, include_raw_data=True)
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_without_charts(self, tmp_path):
+        """Test report without charts is written the same way."""
+        formatter = HTMLReportFormatter()
+        report = _make_report()
+        path = tmp_path / "report.html"
+
+        formatter.write_report(report, str(path))
+
+        assert path.read_text(encoding="utf-8") == formatter.format_report(report)
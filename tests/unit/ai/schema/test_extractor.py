@@ -4,8 +4,10 @@ Unit tests for schema extractor.
 Tests schema extraction from ArangoDB databases.
 """
 
+from collections import OrderedDict
 from unittest.mock import Mock, patch
 
+from graph_analytics_ai.ai.schema import extractor as extractor_module
 from graph_analytics_ai.ai.schema.extractor import SchemaExtractor, create_extractor
 from graph_analytics_ai.ai.schema.models import CollectionType
 
@@ -246,3 +248,138 @@ class TestSchemaExtractorIntegration:
         # Verify graph names (no system graphs)
         assert "social_graph" in schema.graph_names
         assert "_system_graph" not in schema.graph_names
+
+    def test_extract_counts_collections_in_one_query(
+        self, mock_arango_db, sample_user_documents
+    ):
+        """Test document counts come from one batched query, not count()."""
+        counts = {"users": 120, "products": 45, "follows": 300}
+        mock_col = Mock()
+        mock_arango_db.collection.return_value = mock_col
+
+        def execute_aql(query, bind_vars):
+            if "names" in bind_vars:
+                return iter(
+                    {"name": name, "count": counts[name]} for name in bind_vars["names"]
+                )
+            return iter(sample_user_documents)
+
+        mock_arango_db.aql.execute.side_effect = execute_aql
+
+        schema = SchemaExtractor(mock_arango_db, sample_size=10).extract()
+
+        assert schema.vertex_collections["users"].document_count == 120
+        assert schema.edge_collections["follows"].document_count == 300
+        mock_col.count.assert_not_called()
+
+    def test_extract_uses_disk_cache(
+        self, mock_arango_db, sample_user_documents, tmp_path, monkeypatch
+    ):
+        """Test unchanged databases are served from the schema cache."""
+        monkeypatch.setattr(extractor_module, "_memory_cache", OrderedDict())
+        revisions = {"users": "1", "products": "1", "follows": "1"}
+
+        def get_collection(name):
+            mock_col = Mock()
+            mock_col.count.return_value = len(sample_user_documents)
+            mock_col.revision.side_effect = lambda: revisions[name]
+            return mock_col
+
+        mock_arango_db.collection.side_effect = get_collection
+        mock_arango_db.aql.execute.side_effect = lambda query, bind_vars: iter(
+            sample_user_documents
+        )
+
+        extractor = SchemaExtractor(
+            mock_arango_db, sample_size=10, use_cache=True, cache_dir=str(tmp_path)
+        )
+        first = extractor.extract()
+        calls = mock_arango_db.aql.execute.call_count
+
+        assert extractor.extract() == first
+        assert mock_arango_db.aql.execute.call_count == calls
+
+        # A write to any collection changes its revision and invalidates
+        revisions["users"] = "2"
+        extractor.extract()
+        assert mock_arango_db.aql.execute.call_count > calls
+
+    def test_extract_uses_memory_cache(
+        self, mock_arango_db, sample_user_documents, tmp_path, monkeypatch
+    ):
+        """Test a new extractor reuses a schema extracted earlier in-process."""
+        monkeypatch.setattr(extractor_module, "_memory_cache", OrderedDict())
+        mock_col = Mock()
+        mock_col.count.return_value = len(sample_user_documents)
+        mock_col.revision.return_value = "1"
+        mock_arango_db.collection.return_value = mock_col
+        mock_arango_db.aql.execute.side_effect = lambda query, bind_vars: iter(
+            sample_user_documents
+        )
+
+        first = SchemaExtractor(
+            mock_arango_db, use_cache=True, cache_dir=str(tmp_path / "a")
+        ).extract()
+        calls = mock_arango_db.aql.execute.call_count
+
+        # Different cache directory, so a hit can only come from memory
+        second = SchemaExtractor(
+            mock_arango_db, use_cache=True, cache_dir=str(tmp_path / "b")
+        ).extract()
+
+        assert second == first
+        assert second is not first
+        assert mock_arango_db.aql.execute.call_count == calls
+
+    def test_extract_cache_tracks_graphs_and_endpoint(
+        self, mock_arango_db, sample_user_documents, tmp_path, monkeypatch
+    ):
+        """Test new graphs or another server invalidate the cached schema."""
+        monkeypatch.setattr(extractor_module, "_memory_cache", OrderedDict())
+        mock_col = Mock()
+        mock_col.count.return_value = len(sample_user_documents)
+        mock_col.revision.return_value = "1"
+        mock_arango_db.collection.return_value = mock_col
+        mock_arango_db.aql.execute.side_effect = lambda query, bind_vars: iter(
+            sample_user_documents
+        )
+        mock_arango_db.conn._hosts = ["http://db-a:8529"]
+        extractor = SchemaExtractor(
+            mock_arango_db, use_cache=True, cache_dir=str(tmp_path)
+        )
+        extractor.extract()
+
+        mock_arango_db.graphs.return_value = [
+            {"name": "social_graph"},
+            {"name": "new_graph"},
+        ]
+        assert extractor.extract().graph_names == ["social_graph", "new_graph"]
+        calls = mock_arango_db.aql.execute.call_count
+
+        mock_arango_db.conn._hosts = ["http://db-b:8529"]
+        extractor.extract()
+        assert mock_arango_db.aql.execute.call_count > calls
+
+    def test_extract_skips_cache_without_revisions(
+        self, mock_arango_db, sample_user_documents, tmp_path, monkeypatch
+    ):
+        """Test schemas aren't cached when collection revisions are unknown."""
+        monkeypatch.setattr(extractor_module, "_memory_cache", OrderedDict())
+        mock_col = Mock()
+        mock_col.count.return_value = len(sample_user_documents)
+        mock_col.revision.side_effect = Exception("not supported")
+        mock_arango_db.collection.return_value = mock_col
+        mock_arango_db.aql.execute.side_effect = lambda query, bind_vars: iter(
+            sample_user_documents
+        )
+        extractor = SchemaExtractor(
+            mock_arango_db, use_cache=True, cache_dir=str(tmp_path)
+        )
+
+        extractor.extract()
+        calls = mock_arango_db.aql.execute.call_count
+        extractor.extract()
+
+        assert mock_arango_db.aql.execute.call_count == 2 * calls
+        assert not list(tmp_path.iterdir())
+        assert not extractor_module._memory_cache
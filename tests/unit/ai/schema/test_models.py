@@ -4,10 +4,13 @@ Unit tests for schema models.
 Tests the data models used to represent graph schema information.
 """
 
+import json
+
 from graph_analytics_ai.ai.schema.models import (
     AttributeInfo,
     CollectionSchema,
     CollectionType,
+    GraphSchema,
     Relationship,
     SchemaAnalysis,
 )
@@ -188,6 +191,12 @@ class TestGraphSchema:
 
         assert len(summary["relationships"]) == 2
 
+    def test_to_dict_round_trip(self, sample_graph_schema):
+        """Test full serialization restores an equal schema."""
+        data = json.loads(json.dumps(sample_graph_schema.to_dict()))
+
+        assert GraphSchema.from_dict(data) == sample_graph_schema
+
 
 class TestSchemaAnalysis:
     """Test SchemaAnalysis model."""
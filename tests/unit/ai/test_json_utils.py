@@ -0,0 +1,59 @@
+"""Tests for the shared JSON helpers."""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+import pytest
+
+from graph_analytics_ai.ai import json_utils
+from graph_analytics_ai.ai.json_utils import dumps_json, loads_json
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Point:
+    x: int
+    color: Color
+
+
+DATA = {
+    "name": "Café",
+    "when": datetime(2026, 1, 2, 3, 4, 5),
+    "ids": [1, 2],
+    "color": Color.RED,
+    "point": Point(1, Color.RED),
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_matches_across_encoders(monkeypatch, use_orjson):
+    """Test both encoders produce the same document."""
+    if use_orjson and not json_utils.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", use_orjson)
+
+    encoded = dumps_json(DATA, indent=True, sort_keys=True)
+
+    assert json.loads(encoded) == {
+        "color": "red",
+        "ids": [1, 2],
+        "name": "Café",
+        "point": {"x": 1, "color": "red"},
+        "when": "2026-01-02T03:04:05",
+    }
+    assert "Café" in encoded.decode("utf-8")
+    assert loads_json(encoded) == json.loads(encoded)
+
+
+def test_dumps_newline_terminated_record(monkeypatch):
+    """Test NDJSON records are compact and end with one newline."""
+    monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+
+    line = dumps_json({"a": 1}, newline=True)
+
+    assert line == b'{"a": 1}\n'
@@ -160,6 +160,65 @@ class TestWorkflowOrchestrator:
         assert len(result.completed_steps) == 7
         assert result.total_duration_seconds is not None
 
+    @patch("graph_analytics_ai.ai.workflow.orchestrator.WorkflowSteps")
+    def test_on_progress_callback_and_finished_event(
+        self, mock_steps_class, tmp_path, mock_llm_provider, mock_parsed_documents
+    ):
+        """Test progress is pushed on each transition and finished is set."""
+        mock_steps = Mock()
+        mock_steps.parse_documents = Mock(return_value=mock_parsed_documents)
+        mock_steps.extract_requirements = Mock(side_effect=Exception("LLM error"))
+        mock_steps_class.return_value = mock_steps
+
+        orchestrator = WorkflowOrchestrator(
+            output_dir=str(tmp_path),
+            llm_provider=mock_llm_provider,
+            enable_checkpoints=False,
+            max_retries=0,
+        )
+        updates = []
+
+        result = orchestrator.run_complete_workflow(
+            business_requirements=["test.txt"],
+            database_endpoint="http://localhost:8529",
+            database_name="test_db",
+            on_progress=updates.append,
+        )
+
+        assert result.status == WorkflowStatus.FAILED
+        assert orchestrator.finished.is_set()
+        assert updates[0]["current_step"] == "parse_documents"
+        assert updates[1]["completed_steps"] == 1
+        assert updates[-1]["status"] == "failed"
+
+    @patch("graph_analytics_ai.ai.workflow.orchestrator.WorkflowSteps")
+    def test_failing_progress_callback_does_not_retry_step(
+        self, mock_steps_class, tmp_path, mock_llm_provider, mock_parsed_documents
+    ):
+        """Test a raising progress callback neither fails nor retries a step."""
+        mock_steps = Mock()
+        mock_steps.parse_documents = Mock(return_value=mock_parsed_documents)
+        mock_steps.extract_requirements = Mock(side_effect=Exception("LLM error"))
+        mock_steps_class.return_value = mock_steps
+
+        orchestrator = WorkflowOrchestrator(
+            output_dir=str(tmp_path),
+            llm_provider=mock_llm_provider,
+            enable_checkpoints=False,
+            max_retries=2,
+        )
+
+        result = orchestrator.run_complete_workflow(
+            business_requirements=["test.txt"],
+            database_endpoint="http://localhost:8529",
+            database_name="test_db",
+            on_progress=Mock(side_effect=RuntimeError("UI closed")),
+        )
+
+        assert mock_steps.parse_documents.call_count == 1
+        assert result.completed_steps == ["parse_documents"]
+        assert "LLM error" in result.error_message
+
     @patch("graph_analytics_ai.ai.workflow.orchestrator.WorkflowSteps")
     def test_run_workflow_with_step_failure(
         self, mock_steps_class, tmp_path, mock_llm_provider, mock_parsed_documents
@@ -247,6 +306,30 @@ class TestWorkflowOrchestrator:
         assert loaded_state.workflow_id == orchestrator.state.workflow_id
         assert loaded_state.current_step == WorkflowStep.PARSE_DOCUMENTS
 
+    def test_checkpoint_index_tracks_latest_run(self, tmp_path, mock_llm_provider):
+        """Test that each run is indexed once and the newest run is latest."""
+        orchestrator = WorkflowOrchestrator(
+            output_dir=str(tmp_path),
+            llm_provider=mock_llm_provider,
+            enable_checkpoints=True,
+        )
+
+        workflow_ids = []
+        for _ in range(2):
+            orchestrator.state = orchestrator._create_new_state(
+                business_requirements=["test.txt"]
+            )
+            orchestrator._save_checkpoint()
+            orchestrator.state.mark_step_started(WorkflowStep.PARSE_DOCUMENTS)
+            orchestrator._save_checkpoint()
+            workflow_ids.append(orchestrator.state.workflow_id)
+
+        index_lines = (tmp_path / "_checkpoints.idx").read_text().splitlines()
+        assert [line.split("\t")[0] for line in index_lines] == workflow_ids
+        assert orchestrator.latest_checkpoint() == (
+            tmp_path / f"checkpoint_{workflow_ids[-1]}.json"
+        )
+
     def test_load_checkpoint_not_found(self, tmp_path, mock_llm_provider):
         """Test loading checkpoint when none exists."""
         orchestrator = WorkflowOrchestrator(